@@ -1,14 +1,30 @@
+import hashlib
+import json
 import platform
+import runpy
 import subprocess
 import sys
 import os
 from pathlib import Path
+from typing import Optional
+
+ENV_MANIFEST_NAME = ".env-manifest.json"
+_REEXEC_ENV_VAR = "FAST_YOUTRACK_REEXEC"
+CLI_COMMANDS = ("import", "log", "export")
 
 
 def main() -> None:
     system = platform.system()
     direct_mode = "--direct" in sys.argv
 
+    if "--stamp-env" in sys.argv:
+        check_tkinter(Path(__file__).parent.resolve() / "venv")
+        return
+
+    if len(sys.argv) > 1 and sys.argv[1] in CLI_COMMANDS:
+        run_cli_mode(sys.argv[1:])
+        return
+
     if system == "Windows":
         _run_windows()
         return
@@ -57,17 +73,87 @@ def check_setup() -> bool:
     return False
 
 
-def check_tkinter(venv_dir: Path) -> None:
+def _venv_python(venv_dir: Path) -> Path:
     python_path = venv_dir / "bin" / "python"
     if not python_path.exists():
         python_path = venv_dir / "Scripts" / "python.exe"
-    if not python_path.exists():
+    return python_path
+
+
+def _running_in_venv(venv_dir: Path) -> bool:
+    try:
+        return Path(sys.prefix).resolve() == venv_dir.resolve()
+    except OSError:
+        return False
+
+
+def _env_hash(venv_dir: Path) -> str:
+    """Hash of everything that decides the venv contents (requirements + base Python)."""
+    digest = hashlib.sha256()
+    project_root = venv_dir.parent
+    for name in (
+        "requirements.txt",
+        "requirements-base.txt",
+        "requirements-macos.txt",
+    ):
+        path = project_root / name
+        if path.exists():
+            digest.update(path.read_bytes())
+    pyvenv_cfg = venv_dir / "pyvenv.cfg"
+    if pyvenv_cfg.exists():
+        digest.update(pyvenv_cfg.read_bytes())
+    return digest.hexdigest()
+
+
+def _read_env_manifest(venv_dir: Path) -> Optional[dict]:
+    """Return the manifest if it was stamped for the current venv, else None."""
+    try:
+        with open(venv_dir / ENV_MANIFEST_NAME, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("env_hash") != _env_hash(venv_dir):
+        return None
+    return manifest
+
+
+def _write_env_manifest(venv_dir: Path, tkinter_ok: bool) -> None:
+    if not venv_dir.exists():
         return
+    manifest = {"env_hash": _env_hash(venv_dir), "tkinter_ok": tkinter_ok}
+    try:
+        with open(venv_dir / ENV_MANIFEST_NAME, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+    except OSError:
+        pass
+
+
+def _tkinter_available(venv_dir: Path, python_path: Path) -> bool:
+    if _running_in_venv(venv_dir):
+        try:
+            import tkinter  # noqa: F401
+        except ImportError:
+            return False
+        return True
 
     result = subprocess.run(
         [str(python_path), "-c", "import tkinter"], capture_output=True
     )
-    if result.returncode != 0:
+    return result.returncode == 0
+
+
+def check_tkinter(venv_dir: Path) -> None:
+    python_path = _venv_python(venv_dir)
+    if not python_path.exists():
+        return
+
+    manifest = _read_env_manifest(venv_dir)
+    if manifest and manifest.get("tkinter_ok"):
+        return
+
+    if _tkinter_available(venv_dir, python_path):
+        _write_env_manifest(venv_dir, tkinter_ok=True)
+    else:
         sysname = platform.system()
         print("\n❌ tkinter (Python Tk GUI) is NOT installed in your environment.")
         if sysname == "Linux":
@@ -104,7 +190,7 @@ def check_tkinter(venv_dir: Path) -> None:
 
 def run_direct_mode() -> None:
     """Run the application directly with setup."""
-    project_root = Path(__file__).parent
+    project_root = Path(__file__).parent.resolve()
     venv_dir = project_root / "venv"
     main_py = project_root / "src" / "main.py"
 
@@ -116,16 +202,88 @@ def run_direct_mode() -> None:
 
     check_tkinter(venv_dir)
 
-    python_path = venv_dir / "bin" / "python"
+    python_path = _venv_python(venv_dir)
     if not python_path.exists():
-        python_path = venv_dir / "Scripts" / "python.exe"
-    if python_path.exists():
-        args = [arg for arg in sys.argv[1:] if arg != "--direct"]
-        subprocess.run([str(python_path), str(main_py)] + args, cwd=str(project_root))
-    else:
         print(f"Error: Venv python not found: {python_path}")
         sys.exit(1)
 
+    args = [arg for arg in sys.argv[1:] if arg != "--direct"]
+
+    if _running_in_venv(venv_dir) or os.environ.get(_REEXEC_ENV_VAR):
+        _run_main_in_process(project_root, main_py, args)
+        return
+
+    if os.name == "posix":
+        # Replace this interpreter with the venv one; it re-enters here and
+        # runs the app in-process, so only one interpreter stays alive.
+        os.chdir(project_root)
+        os.environ[_REEXEC_ENV_VAR] = "1"
+        os.execv(
+            str(python_path),
+            [str(python_path), str(project_root / "run.py"), "--direct"] + args,
+        )
+
+    subprocess.run([str(python_path), str(main_py)] + args, cwd=str(project_root))
+
+
+def run_cli_mode(args: list) -> None:
+    """Run a headless command (see src/cli.py) with the venv python; no Tk checks."""
+    project_root = Path(__file__).parent.resolve()
+    venv_dir = project_root / "venv"
+    cli_py = project_root / "src" / "cli.py"
+    python_path = _venv_python(venv_dir)
+
+    if _running_in_venv(venv_dir) or not python_path.exists():
+        sys.path.insert(0, str(cli_py.parent))
+        sys.argv = [str(cli_py)] + args
+        runpy.run_path(str(cli_py), run_name="__main__")
+        return
+
+    if os.name == "posix":
+        os.execv(str(python_path), [str(python_path), str(cli_py)] + args)
+
+    sys.exit(subprocess.run([str(python_path), str(cli_py)] + args).returncode)
+
+
+def _run_main_in_process(project_root: Path, main_py: Path, args: list) -> None:
+    """Run src/main.py inside the current (venv) interpreter."""
+    os.chdir(project_root)
+
+    if platform.system() == "Linux" and len(args) < 2:
+        picked = _pick_subdomain_in_process(project_root)
+        if not picked:
+            print("Cancelled by user.")
+            return
+        args = list(picked) + args
+
+    sys.path.insert(0, str(main_py.parent))
+    sys.argv = [str(main_py)] + args
+    runpy.run_path(str(main_py), run_name="__main__")
+
+
+def _pick_subdomain_in_process(project_root: Path) -> Optional[tuple]:
+    """Show the Linux subdomain picker without spawning another interpreter.
+
+    Returns (passphrase, subdomain) and persists .key like run.sh does.
+    """
+    import importlib.util
+
+    picker_path = project_root / "scripts" / "linux" / "subdomain_picker.py"
+    spec = importlib.util.spec_from_file_location("subdomain_picker", picker_path)
+    picker_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(picker_module)
+
+    user_dir = project_root / "user"
+    result = picker_module.SubdomainPicker(user_dir).show_picker()
+    if not result:
+        return None
+
+    subdomain, passphrase = result
+    subdomain_dir = user_dir / subdomain
+    subdomain_dir.mkdir(parents=True, exist_ok=True)
+    (subdomain_dir / ".key").write_text(passphrase, encoding="utf-8")
+    return passphrase, subdomain
+
 
 def _run_windows() -> None:
     script_path = Path("scripts/win/run.bat")
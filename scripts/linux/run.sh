@@ -47,9 +47,10 @@ if [ -f "$PID_FILE" ]; then
     fi
 fi
 
-# Check for tkinter
-echo -e "${BLUE}Checking tkinter availability...${NC}"
-if ! venv/bin/python -c "import tkinter" 2>/dev/null; then
+# Check for tkinter. --stamp-env trusts venv/.env-manifest.json only while its
+# env_hash matches the requirements and base Python, so it is cheap on every
+# launch and probes again after a rebuild or Python upgrade
+if ! venv/bin/python run.py --stamp-env >/dev/null 2>&1; then
     echo -e "${RED}Error: tkinter is not available!${NC}"
     echo "tkinter is required for the GUI. Please install it:"
     echo ""
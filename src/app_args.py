@@ -1,10 +1,9 @@
 import sys
-import os
-from pathlib import Path
 
 from pydantic import BaseModel
 
 from errors.user_error import UserError
+from utils.user_paths import user_base_dir, youtrack_base_url
 
 
 class AppArgs(BaseModel):
@@ -14,23 +13,11 @@ class AppArgs(BaseModel):
 
     @property
     def base_url(self) -> str:
-        return f"https://{self.subdomain}.youtrack.cloud/api"
+        return youtrack_base_url(self.subdomain)
 
     @property
     def base_dir(self) -> str:
-        if getattr(sys, 'frozen', False):
-            exe_path = Path(sys.executable).resolve()
-            if sys.platform == "darwin":
-                try:
-                    project_root = exe_path.parents[3]
-                except IndexError:
-                    project_root = exe_path.parent
-            else:
-                project_root = exe_path.parent
-        else:
-            project_root = Path(__file__).parent.parent.absolute()
-
-        return str(project_root / "user" / self.subdomain)
+        return user_base_dir(self.subdomain)
 
     @classmethod
     def from_sys_args(cls) -> "AppArgs":
@@ -0,0 +1,280 @@
+"""
+Headless command line entry point.
+
+    python run.py import <subdomain> <timesheet.csv|.json|.jsonl> [options]
+    python run.py log <subdomain> <issue> <time> [description] [--type NAME]
+    python run.py export <subdomain> <out.csv|.parquet> --from DATE --to DATE
+
+Never imports Tk; errors are printed instead of shown in a dialog.
+"""
+
+# first, so its import time stands in for interpreter ready
+from utils import startup_timeline
+
+import argparse
+import logging
+import os
+import sys
+from typing import List, Optional
+
+from errors.user_error import UserError
+
+logger = logging.getLogger(__name__)
+
+# `log` runs from git hooks and editors: time from interpreter ready until the
+# request is sent (the network round trip is not counted)
+LOG_COLD_START_BUDGET_MS = 100
+GUI_MODULES = ("tkinter", "tkcalendar", "pystray", "PIL", "pyautogui")
+WORK_ITEM_TYPES_KEY = "work_item_types"
+
+
+def _add_account_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("subdomain", help="YouTrack Cloud subdomain")
+    parser.add_argument(
+        "--passphrase",
+        help="passphrase for the saved token (default: user/<subdomain>/.key)",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="fast-youtrack")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser(
+        "import", help="bulk-import a CSV/JSON timesheet as work items"
+    )
+    _add_account_arguments(import_parser)
+    import_parser.add_argument("file", help="timesheet (.csv, .json or .jsonl)")
+    import_parser.add_argument(
+        "--concurrency", type=int, default=4, help="parallel requests (default: 4)"
+    )
+    import_parser.add_argument(
+        "--dry-run", action="store_true", help="validate only; post nothing"
+    )
+    import_parser.add_argument(
+        "--date-format",
+        default="%Y-%m-%d",
+        help="strptime format of the date column (default: %%Y-%%m-%%d)",
+    )
+    import_parser.set_defaults(handler=run_import)
+
+    log_parser = commands.add_parser("log", help="log time on one issue")
+    _add_account_arguments(log_parser)
+    log_parser.add_argument("issue", help="issue ID, e.g. A-123")
+    log_parser.add_argument("time", help="time spent, e.g. 1h30m")
+    log_parser.add_argument("description", nargs="?", help="work item text")
+    log_parser.add_argument("--type", help="work item type name, e.g. Development")
+    log_parser.add_argument(
+        "--date", help="day of the work, YYYY-MM-DD (default: today)"
+    )
+    log_parser.add_argument(
+        "--timings", action="store_true", help="print cold-start timings"
+    )
+    log_parser.set_defaults(handler=run_log)
+
+    export_parser = commands.add_parser(
+        "export", help="stream work items in a date range to CSV or Parquet"
+    )
+    _add_account_arguments(export_parser)
+    export_parser.add_argument("file", help="output file (.csv or .parquet)")
+    export_parser.add_argument(
+        "--from", dest="start_date", required=True, help="first day, YYYY-MM-DD"
+    )
+    export_parser.add_argument(
+        "--to", dest="end_date", required=True, help="last day (inclusive), YYYY-MM-DD"
+    )
+    export_parser.add_argument(
+        "--author", help="only this user's items, e.g. 'me' (default: everyone visible)"
+    )
+    export_parser.add_argument("--query", help="YouTrack issue query to filter by")
+    export_parser.add_argument(
+        "--page-size", type=int, default=500, help="work items per request (default: 500)"
+    )
+    export_parser.set_defaults(handler=run_export)
+
+    return parser
+
+
+def _load_token_file_name(base_dir: str) -> str:
+    # Config only pulls in the pydantic view configs, never the widgets
+    from config import Config
+
+    return Config.load_config(base_dir=base_dir).token_file_name
+
+
+def run_import(options: argparse.Namespace) -> int:
+    from headless import create_headless_args, create_youtrack_service
+    from services.timesheet_importer import TimesheetImporter
+
+    args = create_headless_args(options.subdomain, options.passphrase)
+    youtrack_service = create_youtrack_service(
+        args, token_file_name=_load_token_file_name(args.base_dir)
+    )
+    importer = TimesheetImporter(
+        youtrack_service,
+        concurrency=options.concurrency,
+        dry_run=options.dry_run,
+        date_format=options.date_format,
+    )
+
+    def on_progress(report) -> None:
+        done = report.posted + report.failed
+        if done % 25 == 0:
+            print(f"  {done}/{report.valid} posted", file=sys.stderr)
+
+    report = importer.import_file(options.file, on_progress=on_progress)
+    print(report.format())
+    return 1 if report.invalid or report.failed else 0
+
+
+def run_log(options: argparse.Namespace) -> int:
+    # argparse, the stdlib and the token decryption only: pydantic and requests
+    # alone would spend the cold-start budget before the request is built
+    from datetime import datetime
+
+    from headless import create_urllib_client
+    from stores.config_store import ConfigStore
+    from stores.file_store import FileStore
+    from utils.user_paths import user_base_dir
+    from utils.youtrack import convert_time_to_minutes, id_valid, time_valid
+
+    startup_timeline.mark("imports_loaded")
+
+    issue_id = options.issue.upper()
+    if not id_valid(issue_id):
+        raise UserError(f"Invalid issue ID: {options.issue}")
+    if not time_valid(options.time):
+        raise UserError(f"Invalid time: {options.time} (e.g. 1h30m)")
+    try:
+        day = (
+            datetime.strptime(options.date, "%Y-%m-%d") if options.date else datetime.now()
+        )
+    except ValueError:
+        raise UserError(f"Invalid date: {options.date} (expected YYYY-MM-DD)")
+
+    base_dir = user_base_dir(options.subdomain)
+    log_dir = os.path.join(base_dir, "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    startup_timeline.configure(log_dir)
+
+    client = create_urllib_client(options.subdomain, options.passphrase)
+    startup_timeline.mark("services_ready")
+
+    # same body as AddSpentTimeRequest.model_dump(exclude_none=True)
+    body = {
+        "duration": {"minutes": int(convert_time_to_minutes(options.time))},
+        "date": int(day.timestamp() * 1000),
+    }
+    if options.description:
+        body["text"] = options.description
+    if options.type:
+        config_store = ConfigStore(store=FileStore(base_dir=base_dir))
+        body["type"] = {"id": _resolve_work_item_type(client, config_store, options.type)}
+
+    startup_timeline.mark("log_request_sent")
+    try:
+        client.request(
+            f"issues/{issue_id}/timeTracking/workItems",
+            method="post",
+            json_body=body,
+            params={"fields": "id"},
+        )
+    finally:
+        startup_timeline.mark("log_request_completed")
+        startup_timeline.flush()
+        _report_cold_start(options.timings)
+
+    print(f"Logged {options.time} on {issue_id}")
+    return 0
+
+
+def run_export(options: argparse.Namespace) -> int:
+    from datetime import datetime
+
+    from headless import create_headless_args, create_youtrack_service
+    from services.work_item_export import WorkItemExporter
+
+    for value in (options.start_date, options.end_date):
+        try:
+            datetime.strptime(value, "%Y-%m-%d")
+        except ValueError:
+            raise UserError(f"Invalid date: {value} (expected YYYY-MM-DD)")
+    export_format = "parquet" if options.file.lower().endswith(".parquet") else "csv"
+
+    args = create_headless_args(options.subdomain, options.passphrase)
+    youtrack_service = create_youtrack_service(
+        args, token_file_name=_load_token_file_name(args.base_dir)
+    )
+    exporter = WorkItemExporter(export_format)
+    pages = youtrack_service.iter_work_item_pages(
+        options.start_date,
+        options.end_date,
+        author=options.author,
+        query=options.query,
+        page_size=max(1, options.page_size),
+    )
+
+    def on_progress(report) -> None:
+        print(f"  {report.rows} work items", file=sys.stderr)
+
+    report = exporter.export(pages, options.file, on_progress=on_progress)
+    print(report.format())
+    return 0
+
+
+def _resolve_work_item_type(client, config_store, type_name: str) -> str:
+    """Type names are cached by name; the server is asked only on a miss."""
+    name = type_name.lower()
+    type_ids = config_store.read(WORK_ITEM_TYPES_KEY) or {}
+    if name not in type_ids:
+        type_ids = {
+            work_item_type["name"].lower(): work_item_type["id"]
+            for work_item_type in client.request(
+                "admin/timeTrackingSettings/workItemTypes", params={"fields": "id,name"}
+            )
+            or []
+            if work_item_type.get("name")
+        }
+        config_store.write(WORK_ITEM_TYPES_KEY, type_ids)
+    if name not in type_ids:
+        raise UserError(f"Unknown work item type: {type_name}")
+    return type_ids[name]
+
+
+def _report_cold_start(verbose: bool) -> None:
+    marks = startup_timeline.marks()
+    cold_start_ms = marks.get("log_request_sent")
+    gui_modules = [name for name in GUI_MODULES if name in sys.modules]
+    if gui_modules:
+        logger.warning(f"Headless log imported GUI modules: {', '.join(gui_modules)}")
+    if verbose:
+        for name, offset in marks.items():
+            print(f"  {name:<24}{offset:>8.1f} ms", file=sys.stderr)
+    if cold_start_ms is not None and cold_start_ms > LOG_COLD_START_BUDGET_MS:
+        logger.warning(
+            f"log cold start over budget: {cold_start_ms:.0f} ms > "
+            f"{LOG_COLD_START_BUDGET_MS} ms (run with --timings for a breakdown)"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    options = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    try:
+        return options.handler(options)
+    except UserError as e:
+        print(f"Error: {e.message}", file=sys.stderr)
+        return 2
+    except OSError as e:
+        # includes requests.RequestException: offline, DNS, timeouts
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
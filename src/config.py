@@ -10,6 +10,7 @@ from ui.views.base.custom_view_config import CustomViewConfig
 from ui.windows.add_spent_time.add_spent_time_window_config import (
     AddSpentTimeWindowConfig,
 )
+from ui.windows.time_report.time_report_window_config import TimeReportWindowConfig
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,7 @@ class Config(BaseModel):
     timer_view_config: CustomViewConfig = CustomViewConfig(
         width=300, height=40, position="top"
     )
+    time_report_config: TimeReportWindowConfig = TimeReportWindowConfig()
 
     def get_logging_level(self) -> int:
         import logging
@@ -60,7 +60,8 @@ link_query = (
     "project(id,ringId,name,shortName,iconUrl,template,pinned,archived,isDemo,hasArticles,team(@permittedGroups),"
     "fieldsSorted,restricted,plugins(timeTrackingSettings(id,enabled),helpDeskSettings(id,enabled,defaultForm(uuid,title)),"
     "vcsIntegrationSettings(hasVcsIntegrations),grazie(disabled))),visibility($type,implicitPermittedUsers(@permittedUsers),"
-    "permittedGroups(@permittedGroups),permittedUsers(@permittedUsers)),watchers(hasStar),id,idReadable,summary);"
+    "permittedGroups(@permittedGroups),permittedUsers(@permittedUsers)),watchers(hasStar),id,idReadable,summary,"
+    "updated);"
     "@permittedUsers:id,ringId,login,name,email,isEmailVerified,guest,fullName,avatarUrl,online,banned,banBadge,"
     "canReadProfile,isLocked,userType(id);@permittedGroups:id,name,ringId,allUsersGroup,icon,teamForProject(name,shortName);"
     "@textRange:startOffset,endOffset"
@@ -76,3 +77,19 @@ bundle_query = (
     "buildIntegration,"
     "buildLink"
 )
+
+work_item_query = (
+    "id,created,updated,date,text,"
+    "duration(minutes),"
+    "author(id,login),"
+    "type(id,name),"
+    "issue(id,idReadable,summary)"
+)
+
+work_item_export_query = (
+    "id,created,updated,date,text,"
+    "duration(minutes),"
+    "author(login,fullName),"
+    "type(name),"
+    "issue(idReadable,summary,project(shortName))"
+)
@@ -5,8 +5,13 @@ from ui.windows.add_spent_time.add_spent_time_controller import (
 from ui.windows.add_spent_time.add_spent_time_window import AddSpentTimeWindow
 from ui.views.issue_viewer.issue_viewer_view import IssueViewerView
 from ui.views.timer.timer_view import TimerView
+from ui.windows.time_report.time_report_window import TimeReportWindow
 from dependency_injector import containers, providers
 from services.youtrack_service import YouTrackService
+from services.issue_index import IssueIndex
+from services.task_executor import TaskExecutor
+from services.work_item_ledger import WorkItemLedger
+from services.work_item_outbox import WorkItemOutbox
 from stores.file_store import FileStore
 from services.bearer_token_service import BearerTokenService
 from security.encryption import EncryptionService
@@ -55,6 +60,31 @@ class Container(containers.DeclarativeContainer):
         store=store,
     )
 
+    task_executor: providers.Provider[TaskExecutor] = providers.Singleton(
+        TaskExecutor,
+        max_workers=3,
+    )
+
+    work_item_outbox: providers.Provider[WorkItemOutbox] = providers.Singleton(
+        WorkItemOutbox,
+        youtrack_service=youtrack_service,
+        task_executor=task_executor,
+        base_dir=args.provided.base_dir,
+        max_in_flight=2,
+    )
+
+    work_item_ledger: providers.Provider[WorkItemLedger] = providers.Singleton(
+        WorkItemLedger,
+        youtrack_service=youtrack_service,
+        base_dir=args.provided.base_dir,
+    )
+
+    issue_index: providers.Provider[IssueIndex] = providers.Singleton(
+        IssueIndex,
+        youtrack_service=youtrack_service,
+        base_dir=args.provided.base_dir,
+    )
+
     issue_view_factory: providers.Provider[IssueViewerView] = providers.Factory(
         IssueViewerView,
         config=config.provided.issue_view_config,
@@ -65,6 +95,11 @@ class Container(containers.DeclarativeContainer):
         config=config.provided.timer_view_config,
     )
 
+    time_report_window_factory: providers.Provider[TimeReportWindow] = providers.Factory(
+        TimeReportWindow,
+        config=config.provided.time_report_config,
+    )
+
     add_spent_time_config = providers.Factory(
         lambda config: config.add_spent_time_config.copy(),
         config,
@@ -80,4 +115,9 @@ class Container(containers.DeclarativeContainer):
         AddSpentTimeController,
         window=add_spent_time_window,
         youtrack_service=youtrack_service,
+        task_executor=task_executor,
+        work_item_outbox=work_item_outbox,
+        work_item_ledger=work_item_ledger,
+        issue_index=issue_index,
+        time_report_window_factory=time_report_window_factory.provider,
     )
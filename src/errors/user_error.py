@@ -1,10 +1,10 @@
-from ui.error_ui import display_error_dialog
-
-
 class UserError(Exception):
     def __init__(self, message):
         super().__init__(message)
         self.message = message
 
     def display(self):
+        # imported here so headless commands never load Tk
+        from ui.error_ui import display_error_dialog
+
         display_error_dialog(self.message)
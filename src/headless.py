@@ -0,0 +1,116 @@
+"""
+Service wiring for command-line use.
+
+Builds the YouTrack client stack by hand instead of through ``Container``,
+which would import every window. Nothing here loads Tk, and a missing token
+is reported as a UserError rather than prompted for. The derived key is
+cached next to the passphrase so each run skips the PBKDF2 rounds.
+
+`create_urllib_client` is the light variant for one-shot commands: it
+skips pydantic and requests, which take longer to import than the `log`
+cold-start budget allows.
+"""
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from errors.user_error import UserError
+from utils.user_paths import user_base_dir, youtrack_base_url
+
+if TYPE_CHECKING:
+    from app_args import AppArgs
+    from services.http.urllib_http_client import UrllibHttpClient
+    from services.youtrack_service import YouTrackService
+
+KEY_FILE_NAME = ".key"
+KEY_CACHE_FILE_NAME = ".derived_key"
+CONFIG_FILE_NAME = "config.json"
+DEFAULT_TOKEN_FILE_NAME = ".token"
+
+
+def read_passphrase(subdomain: str, passphrase: Optional[str] = None) -> str:
+    """*passphrase* if given, else the one in the subdomain's ``.key`` file."""
+    if passphrase:
+        return passphrase
+    key_path = Path(user_base_dir(subdomain)) / KEY_FILE_NAME
+    try:
+        stored_passphrase = key_path.read_text(encoding="utf-8").strip()
+    except OSError:
+        stored_passphrase = ""
+    if not stored_passphrase:
+        raise UserError(
+            f"No passphrase for '{subdomain}'. Pass --passphrase or launch the app once."
+        )
+    return stored_passphrase
+
+
+def read_token_file_name(base_dir: str) -> str:
+    """``token_file_name`` from config.json, read raw so Config stays unloaded."""
+    try:
+        with open(Path(base_dir) / CONFIG_FILE_NAME, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return DEFAULT_TOKEN_FILE_NAME
+    if not isinstance(data, dict):
+        return DEFAULT_TOKEN_FILE_NAME
+    return data.get("token_file_name") or DEFAULT_TOKEN_FILE_NAME
+
+
+def create_headless_args(subdomain: str, passphrase: Optional[str] = None) -> "AppArgs":
+    """AppArgs for *subdomain*, reading the passphrase from its ``.key`` file if not given."""
+    from app_args import AppArgs
+
+    return AppArgs(passphrase=read_passphrase(subdomain, passphrase), subdomain=subdomain)
+
+
+def _create_bearer_token_service(base_dir: str, passphrase: str, token_file_name: str):
+    from security.encryption import EncryptionService
+    from services.bearer_token_service import BearerTokenService
+    from stores.file_store import FileStore
+
+    return BearerTokenService(
+        store=FileStore(base_dir=base_dir),
+        encryption_service=EncryptionService(
+            passphrase=passphrase,
+            key_cache_path=str(Path(base_dir) / KEY_CACHE_FILE_NAME),
+        ),
+        token_file_name=token_file_name,
+        interactive=False,
+    )
+
+
+def create_youtrack_service(
+    args: "AppArgs", token_file_name: str = DEFAULT_TOKEN_FILE_NAME
+) -> "YouTrackService":
+    from services.http.youtrack_http_client import YouTrackHttpClient
+    from services.youtrack_service import YouTrackService
+    from stores.config_store import ConfigStore
+    from stores.file_store import FileStore
+
+    store = FileStore(base_dir=args.base_dir)
+    http_client = YouTrackHttpClient(
+        base_url=args.base_url,
+        bearer_token_service=_create_bearer_token_service(
+            args.base_dir, args.passphrase, token_file_name
+        ),
+        config_store=ConfigStore(store=store),
+    )
+    return YouTrackService(http_client=http_client, store=store)
+
+
+def create_urllib_client(
+    subdomain: str, passphrase: Optional[str] = None
+) -> "UrllibHttpClient":
+    from services.http.urllib_http_client import UrllibHttpClient
+
+    base_dir = user_base_dir(subdomain)
+    bearer_token_service = _create_bearer_token_service(
+        base_dir, read_passphrase(subdomain, passphrase), read_token_file_name(base_dir)
+    )
+    # non-interactive: prompting raises the "launch the app once" UserError
+    token = (
+        bearer_token_service.get_bearer_token()
+        or bearer_token_service.prompt_for_bearer_token()
+    )
+    return UrllibHttpClient(base_url=youtrack_base_url(subdomain), token=token)
@@ -5,6 +5,7 @@ from typing import Callable, Optional
 from config import Config
 from app_args import AppArgs
 from ui.windows.base.custom_window import CustomWindow
+from utils import display_probe_cache, startup_timeline
 
 
 _stop_hotkey: Optional[Callable[[], None]] = None
@@ -12,6 +13,9 @@ _stop_hotkey: Optional[Callable[[], None]] = None
 
 def initialize_infrastructure(args: AppArgs, config: Config) -> None:
     initialize_logging(args, config)
+    startup_timeline.configure(os.path.join(args.base_dir, "logs"))
+    startup_timeline.mark("logging_initialized")
+    display_probe_cache.configure(args.base_dir)
 
 
 def shutdown_infrastructure() -> None:
@@ -1,7 +1,9 @@
 import logging
 import sys
 from pathlib import Path
+from typing import Optional
 
+from utils import startup_timeline, wakeup_stats
 from dependency_injector.wiring import Provide
 
 from containers import Container
@@ -19,22 +21,25 @@ logger = logging.getLogger(__name__)
 
 
 def main(
+    splash: Optional[Splash] = None,
     add_spent_time_controller: AddSpentTimeController = Provide[
         Container.add_spent_time_controller
     ],
 ) -> None:
     logger.info("Starting FastYouTrack...")
+    if splash:
+        splash.close()
     add_spent_time_controller.add_spent_time()
 
 
 if __name__ == "__main__":
     splash = None
     try:
-        splash = Splash()
-        splash.show()
+        startup_timeline.mark("imports_loaded")
         args = AppArgs.from_sys_args()
         base_directory = Path(args.base_dir)
         config = Config.load_config(base_dir=base_directory)
+        startup_timeline.mark("config_loaded")
         initialize_infrastructure(args, config)
 
         container = Container()
@@ -42,15 +47,22 @@ if __name__ == "__main__":
         container.config.override(config)
         container.init_resources()
         container.wire(modules=[__name__])
-        if splash:
-            splash.close()
-        main()
+        startup_timeline.mark("container_wired")
+
+        # The main window is the only Tk root; the splash is a Toplevel drawn
+        # on it as soon as Tk is up, and covers building the window, its
+        # views and the services until the window is shown.
+        splash = Splash()
+        container.add_spent_time_window(on_root_created=splash.show)
+        main(splash)
     except UserCancelledError as e:
         if splash:
             splash.close()
         logger.info(f"Cancelled by user. {e}")
         sys.exit(0)
     except UserError as e:
+        if splash:
+            splash.close()
         try:
             e.display()
         except Exception:
@@ -62,5 +74,7 @@ if __name__ == "__main__":
         error_details = format_error_message(e)
         logger.error(error_details)
     finally:
+        startup_timeline.flush()
+        wakeup_stats.log_summary()
         cleanup_pids_folder()
         logging.shutdown()
@@ -1,6 +1,49 @@
-from typing import List
+import logging
+from functools import cached_property
+from typing import List, Union
+
+from pydantic import BaseModel, ValidationError
+
 from models.general_responses import Issue, Link
 
+logger = logging.getLogger(__name__)
+
 
 class CustomIssue(Issue):
     links: List[Link]
+
+    @classmethod
+    def partial(cls, record: Union[BaseModel, dict]) -> "CustomIssue":
+        """
+        Issue built from a record embedded in another response (a linked or
+        mentioned issue, a link page row). Only carries what the record has:
+        no description and no links.
+        """
+        data = record.model_dump(by_alias=True) if isinstance(record, BaseModel) else record
+        return cls.model_validate({**data, "links": []})
+
+    @cached_property
+    def embedded_issues(self) -> List["CustomIssue"]:
+        """Partial records of the linked and mentioned issues, once each."""
+        records: list = [linked for link in self.links for linked in link.trimmedIssues]
+        records += self.mentionedIssues or []
+        for comment in self.pinnedComments or []:
+            if isinstance(comment, dict):
+                records += comment.get("mentionedIssues") or []
+
+        issues: List[CustomIssue] = []
+        seen = {self.idReadable}
+        for record in records:
+            id_readable = (
+                record.get("idReadable")
+                if isinstance(record, dict)
+                else getattr(record, "idReadable", None)
+            )
+            if not id_readable or id_readable in seen:
+                continue
+            seen.add(id_readable)
+            try:
+                issues.append(self.partial(record))
+            except ValidationError as e:
+                logger.debug(f"Skipping embedded issue {id_readable}: {e}")
+        return issues
@@ -1,5 +1,5 @@
 import logging
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Union, Literal
 from datetime import datetime, UTC
 from pydantic import field_validator
@@ -24,6 +24,9 @@ YoutrackResponseField = Literal[
 
 
 class WorkItem(BaseModel):
+    # schemas are built on first use, so importing the models stays cheap
+    model_config = ConfigDict(defer_build=True)
+
     id: Optional[str] = None
     name: Optional[str] = None
     type_: Optional[str] = Field(None, alias="$type")
@@ -415,6 +418,7 @@ class LinkIssue(WorkItem):
     idReadable: str
     summary: str
     resolved: Optional[int] = None
+    updated: Optional[int] = None
     reporter: Optional[User]
     project: Optional[Project]
     fields: Optional[
@@ -434,6 +438,33 @@ class LinkIssue(WorkItem):
     ]
 
 
+class IssueSummary(WorkItem):
+    """Lightweight issue record (ID and summary) used for link pages."""
+
+    idReadable: str
+    summary: Optional[str] = None
+    project: Optional[Project] = None
+    resolved: Optional[int] = None
+    updated: Optional[int] = None
+
+
+class WorkItemDuration(WorkItem):
+    minutes: Optional[int] = None
+
+
+class IssueWorkItem(WorkItem):
+    """Time tracking entry on an issue, as returned by ``timeTracking/workItems``."""
+
+    created: Optional[int] = None
+    updated: Optional[int] = None
+    date: Optional[int] = None
+    text: Optional[str] = None
+    duration: Optional[WorkItemDuration] = None
+    author: Optional[User] = None
+    type: Optional[WorkItem] = None
+    issue: Optional[IssueSummary] = None
+
+
 class Link(WorkItem):
     linkType: IssueLinkType
     issuesSize: int
@@ -0,0 +1,17 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class LedgerEntry(BaseModel):
+    """One of the user's work items as stored in the local ledger."""
+
+    id: str
+    issue_id: str
+    issue_summary: Optional[str] = None
+    date: int  # epoch millis of the work day
+    minutes: int
+    text: Optional[str] = None
+    type_name: Optional[str] = None
+    created: Optional[int] = None
+    updated: Optional[int] = None
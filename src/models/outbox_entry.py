@@ -0,0 +1,20 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+from models.general_requests import AddSpentTimeRequest
+from models.general_responses import IssueWorkItem
+
+
+class OutboxEntry(BaseModel):
+    """A journaled work-item submission waiting to reach YouTrack."""
+
+    idempotency_key: str
+    issue_id: str
+    request: AddSpentTimeRequest
+    created_at: int  # epoch millis, lower bound for the server-side `created`
+    attempts: int = 0
+    next_attempt_at: float = 0.0  # epoch seconds
+    last_error: Optional[str] = None
+    status: Literal["pending", "rejected"] = "pending"
+    work_item: Optional[IssueWorkItem] = None  # as booked, once delivered
@@ -0,0 +1,11 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class ReportTable(BaseModel):
+    """One aggregate of a time report, ready to display or export."""
+
+    title: str
+    columns: List[str]
+    rows: List[list]
@@ -2,10 +2,10 @@ import logging
 import os
 import base64
 import binascii
+import hashlib
+import json
+from typing import Optional
 
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.exceptions import InvalidTag
 from errors.user_error import UserError
@@ -18,14 +18,19 @@ class EncryptionService:
     Service class to handle encryption and decryption of tokens.
     """
 
-    def __init__(self, passphrase: str):
+    def __init__(self, passphrase: str, key_cache_path: Optional[str] = None):
         """
         Initialize the encryption service.
 
         :param passphrase: The passphrase provided by the user.
         Used to derive the encryption key.
+        :param key_cache_path: Optional file to reuse the derived key from.
+        Skips the PBKDF2 rounds on every launch of short-lived commands.
         """
-        self.key = self.derive_key(passphrase)
+        if key_cache_path:
+            self.key = self._load_or_derive_key(passphrase, key_cache_path)
+        else:
+            self.key = self.derive_key(passphrase)
 
     @staticmethod
     def derive_key(passphrase: str) -> bytes:
@@ -34,6 +39,11 @@ class EncryptionService:
 
         :param passphrase: The passphrase provided by the user
         """
+        # imported here; cached keys never need the KDF
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
         kdf = PBKDF2HMAC(
             algorithm=hashes.SHA256(),
             length=32,
@@ -43,6 +53,34 @@ class EncryptionService:
         )
         return kdf.derive(passphrase.encode())
 
+    @classmethod
+    def _load_or_derive_key(cls, passphrase: str, cache_path: str) -> bytes:
+        """
+        Returns the cached key if it was derived from the same passphrase,
+        otherwise derives it and rewrites the cache (owner-only permissions).
+        The passphrase itself already sits next to it in the '.key' file.
+        """
+        fingerprint = hashlib.sha256(passphrase.encode()).hexdigest()
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("fingerprint") == fingerprint:
+                return base64.b64decode(cached["key"])
+        except (OSError, ValueError, KeyError, TypeError, binascii.Error):
+            pass
+
+        key = cls.derive_key(passphrase)
+        try:
+            fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"fingerprint": fingerprint, "key": base64.b64encode(key).decode()},
+                    f,
+                )
+        except OSError as e:
+            logger.warning(f"Could not cache derived key: {e}")
+        return key
+
     def encrypt(self, value: str) -> str:
         """
         Encrypts a value using AES-GCM.
@@ -3,8 +3,8 @@ from typing import Optional
 
 from security.encryption import EncryptionService
 from errors.user_cancelled_error import UserCancelledError
+from errors.user_error import UserError
 from stores.store import Store
-from ui.token_ui import display_bearer_token_prompt
 
 
 logger = logging.getLogger(__name__)
@@ -12,11 +12,16 @@ logger = logging.getLogger(__name__)
 
 class BearerTokenService:
     def __init__(
-        self, store: Store, encryption_service: EncryptionService, token_file_name: str
+        self,
+        store: Store,
+        encryption_service: EncryptionService,
+        token_file_name: str,
+        interactive: bool = True,
     ):
         self._store = store
         self._encryption_service = encryption_service
         self._token_file_name = token_file_name
+        self._interactive = interactive
 
     def get_bearer_token(self) -> Optional[str]:
         encrypted_token = self._store.read(self._token_file_name)
@@ -33,6 +38,12 @@ class BearerTokenService:
         Opens a prompt for the user to input their
         YouTrack subdomain and bearer token.
         """
+        if not self._interactive:
+            raise UserError(
+                "No saved token for this subdomain. Launch the app once to enter it."
+            )
+
+        from ui.token_ui import display_bearer_token_prompt
 
         bearer_token = display_bearer_token_prompt()
 
@@ -5,12 +5,15 @@ from typing import Literal, Optional, TypeVar, Type, List, Dict, Any
 from pydantic import BaseModel
 
 from errors.user_error import UserError
+from services.task_executor import current_cancellation_token, raise_if_cancelled
 from stores.config_store import ConfigStore
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+_CANCELLABLE_CHUNK_SIZE = 64 * 1024
+
 
 class HttpClient:
     def __init__(
@@ -29,8 +32,11 @@ class HttpClient:
         method: Literal["get", "post", "put", "delete"] = "get",
         json: Optional[dict] = None,
         params: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
     ) -> Optional[T] | dict:
-        if method == "get":
+        """*use_cache* False keeps large or paged GETs out of the response cache."""
+        use_cache = use_cache and method == "get"
+        if use_cache:
             cached = self._get_cached_response(endpoint)
             if cached and self._is_fresh(endpoint, cached):
                 logger.debug(f"Cache hit for endpoint: {endpoint}")
@@ -43,7 +49,7 @@ class HttpClient:
         response = self._make_request(
             endpoint, method, json=json, params=params)
 
-        if method == "get":
+        if use_cache:
             self._cache_response(endpoint, response)
 
         return (
@@ -68,15 +74,37 @@ class HttpClient:
         url = f"{self._base_url}/{endpoint}"
         self._log_request(method.upper(), url, base_params or data)
 
+        raise_if_cancelled()
+        cancellable = current_cancellation_token() is not None and method == "get"
+
         try:
             response = self.session.request(
-                method=method, url=url, headers=headers, params=base_params, json=data
+                method=method,
+                url=url,
+                headers=headers,
+                params=base_params,
+                json=data,
+                stream=cancellable,
             )
+            if cancellable:
+                self._read_body_cancellable(response)
             return self._handle_response(url, response)
         except requests.RequestException as e:
             logger.error(f"{method.upper()} {url} - Failed: {e}")
             raise
 
+    def _read_body_cancellable(self, response: requests.Response) -> None:
+        """Read a streamed body in chunks so a cancelled task stops mid-transfer."""
+        chunks = []
+        try:
+            for chunk in response.iter_content(chunk_size=_CANCELLABLE_CHUNK_SIZE):
+                raise_if_cancelled()
+                chunks.append(chunk)
+        except BaseException:
+            response.close()
+            raise
+        response._content = b"".join(chunks)
+
     def _get_headers(self) -> dict:
         """Override this method to add custom headers"""
         return {"Accept": "application/json"}
@@ -135,6 +163,9 @@ class HttpClient:
                     "Unauthorized. Please check subdomain and token.")
 
             if response.request.method == "POST":
+                if response.status_code == 429 or response.status_code >= 500:
+                    # transient: callers retry these like network errors
+                    response.raise_for_status()
                 raise UserError(formatted_response)
 
             elif response.status_code == 404:
@@ -0,0 +1,69 @@
+import json
+import logging
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Any, Dict, Optional
+
+from errors.user_error import UserError
+from services.http.base_http_client import HttpClient
+
+logger = logging.getLogger(__name__)
+
+
+class UrllibHttpClient(HttpClient):
+    """
+    Bare JSON client on the standard library, for one-shot commands that
+    must not pay for importing requests and pydantic. No response cache and
+    no cancellation; answers are plain dicts.
+
+    Mirrors HttpClient's errors: 401 and other 4xx raise UserError, while
+    429/5xx and network failures propagate as OSError (urllib.error.URLError).
+    """
+
+    def __init__(self, base_url: str, token: str, timeout: float = 30):
+        self._base_url = base_url
+        self._token = token
+        self._timeout = timeout
+
+    def request(
+        self,
+        endpoint: str,
+        method: str = "get",
+        json_body: Optional[dict] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        url = f"{self._base_url}/{endpoint}"
+        if params:
+            url += "?" + urllib.parse.urlencode(params)
+        headers = {
+            "Accept": "application/json",
+            "Authorization": f"Bearer {self._token}",
+        }
+        data = None
+        if json_body is not None:
+            data = json.dumps(json_body).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        logger.debug(f"{method.upper()} {url}")
+
+        request = urllib.request.Request(
+            url, data=data, headers=headers, method=method.upper()
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout) as response:
+                body = response.read()
+        except urllib.error.HTTPError as e:
+            if e.code == 401:
+                raise UserError("Unauthorized. Please check subdomain and token.")
+            if 400 <= e.code < 500 and e.code != 429:
+                raise UserError(f"Request failed ({e.code}): {self._error_text(e)}")
+            raise
+        return json.loads(body) if body else {}
+
+    @staticmethod
+    def _error_text(error: urllib.error.HTTPError) -> str:
+        try:
+            payload = json.loads(error.read() or b"{}")
+        except ValueError:
+            return error.reason
+        return payload.get("error_description") or payload.get("error") or error.reason
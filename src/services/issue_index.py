@@ -0,0 +1,252 @@
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+
+from models.general_responses import IssueSummary, Project
+from services.youtrack_service import YouTrackService
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = "issue_index.sqlite3"
+SYNC_PAGE_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    rowid INTEGER PRIMARY KEY,
+    id_readable TEXT NOT NULL UNIQUE,
+    project TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    summary TEXT,
+    resolved INTEGER,
+    updated INTEGER
+);
+CREATE INDEX IF NOT EXISTS issues_by_number ON issues (project, number);
+CREATE VIRTUAL TABLE IF NOT EXISTS issues_fts USING fts5(
+    id_readable, summary, project,
+    content='issues', content_rowid='rowid', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS issues_ai AFTER INSERT ON issues BEGIN
+    INSERT INTO issues_fts (rowid, id_readable, summary, project)
+    VALUES (new.rowid, new.id_readable, new.summary, new.project);
+END;
+CREATE TRIGGER IF NOT EXISTS issues_ad AFTER DELETE ON issues BEGIN
+    INSERT INTO issues_fts (issues_fts, rowid, id_readable, summary, project)
+    VALUES ('delete', old.rowid, old.id_readable, old.summary, old.project);
+END;
+CREATE TRIGGER IF NOT EXISTS issues_au AFTER UPDATE ON issues BEGIN
+    INSERT INTO issues_fts (issues_fts, rowid, id_readable, summary, project)
+    VALUES ('delete', old.rowid, old.id_readable, old.summary, old.project);
+    INSERT INTO issues_fts (rowid, id_readable, summary, project)
+    VALUES (new.rowid, new.id_readable, new.summary, new.project);
+END;
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# an older payload never overwrites a newer one; missing summaries are kept.
+# Partial records (no `updated`) cannot tell "unresolved" from "not sent",
+# so they only ever set `resolved`, never clear it.
+_UPSERT = """
+INSERT INTO issues (id_readable, project, number, summary, resolved, updated)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (id_readable) DO UPDATE SET
+    summary = COALESCE(excluded.summary, issues.summary),
+    resolved = CASE
+        WHEN excluded.updated IS NULL THEN COALESCE(excluded.resolved, issues.resolved)
+        ELSE excluded.resolved
+    END,
+    updated = COALESCE(excluded.updated, issues.updated)
+WHERE excluded.updated IS NULL
+    OR issues.updated IS NULL
+    OR excluded.updated >= issues.updated
+"""
+
+_SELECT = "SELECT i.id_readable, i.project, i.summary, i.resolved, i.updated FROM issues i"
+_ID_PATTERN = re.compile(r"^([A-Za-z][A-Za-z0-9_]*)-(\d+)$")
+# what a user may have typed so far, e.g. "A-" or "A-12"
+_ID_PREFIX_PATTERN = re.compile(r"^([A-Za-z][A-Za-z0-9_]*)-(\d*)$")
+_MAX_NUMBER_DIGITS = 7
+_CANDIDATES_PER_RESULT = 8
+
+
+class IssueIndex:
+    """
+    Local SQLite FTS5 index of issue ID, summary and project.
+
+    Fed with every issue the app sees: fetched issues, link pages and a
+    background sync of the current project (incremental by ``updated``).
+    `search` answers from the index only and is cheap enough to run on
+    every keystroke. `search_remote` asks the server (``issues?query=``)
+    and indexes what comes back.
+    """
+
+    def __init__(self, youtrack_service: YouTrackService, base_dir: str):
+        self.__youtrack_service = youtrack_service
+        self.__path = os.path.join(base_dir, INDEX_FILE_NAME)
+        self.__lock = threading.Lock()
+        self.__connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # callers hold self.__lock
+        if self.__connection is None:
+            os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+            connection = sqlite3.connect(self.__path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self.__connection = connection
+        return self.__connection
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+
+    def add(self, issues: Iterable) -> int:
+        """Index anything with ``idReadable``, ``summary`` and ``project`` (e.g. `IssueSummary`)."""
+        rows = []
+        for issue in issues:
+            match = _ID_PATTERN.match(getattr(issue, "idReadable", None) or "")
+            if not match:
+                continue
+            project, number = match.groups()
+            rows.append(
+                (
+                    issue.idReadable.upper(),
+                    project.upper(),
+                    int(number),
+                    getattr(issue, "summary", None),
+                    getattr(issue, "resolved", None),
+                    getattr(issue, "updated", None),
+                )
+            )
+        if not rows:
+            return 0
+        with self.__lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def get(self, issue_id: str) -> Optional[IssueSummary]:
+        with self.__lock:
+            row = self._connect().execute(
+                f"{_SELECT} WHERE i.id_readable = ?", ((issue_id or "").upper(),)
+            ).fetchone()
+        return self._to_summary(row) if row else None
+
+    def search(self, text: str, project: str = "", limit: int = 8) -> List[IssueSummary]:
+        """
+        Digits match issue numbers of *project* by prefix; anything else is a
+        prefix match on ID, summary and project words. Open issues of
+        *project* come first.
+        """
+        text = (text or "").strip()
+        project = (project or "").upper()
+        if not text:
+            return []
+
+        id_match = _ID_PREFIX_PATTERN.match(text)
+        if id_match:
+            project, text = (part.upper() for part in id_match.groups())
+            if not text:
+                return []
+
+        if text.isdigit():
+            # "12" -> 12, 120..129, 1200..1299, ... so the (project, number) index is used
+            ranges, number = [], int(text)
+            for digits in range(_MAX_NUMBER_DIGITS - len(text) + 1):
+                scale = 10**digits
+                ranges.append((number * scale, (number + 1) * scale - 1))
+            sql = (
+                f"{_SELECT} WHERE i.project = ? AND ("
+                + " OR ".join("i.number BETWEEN ? AND ?" for _ in ranges)
+                + ") ORDER BY i.resolved IS NOT NULL, length(i.number), i.number DESC "
+                "LIMIT ?"
+            )
+            params = (project, *(bound for pair in ranges for bound in pair), limit)
+        else:
+            words = re.findall(r"\w+", text)
+            if not words:
+                return []
+            # rank inside FTS first; only the best candidates are sorted by project
+            sql = (
+                f"{_SELECT} JOIN ("
+                "SELECT rowid, rank FROM issues_fts WHERE issues_fts MATCH ? "
+                "ORDER BY rank LIMIT ?"
+                ") matches ON matches.rowid = i.rowid "
+                "ORDER BY i.project = ? DESC, i.resolved IS NOT NULL, matches.rank "
+                "LIMIT ?"
+            )
+            params = (
+                " ".join(f'"{word}"*' for word in words),
+                limit * _CANDIDATES_PER_RESULT,
+                project,
+                limit,
+            )
+
+        with self.__lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [self._to_summary(row) for row in rows]
+
+    def search_remote(self, text: str, project: str = "", limit: int = 8) -> int:
+        """Index server matches for *text* (within *project* if given)."""
+        query = f"project: {project} {text}" if project else text
+        return self.add(self.__youtrack_service.search_issues(query, top=limit))
+
+    def sync_project(self, project: str) -> int:
+        """Index *project*'s issues updated since the last sync."""
+        project = project.upper()
+        key = f"project:{project}"
+        with self.__lock:
+            row = self._connect().execute(
+                "SELECT value FROM sync_state WHERE key = ?", (key,)
+            ).fetchone()
+        cursor = row[0] if row else 0
+
+        query = f"project: {project}"
+        if cursor:
+            # day granularity; the day before covers time zones, re-reads are upserts
+            since = datetime.fromtimestamp(cursor / 1000, timezone.utc) - timedelta(days=1)
+            query += f" updated: {since.date().isoformat()} .. *"
+
+        written = skip = newest = 0
+        while True:
+            page = self.__youtrack_service.search_issues(
+                query, skip=skip, top=SYNC_PAGE_SIZE
+            )
+            if not page:
+                break
+            written += self.add(page)
+            newest = max([newest] + [issue.updated or 0 for issue in page])
+            if len(page) < SYNC_PAGE_SIZE:
+                break
+            skip += len(page)
+
+        if newest > cursor:
+            with self.__lock:
+                connection = self._connect()
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+                        (key, newest),
+                    )
+        logger.info(f"Issue index synced {written} issue(s) of {project}")
+        return written
+
+    @staticmethod
+    def _to_summary(row: tuple) -> IssueSummary:
+        id_readable, project, summary, resolved, updated = row
+        return IssueSummary(
+            idReadable=id_readable,
+            summary=summary,
+            project=Project(shortName=project),
+            resolved=resolved,
+            updated=updated,
+        )
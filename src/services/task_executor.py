@@ -0,0 +1,170 @@
+import logging
+import threading
+from collections import deque
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from errors.task_cancelled_error import TaskCancelledError
+
+logger = logging.getLogger(__name__)
+
+
+class TaskPriority(IntEnum):
+    USER = 0
+    BACKGROUND = 1
+
+
+class CancellationToken:
+    def __init__(self):
+        self.__event = threading.Event()
+
+    def cancel(self) -> None:
+        self.__event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.__event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise TaskCancelledError()
+
+
+_current_token: ContextVar[Optional[CancellationToken]] = ContextVar(
+    "current_cancellation_token", default=None
+)
+
+
+def current_cancellation_token() -> Optional[CancellationToken]:
+    """Token of the task running on this worker thread, if any."""
+    return _current_token.get()
+
+
+def raise_if_cancelled() -> None:
+    """Abort the current task if its token was cancelled. No-op outside tasks."""
+    token = _current_token.get()
+    if token:
+        token.raise_if_cancelled()
+
+
+_Task = Tuple[Callable, tuple, dict, CancellationToken]
+
+
+class TaskExecutor:
+    """
+    Bounded worker pool with priority lanes and cooperative cancellation.
+
+    User tasks always run before queued background tasks, and background tasks
+    never occupy the last free worker, so a lookup never waits behind prefetch.
+    """
+
+    def __init__(self, max_workers: int = 3):
+        self.__max_workers = max(1, max_workers)
+        self.__lanes: Dict[TaskPriority, Deque[_Task]] = {
+            priority: deque() for priority in TaskPriority
+        }
+        self.__condition = threading.Condition()
+        self.__workers: List[threading.Thread] = []
+        self.__idle_workers = 0
+        self.__running_background = 0
+        self.__in_flight: Set[CancellationToken] = set()
+        self.__is_shutdown = False
+
+    def submit(
+        self,
+        func: Callable,
+        *args,
+        priority: TaskPriority = TaskPriority.BACKGROUND,
+        token: Optional[CancellationToken] = None,
+        **kwargs,
+    ) -> CancellationToken:
+        """Queue *func* and return the token that cancels it."""
+        token = token or CancellationToken()
+        with self.__condition:
+            if self.__is_shutdown:
+                token.cancel()
+                return token
+            self.__lanes[priority].append((func, args, kwargs, token))
+            if not self.__idle_workers and len(self.__workers) < self.__max_workers:
+                self._start_worker()
+            self.__condition.notify()
+        return token
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """Cancel queued and running tasks and wait briefly for workers to exit."""
+        with self.__condition:
+            if self.__is_shutdown:
+                return
+            self.__is_shutdown = True
+            for lane in self.__lanes.values():
+                for _, _, _, token in lane:
+                    token.cancel()
+                lane.clear()
+            for token in self.__in_flight:
+                token.cancel()
+            self.__condition.notify_all()
+            workers = list(self.__workers)
+
+        for worker in workers:
+            if worker is not threading.current_thread():
+                worker.join(timeout=timeout)
+        logger.debug("Task executor shut down")
+
+    def _start_worker(self) -> None:
+        worker = threading.Thread(
+            target=self._worker_loop,
+            name=f"task-worker-{len(self.__workers)}",
+            daemon=True,
+        )
+        self.__workers.append(worker)
+        worker.start()
+
+    def _next_task(self) -> Optional[Tuple[_Task, TaskPriority]]:
+        """Pop the next runnable task; caller must hold the condition."""
+        for priority in TaskPriority:
+            lane = self.__lanes[priority]
+            if (
+                priority is TaskPriority.BACKGROUND
+                and self.__max_workers > 1
+                and self.__running_background >= self.__max_workers - 1
+            ):
+                continue
+            while lane:
+                task = lane.popleft()
+                if not task[3].cancelled:
+                    return task, priority
+        return None
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self.__condition:
+                next_task = self._next_task()
+                while next_task is None:
+                    if self.__is_shutdown:
+                        return
+                    self.__idle_workers += 1
+                    self.__condition.wait()
+                    self.__idle_workers -= 1
+                    next_task = self._next_task()
+
+                (func, args, kwargs, token), priority = next_task
+                if priority is TaskPriority.BACKGROUND:
+                    self.__running_background += 1
+                self.__in_flight.add(token)
+
+            context_token = _current_token.set(token)
+            try:
+                token.raise_if_cancelled()
+                func(*args, **kwargs)
+            except TaskCancelledError:
+                logger.debug(f"Task cancelled: {getattr(func, '__name__', func)}")
+            except Exception as e:
+                logger.exception("Unexpected error in task: %s", e)
+            finally:
+                _current_token.reset(context_token)
+                with self.__condition:
+                    self.__in_flight.discard(token)
+                    if priority is TaskPriority.BACKGROUND:
+                        self.__running_background -= 1
+                    self.__condition.notify()
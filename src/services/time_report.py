@@ -0,0 +1,210 @@
+from datetime import date
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from models.ledger_entry import LedgerEntry
+from models.report_table import ReportTable
+from utils.youtrack import format_minutes
+
+DAY_MS = 24 * 60 * 60 * 1000
+NO_TYPE = "(no type)"
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+class TimeReport:
+    """
+    Aggregates work items held as NumPy column arrays.
+
+    Each entry becomes a row of ``days`` (days since the epoch, UTC, which is
+    how YouTrack stores work item dates), ``minutes`` and integer codes into
+    the sorted ``issues`` and ``types`` labels. Every group-by is a single
+    ``np.bincount`` over those codes, so a year of a team's entries is
+    aggregated in milliseconds; Python only loops over the result rows.
+    """
+
+    def __init__(
+        self,
+        days: np.ndarray,
+        minutes: np.ndarray,
+        issue_codes: np.ndarray,
+        issues: np.ndarray,
+        type_codes: np.ndarray,
+        types: np.ndarray,
+        start_day: Optional[int] = None,
+        end_day: Optional[int] = None,
+    ):
+        self.days = days
+        self.minutes = minutes
+        self.issue_codes = issue_codes
+        self.issues = issues
+        self.type_codes = type_codes
+        self.types = types
+        # the reported range; days without entries still count as gaps
+        self.start_day = start_day if start_day is not None else int(days.min(initial=0))
+        self.end_day = end_day if end_day is not None else int(days.max(initial=-1)) + 1
+
+    @classmethod
+    def from_entries(
+        cls,
+        entries: Sequence[LedgerEntry],
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> "TimeReport":
+        return cls.from_rows(
+            [
+                (entry.date, entry.minutes, entry.issue_id, entry.type_name)
+                for entry in entries
+            ],
+            start,
+            end,
+        )
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence[Tuple[int, int, str, Optional[str]]],
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> "TimeReport":
+        """
+        Build from ``(date_millis, minutes, issue_id, type_name)`` rows, as
+        returned by `WorkItemLedger.report_rows`. *start* and *end* (epoch
+        millis, end exclusive) fix the reported range.
+        """
+        if rows:
+            dates, minutes, issue_ids, type_names = zip(*rows)
+        else:
+            dates, minutes, issue_ids, type_names = (), (), (), ()
+        issues, issue_codes = np.unique(
+            np.array(issue_ids, dtype=str), return_inverse=True
+        )
+        types, type_codes = np.unique(
+            np.array([name or NO_TYPE for name in type_names], dtype=str),
+            return_inverse=True,
+        )
+        return cls(
+            days=np.array(dates, dtype=np.int64) // DAY_MS,
+            minutes=np.array(minutes, dtype=np.int64),
+            issue_codes=issue_codes.ravel(),
+            issues=issues,
+            type_codes=type_codes.ravel(),
+            types=types,
+            start_day=start // DAY_MS if start is not None else None,
+            end_day=-(-end // DAY_MS) if end is not None else None,
+        )
+
+    @property
+    def total_minutes(self) -> int:
+        return int(self.minutes.sum())
+
+    def daily_totals(self) -> np.ndarray:
+        """Minutes per day for every day in the range, including empty ones."""
+        span = max(0, self.end_day - self.start_day)
+        in_range = (self.days >= self.start_day) & (self.days < self.end_day)
+        return np.bincount(
+            self.days[in_range] - self.start_day,
+            weights=self.minutes[in_range],
+            minlength=span,
+        ).astype(np.int64)[:span]
+
+    def _range_days(self) -> np.ndarray:
+        return np.arange(self.start_day, self.end_day, dtype=np.int64)
+
+    @staticmethod
+    def _weekdays(days: np.ndarray) -> np.ndarray:
+        # 1970-01-01 was a Thursday; Monday is 0
+        return (days + 3) % 7
+
+    def daily(self) -> ReportTable:
+        days = self._range_days()
+        totals = self.daily_totals()
+        weekdays = self._weekdays(days)
+        return ReportTable(
+            title="Daily",
+            columns=["Date", "Day", "Minutes", "Time"],
+            rows=[
+                [_day_label(day), _WEEKDAYS[weekday], int(total), format_minutes(total)]
+                for day, weekday, total in zip(days, weekdays, totals)
+            ],
+        )
+
+    def weekly(self) -> ReportTable:
+        days = self._range_days()
+        week_starts = days - self._weekdays(days)
+        weeks, week_codes = np.unique(week_starts, return_inverse=True)
+        totals = np.bincount(
+            week_codes, weights=self.daily_totals(), minlength=len(weeks)
+        ).astype(np.int64)
+        return ReportTable(
+            title="Weekly",
+            columns=["Week of", "Minutes", "Time"],
+            rows=[
+                [_day_label(week), int(total), format_minutes(total)]
+                for week, total in zip(weeks, totals)
+            ],
+        )
+
+    def by_issue(self) -> ReportTable:
+        return self._by_label("Issues", "Issue", self.issue_codes, self.issues)
+
+    def by_type(self) -> ReportTable:
+        return self._by_label("Types", "Type", self.type_codes, self.types)
+
+    def _by_label(
+        self, title: str, column: str, codes: np.ndarray, labels: np.ndarray
+    ) -> ReportTable:
+        totals = np.bincount(codes, weights=self.minutes, minlength=len(labels))
+        counts = np.bincount(codes, minlength=len(labels))
+        order = np.argsort(-totals, kind="stable")
+        total = totals.sum() or 1
+        return ReportTable(
+            title=title,
+            columns=[column, "Entries", "Minutes", "Time", "Share"],
+            rows=[
+                [
+                    str(labels[i]),
+                    int(counts[i]),
+                    int(totals[i]),
+                    format_minutes(totals[i]),
+                    f"{totals[i] / total:.1%}",
+                ]
+                for i in order
+            ],
+        )
+
+    def gaps(self, target_minutes: int, workdays_only: bool = True) -> ReportTable:
+        """Days (Mon-Fri by default) with less time logged than *target_minutes*."""
+        days = self._range_days()
+        totals = self.daily_totals()
+        short = totals < target_minutes
+        if workdays_only:
+            short &= self._weekdays(days) < 5
+        missing = target_minutes - totals
+        return ReportTable(
+            title="Gaps",
+            columns=["Date", "Day", "Logged", "Missing"],
+            rows=[
+                [
+                    _day_label(day),
+                    _WEEKDAYS[self._weekdays(day)],
+                    format_minutes(totals[i]),
+                    format_minutes(missing[i]),
+                ]
+                for i, day in zip(np.flatnonzero(short), days[short])
+            ],
+        )
+
+    def tables(self, target_minutes: int, workdays_only: bool = True) -> List[ReportTable]:
+        return [
+            self.daily(),
+            self.weekly(),
+            self.by_issue(),
+            self.by_type(),
+            self.gaps(target_minutes, workdays_only),
+        ]
+
+
+def _day_label(day: int) -> str:
+    return date.fromordinal(date(1970, 1, 1).toordinal() + int(day)).isoformat()
+
@@ -0,0 +1,276 @@
+import csv
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from errors.user_error import UserError
+from models.general_requests import AddSpentTimeRequest, Duration
+from models.general_responses import WorkItem
+from services.task_executor import TaskExecutor, TaskPriority
+from services.youtrack_service import YouTrackService
+from utils.youtrack import convert_time_to_minutes, id_valid, time_valid
+
+logger = logging.getLogger(__name__)
+
+# accepted column names (lower-cased) per field
+_COLUMNS = {
+    "issue": ("issue", "issue_id", "issueid", "id"),
+    "time": ("time", "duration", "spent"),
+    "minutes": ("minutes",),
+    "date": ("date", "day"),
+    "description": ("description", "text", "comment"),
+    "type": ("type", "work_type", "worktype"),
+}
+
+
+class TimesheetRow(BaseModel):
+    row_number: int
+    issue_id: str
+    minutes: int
+    date_millis: int
+    description: Optional[str] = None
+    type_id: Optional[str] = None
+
+    def to_request(self) -> AddSpentTimeRequest:
+        return AddSpentTimeRequest(
+            description=self.description,
+            duration=Duration(minutes=self.minutes),
+            type=WorkItem(id=self.type_id) if self.type_id else None,
+            date_millis=self.date_millis,
+        )
+
+
+class ImportReport(BaseModel):
+    rows_read: int = 0
+    valid: int = 0
+    invalid: int = 0
+    posted: int = 0
+    failed: int = 0
+    total_minutes: int = 0
+    elapsed_s: float = 0.0
+    dry_run: bool = False
+    failed_rows_path: Optional[str] = None
+    errors: List[str] = []
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_read / self.elapsed_s if self.elapsed_s else 0.0
+
+    def format(self) -> str:
+        processed = self.valid if self.dry_run else self.posted
+        lines = [
+            f"Rows read:     {self.rows_read}",
+            f"Valid:         {self.valid}",
+            f"Invalid:       {self.invalid}",
+            f"{'Would post' if self.dry_run else 'Posted'}:    {processed}",
+            f"Failed:        {self.failed}",
+            f"Total time:    {self.total_minutes // 60}h{self.total_minutes % 60:02d}m",
+            f"Elapsed:       {self.elapsed_s:.2f}s ({self.rows_per_second:.1f} rows/s)",
+        ]
+        if self.failed_rows_path:
+            lines.append(f"Failed rows:   {self.failed_rows_path}")
+        return "\n".join(lines + self.errors[:50])
+
+
+class TimesheetImporter:
+    """
+    Streams a CSV, JSON or JSON Lines timesheet into YouTrack work items.
+
+    Rows are validated while reading, and type names are resolved once
+    through the global work item type list. Valid rows are posted with at
+    most *concurrency* requests in flight. Invalid and failed rows are written
+    next to the input as ``<name>.failed.csv`` with an ``error`` column, so
+    they can be fixed and re-imported.
+    """
+
+    def __init__(
+        self,
+        youtrack_service: YouTrackService,
+        concurrency: int = 4,
+        dry_run: bool = False,
+        date_format: str = "%Y-%m-%d",
+    ):
+        self.__youtrack_service = youtrack_service
+        self.__concurrency = max(1, concurrency)
+        self.__dry_run = dry_run
+        self.__date_format = date_format
+        self.__type_ids: Optional[Dict[str, str]] = None
+        self.__lock = threading.Lock()
+
+    def import_file(
+        self,
+        path: str,
+        on_progress: Optional[Callable[[ImportReport], None]] = None,
+    ) -> ImportReport:
+        report = ImportReport(dry_run=self.__dry_run)
+        failed_rows: List[dict] = []
+        started = time.monotonic()
+
+        executor = TaskExecutor(max_workers=self.__concurrency)
+        # bounds queued rows so huge files are never fully buffered
+        slots = threading.BoundedSemaphore(self.__concurrency * 2)
+        in_flight = threading.Condition(self.__lock)
+        pending = [0]
+
+        def post(row: TimesheetRow, record: dict) -> None:
+            try:
+                self.__youtrack_service.add_spent_time(row.issue_id, row.to_request())
+                error = None
+            except UserError as e:
+                error = e.message
+            except Exception as e:
+                error = str(e)
+            with in_flight:
+                if error:
+                    report.failed += 1
+                    report.errors.append(f"Row {row.row_number}: {error}")
+                    failed_rows.append({**record, "error": error})
+                else:
+                    report.posted += 1
+                pending[0] -= 1
+                in_flight.notify_all()
+            slots.release()
+            if on_progress:
+                on_progress(report)
+
+        try:
+            for row_number, record in self._read_records(path):
+                with self.__lock:
+                    report.rows_read += 1
+                try:
+                    row = self._parse_row(row_number, record)
+                except ValueError as e:
+                    with self.__lock:
+                        report.invalid += 1
+                        report.errors.append(f"Row {row_number}: {e}")
+                        failed_rows.append({**record, "error": str(e)})
+                    continue
+
+                with self.__lock:
+                    report.valid += 1
+                    report.total_minutes += row.minutes
+                if self.__dry_run:
+                    continue
+
+                slots.acquire()
+                with in_flight:
+                    pending[0] += 1
+                executor.submit(post, row, record, priority=TaskPriority.USER)
+
+            with in_flight:
+                while pending[0]:
+                    in_flight.wait()
+        finally:
+            executor.shutdown()
+
+        report.elapsed_s = time.monotonic() - started
+        if failed_rows:
+            report.failed_rows_path = self._write_failed_rows(path, failed_rows)
+        return report
+
+    def _read_records(self, path: str) -> Iterator[Tuple[int, dict]]:
+        extension = os.path.splitext(path)[1].lower()
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            if extension == ".csv":
+                # row 1 is the header
+                for row_number, record in enumerate(csv.DictReader(f), start=2):
+                    yield row_number, record
+            elif extension in (".jsonl", ".ndjson"):
+                for row_number, line in enumerate(f, start=1):
+                    if line.strip():
+                        yield row_number, self._as_record(json.loads(line))
+            elif extension == ".json":
+                records = json.load(f)
+                if not isinstance(records, list):
+                    raise UserError("A JSON timesheet must be a list of rows.")
+                for row_number, record in enumerate(records, start=1):
+                    yield row_number, self._as_record(record)
+            else:
+                raise UserError(f"Unsupported timesheet format: {extension or path}")
+
+    @staticmethod
+    def _as_record(value) -> dict:
+        # non-object rows still flow through validation and into the failed file
+        return value if isinstance(value, dict) else {"row": json.dumps(value)}
+
+    def _parse_row(self, row_number: int, record: dict) -> TimesheetRow:
+        values = {
+            str(key).strip().lower(): value
+            for key, value in record.items()
+            if key is not None
+        }
+
+        def field(name: str) -> str:
+            for column in _COLUMNS[name]:
+                value = values.get(column)
+                if value not in (None, ""):
+                    return str(value).strip()
+            return ""
+
+        issue_id = field("issue").upper()
+        if not id_valid(issue_id):
+            raise ValueError(f"invalid issue ID '{issue_id}'")
+
+        time_text, minutes_text = field("time"), field("minutes")
+        if minutes_text:
+            if not minutes_text.isdigit():
+                raise ValueError(f"invalid minutes '{minutes_text}'")
+            minutes = int(minutes_text)
+        elif time_valid(time_text):
+            minutes = int(convert_time_to_minutes(time_text) or 0)
+        else:
+            raise ValueError(f"invalid time '{time_text}' (e.g. 1h30m)")
+        if minutes <= 0:
+            raise ValueError("time must be positive")
+
+        date_text = field("date")
+        try:
+            date_millis = (
+                int(date_text)
+                if date_text.isdigit()
+                else int(datetime.strptime(date_text, self.__date_format).timestamp() * 1000)
+            )
+        except ValueError:
+            raise ValueError(f"invalid date '{date_text}' (expected {self.__date_format})")
+
+        type_name = field("type")
+        type_id = self._resolve_type(type_name) if type_name else None
+        if type_name and not type_id:
+            raise ValueError(f"unknown work item type '{type_name}'")
+
+        return TimesheetRow(
+            row_number=row_number,
+            issue_id=issue_id,
+            minutes=minutes,
+            date_millis=date_millis,
+            description=field("description") or None,
+            type_id=type_id,
+        )
+
+    def _resolve_type(self, type_name: str) -> Optional[str]:
+        if self.__type_ids is None:
+            work_item_types = self.__youtrack_service.get_work_item_types() or []
+            self.__type_ids = {
+                work_item_type.name.lower(): work_item_type.id
+                for work_item_type in work_item_types
+                if work_item_type.name
+            }
+        return self.__type_ids.get(type_name.lower())
+
+    @staticmethod
+    def _write_failed_rows(path: str, failed_rows: List[dict]) -> str:
+        failed_path = f"{os.path.splitext(path)[0]}.failed.csv"
+        columns: List[str] = []
+        for record in failed_rows:
+            columns += [key for key in record if key not in columns]
+        with open(failed_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(failed_rows)
+        return failed_path
@@ -0,0 +1,184 @@
+import csv
+import io
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel
+
+from errors.user_error import UserError
+
+EXPORT_COLUMNS = (
+    "id",
+    "issue_id",
+    "project",
+    "issue_summary",
+    "date",
+    "minutes",
+    "type",
+    "author_login",
+    "author_name",
+    "text",
+    "created",
+    "updated",
+)
+FORMATS = ("csv", "parquet")
+# rows buffered per Parquet row group; pages are smaller than this
+PARQUET_ROW_GROUP_ROWS = 50_000
+
+
+def _iso_day(millis: Optional[int]) -> Optional[str]:
+    if millis is None:
+        return None
+    return datetime.fromtimestamp(millis / 1000, timezone.utc).date().isoformat()
+
+
+def _iso_time(millis: Optional[int]) -> Optional[str]:
+    if millis is None:
+        return None
+    return datetime.fromtimestamp(millis / 1000, timezone.utc).isoformat()
+
+
+def flatten_page(page: List[dict]) -> Dict[str, list]:
+    """Raw ``workItems`` JSON to columns named by `EXPORT_COLUMNS`."""
+    columns: Dict[str, list] = {name: [] for name in EXPORT_COLUMNS}
+    for item in page:
+        issue = item.get("issue") or {}
+        author = item.get("author") or {}
+        columns["id"].append(item.get("id"))
+        columns["issue_id"].append(issue.get("idReadable"))
+        columns["project"].append((issue.get("project") or {}).get("shortName"))
+        columns["issue_summary"].append(issue.get("summary"))
+        columns["date"].append(_iso_day(item.get("date")))
+        columns["minutes"].append((item.get("duration") or {}).get("minutes") or 0)
+        columns["type"].append((item.get("type") or {}).get("name"))
+        columns["author_login"].append(author.get("login"))
+        columns["author_name"].append(author.get("fullName"))
+        columns["text"].append(item.get("text"))
+        columns["created"].append(_iso_time(item.get("created")))
+        columns["updated"].append(_iso_time(item.get("updated")))
+    return columns
+
+
+def encode_page(page: List[dict], export_format: str):
+    """Encode one page: CSV text for ``csv``, a column dict for ``parquet``."""
+    columns = flatten_page(page)
+    if export_format != "csv":
+        return columns
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(zip(*(columns[name] for name in EXPORT_COLUMNS)))
+    return buffer.getvalue()
+
+
+class ExportReport(BaseModel):
+    pages: int = 0
+    rows: int = 0
+    total_minutes: int = 0
+    elapsed_s: float = 0.0
+    path: str = ""
+
+    def format(self) -> str:
+        rate = self.rows / self.elapsed_s if self.elapsed_s else 0.0
+        return "\n".join(
+            [
+                f"Exported:      {self.rows} work items ({self.pages} pages)",
+                f"Total time:    {self.total_minutes // 60}h{self.total_minutes % 60:02d}m",
+                f"Elapsed:       {self.elapsed_s:.2f}s ({rate:.0f} rows/s)",
+                f"Written to:    {self.path}",
+            ]
+        )
+
+
+class _CsvSink:
+    def __init__(self, path: str):
+        self.__file = open(path, "w", encoding="utf-8", newline="")
+        csv.writer(self.__file).writerow(EXPORT_COLUMNS)
+
+    def write(self, encoded: str) -> None:
+        self.__file.write(encoded)
+
+    def close(self) -> None:
+        self.__file.close()
+
+
+class _ParquetSink:
+    def __init__(self, path: str):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise UserError("Parquet export needs pyarrow: pip install pyarrow")
+
+        self.__pa = pa
+        self.__schema = pa.schema(
+            [
+                (name, pa.int64() if name == "minutes" else pa.string())
+                for name in EXPORT_COLUMNS
+            ]
+        )
+        self.__writer = pq.ParquetWriter(path, self.__schema)
+        self.__pending: List[Dict[str, list]] = []
+        self.__pending_rows = 0
+
+    def write(self, columns: Dict[str, list]) -> None:
+        self.__pending.append(columns)
+        self.__pending_rows += len(columns["id"])
+        if self.__pending_rows >= PARQUET_ROW_GROUP_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self.__pending:
+            return
+        table = self.__pa.concat_tables(
+            [
+                self.__pa.Table.from_pydict(columns, schema=self.__schema)
+                for columns in self.__pending
+            ]
+        )
+        self.__writer.write_table(table)
+        self.__pending = []
+        self.__pending_rows = 0
+
+    def close(self) -> None:
+        self._flush()
+        self.__writer.close()
+
+
+class WorkItemExporter:
+    """
+    Streams work item pages to a CSV or Parquet file.
+
+    Pages are pulled from a generator, encoded, and appended as they
+    arrive, so memory stays at a few pages whatever the date range.
+    Encoding a 500-item page takes a few milliseconds, well under the
+    request that fetched it, so it runs inline.
+    """
+
+    def __init__(self, export_format: str = "csv"):
+        if export_format not in FORMATS:
+            raise UserError(f"Unsupported export format: {export_format}")
+        self.__format = export_format
+
+    def export(
+        self,
+        pages: Iterable[List[dict]],
+        path: str,
+        on_progress: Optional[Callable[[ExportReport], None]] = None,
+    ) -> ExportReport:
+        report = ExportReport(path=path)
+        started = time.monotonic()
+        sink = _ParquetSink(path) if self.__format == "parquet" else _CsvSink(path)
+        try:
+            for page in pages:
+                sink.write(encode_page(page, self.__format))
+                report.pages += 1
+                report.rows += len(page)
+                report.total_minutes += sum(
+                    (item.get("duration") or {}).get("minutes") or 0 for item in page
+                )
+                if on_progress:
+                    on_progress(report)
+        finally:
+            sink.close()
+        report.elapsed_s = time.monotonic() - started
+        return report
@@ -0,0 +1,229 @@
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Tuple
+
+from models.general_responses import IssueWorkItem
+from models.ledger_entry import LedgerEntry
+from services.youtrack_service import YouTrackService
+
+logger = logging.getLogger(__name__)
+
+LEDGER_FILE_NAME = "ledger.sqlite3"
+SYNC_PAGE_SIZE = 200
+_CURSOR_KEY = "updated_cursor"
+DAY_MS = 24 * 60 * 60 * 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_items (
+    id TEXT PRIMARY KEY,
+    issue_id TEXT NOT NULL,
+    issue_summary TEXT,
+    date INTEGER NOT NULL,
+    minutes INTEGER NOT NULL,
+    text TEXT,
+    type_name TEXT,
+    created INTEGER,
+    updated INTEGER
+);
+CREATE INDEX IF NOT EXISTS work_items_by_date ON work_items (date);
+CREATE INDEX IF NOT EXISTS work_items_by_issue ON work_items (issue_id, date);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+_COLUMN_NAMES = (
+    "id",
+    "issue_id",
+    "issue_summary",
+    "date",
+    "minutes",
+    "text",
+    "type_name",
+    "created",
+    "updated",
+)
+_COLUMNS = ", ".join(_COLUMN_NAMES)
+
+
+class WorkItemLedger:
+    """
+    Local SQLite copy of the current user's work items.
+
+    `sync` pages through ``/workItems?author=me`` and only asks for items
+    updated at or after the last cursor; the cursor page is re-read, which is
+    harmless because rows are upserted by ID. Delivered submissions are
+    recorded right away with `record`, so history and duplicate checks are
+    current without a round trip. Items deleted on the server are not seen
+    by an incremental sync; `sync(full=True)` rebuilds the ledger.
+    """
+
+    def __init__(self, youtrack_service: YouTrackService, base_dir: str):
+        self.__youtrack_service = youtrack_service
+        self.__path = os.path.join(base_dir, LEDGER_FILE_NAME)
+        self.__lock = threading.Lock()
+        self.__sync_lock = threading.Lock()
+        self.__connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # callers hold self.__lock
+        if self.__connection is None:
+            os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+            connection = sqlite3.connect(self.__path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self.__connection = connection
+        return self.__connection
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+
+    def sync(self, full: bool = False) -> int:
+        """Pull items updated since the cursor. Returns the number of rows written."""
+        with self.__sync_lock:
+            if full:
+                with self.__lock:
+                    connection = self._connect()
+                    with connection:
+                        connection.execute("DELETE FROM work_items")
+                        connection.execute("DELETE FROM sync_state")
+
+            cursor = self.cursor()
+            written = skip = newest = 0
+            while True:
+                page = self.__youtrack_service.get_my_work_items(
+                    updated_since=cursor, skip=skip, top=SYNC_PAGE_SIZE
+                )
+                if not page:
+                    break
+                written += self._upsert(page)
+                newest = max([newest] + [item.updated or 0 for item in page])
+                if len(page) < SYNC_PAGE_SIZE:
+                    break
+                skip += len(page)
+
+            # pages are not ordered by `updated`; move the cursor only once complete
+            if newest > cursor:
+                with self.__lock:
+                    connection = self._connect()
+                    with connection:
+                        connection.execute(
+                            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+                            (_CURSOR_KEY, newest),
+                        )
+
+            logger.info(f"Work item ledger synced: {written} item(s) since {cursor}")
+            return written
+
+    def record(self, issue_id: str, item: IssueWorkItem) -> None:
+        """Store a work item this client just booked."""
+        self._upsert([item], issue_id=issue_id)
+
+    def cursor(self) -> int:
+        with self.__lock:
+            row = self._connect().execute(
+                "SELECT value FROM sync_state WHERE key = ?", (_CURSOR_KEY,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def entries(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        issue_id: Optional[str] = None,
+    ) -> List[LedgerEntry]:
+        """Entries with ``start <= date < end`` (epoch millis), oldest first."""
+        clauses, params = self._date_range(start, end)
+        if issue_id:
+            clauses.append("issue_id = ?")
+            params.append(issue_id.upper())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self.__lock:
+            rows = self._connect().execute(
+                f"SELECT {_COLUMNS} FROM work_items {where} ORDER BY date, created",
+                params,
+            ).fetchall()
+        return [self._to_entry(row) for row in rows]
+
+    def report_rows(
+        self, start: Optional[int] = None, end: Optional[int] = None
+    ) -> List[Tuple[int, int, str, Optional[str]]]:
+        """Plain ``(date, minutes, issue_id, type_name)`` tuples for bulk reporting."""
+        clauses, params = self._date_range(start, end)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self.__lock:
+            return self._connect().execute(
+                f"SELECT date, minutes, issue_id, type_name FROM work_items {where}",
+                params,
+            ).fetchall()
+
+    def find_duplicates(
+        self, issue_id: str, date_millis: int, minutes: int, text: Optional[str] = None
+    ) -> List[LedgerEntry]:
+        """
+        Entries on the same issue and day with the same duration and text.
+        *date_millis* is the form's local midnight; stored dates are UTC days.
+        """
+        day = datetime.fromtimestamp(date_millis / 1000).date()
+        utc_day = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+        start = int(utc_day.timestamp() * 1000)
+        end = start + DAY_MS
+        return [
+            entry
+            for entry in self.entries(start, end, issue_id)
+            if entry.minutes == minutes and (entry.text or None) == (text or None)
+        ]
+
+    @staticmethod
+    def _date_range(start: Optional[int], end: Optional[int]) -> Tuple[list, list]:
+        clauses, params = [], []
+        if start is not None:
+            clauses.append("date >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("date < ?")
+            params.append(end)
+        return clauses, params
+
+    def _upsert(
+        self, items: Iterable[IssueWorkItem], issue_id: Optional[str] = None
+    ) -> int:
+        rows = []
+        for item in items:
+            target_id = issue_id or (item.issue.idReadable if item.issue else None)
+            if not item.id or not target_id or item.date is None:
+                continue
+            rows.append(
+                (
+                    item.id,
+                    target_id.upper(),
+                    item.issue.summary if item.issue else None,
+                    item.date,
+                    item.duration.minutes if item.duration else 0,
+                    item.text,
+                    item.type.name if item.type else None,
+                    item.created,
+                    item.updated,
+                )
+            )
+
+        with self.__lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    f"INSERT OR REPLACE INTO work_items ({_COLUMNS}) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        return len(rows)
+
+    @staticmethod
+    def _to_entry(row: tuple) -> LedgerEntry:
+        return LedgerEntry(**dict(zip(_COLUMN_NAMES, row)))
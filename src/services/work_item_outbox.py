@@ -0,0 +1,320 @@
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+from datetime import date, datetime, timezone
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+import requests
+
+from errors.user_error import UserError
+from models.general_requests import AddSpentTimeRequest
+from models.general_responses import IssueWorkItem
+from models.outbox_entry import OutboxEntry
+from services.task_executor import TaskExecutor, TaskPriority
+from services.youtrack_service import YouTrackService
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_DIR_NAME = "outbox"
+BASE_BACKOFF_S = 5.0
+MAX_BACKOFF_S = 300.0
+# server clocks drift; a booked item may carry a `created` slightly before ours
+_CREATED_SKEW_MS = 5 * 60 * 1000
+WORK_ITEM_PAGE_SIZE = 200
+
+OutboxCallback = Callable[[OutboxEntry], None]
+
+
+class WorkItemOutbox:
+    """
+    Durable queue for work-item submissions.
+
+    `enqueue` only writes a journal file, so logging time never waits on the
+    network. Entries are delivered on the shared executor with at most
+    *max_in_flight* POSTs at once. Network failures, 429 and 5xx answers are
+    retried with exponential backoff; other 4xx answers reject the entry.
+    Entries left over from earlier sessions are replayed by `start`.
+
+    Each entry has an idempotency key and attempts are journaled before
+    sending. YouTrack has no idempotent POST, so before a retry the issue's
+    work items are checked for one this user already booked on the same
+    day with the same duration and text after the entry was created. That covers POSTs
+    that landed but whose response was lost, and crashes mid-delivery.
+    """
+
+    def __init__(
+        self,
+        youtrack_service: YouTrackService,
+        task_executor: TaskExecutor,
+        base_dir: str,
+        max_in_flight: int = 2,
+    ):
+        self.__youtrack_service = youtrack_service
+        self.__task_executor = task_executor
+        self.__directory = os.path.join(base_dir, OUTBOX_DIR_NAME)
+        self.__max_in_flight = max(1, max_in_flight)
+        self.__lock = threading.Lock()
+        self.__entries: Dict[str, OutboxEntry] = {}
+        self.__in_flight: Set[str] = set()
+        self.__timer: Optional[threading.Timer] = None
+        self.__user_login: Optional[str] = None
+        self.__stopped = False
+        self.__on_delivered: Optional[OutboxCallback] = None
+        self.__on_rejected: Optional[OutboxCallback] = None
+        self.__on_retry: Optional[OutboxCallback] = None
+
+    def bind_listener(
+        self,
+        on_delivered: OutboxCallback,
+        on_rejected: OutboxCallback,
+        on_retry: OutboxCallback,
+    ) -> None:
+        """Callbacks run on worker threads; hand them over to the UI yourself."""
+        self.__on_delivered = on_delivered
+        self.__on_rejected = on_rejected
+        self.__on_retry = on_retry
+
+    def start(self) -> None:
+        """Load journaled entries from earlier sessions and start delivering."""
+        loaded = self._load_journal()
+        with self.__lock:
+            for entry in loaded:
+                self.__entries.setdefault(entry.idempotency_key, entry)
+        if loaded:
+            logger.info(f"Replaying {len(loaded)} journaled work item(s)")
+        self.flush()
+
+    def shutdown(self) -> None:
+        with self.__lock:
+            self.__stopped = True
+            if self.__timer:
+                self.__timer.cancel()
+                self.__timer = None
+
+    def enqueue(self, issue_id: str, request: AddSpentTimeRequest) -> OutboxEntry:
+        entry = OutboxEntry(
+            idempotency_key=uuid.uuid4().hex,
+            issue_id=issue_id,
+            request=request,
+            created_at=int(time.time() * 1000),
+        )
+        self._write_entry(entry)
+        with self.__lock:
+            self.__entries[entry.idempotency_key] = entry
+        self.flush()
+        return entry
+
+    def pending_count(self) -> int:
+        with self.__lock:
+            return sum(
+                1 for entry in self.__entries.values() if entry.status == "pending"
+            )
+
+    def flush(self) -> None:
+        """Dispatch due entries up to the in-flight limit; schedule the rest."""
+        with self.__lock:
+            if self.__stopped:
+                return
+            now = time.time()
+            pending = sorted(
+                (
+                    entry
+                    for entry in self.__entries.values()
+                    if entry.status == "pending"
+                    and entry.idempotency_key not in self.__in_flight
+                ),
+                key=lambda entry: entry.next_attempt_at,
+            )
+            to_send: List[OutboxEntry] = []
+            for entry in pending:
+                if len(self.__in_flight) >= self.__max_in_flight:
+                    break
+                if entry.next_attempt_at > now:
+                    break
+                self.__in_flight.add(entry.idempotency_key)
+                to_send.append(entry)
+
+            waiting = [
+                entry.next_attempt_at
+                for entry in pending
+                if entry.idempotency_key not in self.__in_flight
+            ]
+            if self.__timer:
+                self.__timer.cancel()
+                self.__timer = None
+            if waiting and len(self.__in_flight) < self.__max_in_flight:
+                self.__timer = threading.Timer(max(0.0, min(waiting) - now), self.flush)
+                self.__timer.daemon = True
+                self.__timer.start()
+
+        for entry in to_send:
+            self.__task_executor.submit(
+                self._deliver, entry.idempotency_key, priority=TaskPriority.BACKGROUND
+            )
+
+    def _deliver(self, key: str) -> None:
+        with self.__lock:
+            entry = self.__entries.get(key)
+        if entry is None:
+            return
+
+        # journal the attempt before sending, so a crash mid-POST is detected
+        with self.__lock:
+            may_be_booked = entry.attempts > 0
+            entry.attempts += 1
+        self._write_entry(entry)
+
+        try:
+            booked = self._find_booked(entry) if may_be_booked else None
+            if booked:
+                logger.info(f"Work item {key} was already booked; not resending")
+            else:
+                booked = self.__youtrack_service.add_spent_time(
+                    entry.issue_id, entry.request
+                )
+            with self.__lock:
+                entry.work_item = booked
+        except requests.RequestException as e:
+            # includes HTTPError for 429 and 5xx answers to the POST
+            self._schedule_retry(entry, str(e))
+            return
+        except UserError as e:
+            self._reject(entry, e.message)
+            return
+        except BaseException as e:
+            # cancelled by shutdown or unexpected; retry, the journal keeps the entry
+            try:
+                self._schedule_retry(entry, str(e) or type(e).__name__)
+            finally:
+                with self.__lock:
+                    self.__in_flight.discard(key)
+            raise
+
+        self._remove_entry(entry)
+        with self.__lock:
+            self.__entries.pop(key, None)
+            self.__in_flight.discard(key)
+        if self.__on_delivered:
+            self.__on_delivered(entry)
+        self.flush()
+
+    def _find_booked(self, entry: OutboxEntry) -> Optional[IssueWorkItem]:
+        if self.__user_login is None:
+            user = self.__youtrack_service.get_user_info()
+            self.__user_login = user.login if user else ""
+
+        request = entry.request
+        request_days = self._days_of_request(request.date)
+        for item in self._iter_work_items(entry.issue_id):
+            if (
+                item.date is not None
+                and self._day_of_item(item.date) in request_days
+                and item.duration
+                and item.duration.minutes == request.duration.minutes
+                and (item.text or None) == (request.text or None)
+                and (item.created or 0) >= entry.created_at - _CREATED_SKEW_MS
+                and (
+                    not self.__user_login
+                    or (item.author and item.author.login == self.__user_login)
+                )
+            ):
+                return item
+        return None
+
+    def _iter_work_items(self, issue_id: str) -> Iterator[IssueWorkItem]:
+        """All of the issue's work items; a busy issue has more than one page."""
+        skip = 0
+        while True:
+            page = self.__youtrack_service.get_work_items(
+                issue_id, skip=skip, top=WORK_ITEM_PAGE_SIZE
+            ) or []
+            yield from page
+            if len(page) < WORK_ITEM_PAGE_SIZE:
+                return
+            skip += len(page)
+
+    @staticmethod
+    def _days_of_request(date_millis: int) -> Set[date]:
+        """
+        The form sends local midnight; YouTrack keeps only the day. Accept
+        the local and the UTC reading, which differ for zones east of UTC.
+        """
+        return {
+            datetime.fromtimestamp(date_millis / 1000).date(),
+            datetime.fromtimestamp(date_millis / 1000, timezone.utc).date(),
+        }
+
+    @staticmethod
+    def _day_of_item(date_millis: int) -> date:
+        return datetime.fromtimestamp(date_millis / 1000, timezone.utc).date()
+
+    def _schedule_retry(self, entry: OutboxEntry, error: str) -> None:
+        with self.__lock:
+            backoff = min(MAX_BACKOFF_S, BASE_BACKOFF_S * 2 ** (entry.attempts - 1))
+            entry.next_attempt_at = time.time() + backoff * random.uniform(0.8, 1.2)
+            entry.last_error = error
+        logger.warning(
+            f"Work item {entry.idempotency_key} for {entry.issue_id} failed "
+            f"(attempt {entry.attempts}), retrying in {backoff:.0f}s: {error}"
+        )
+        self._write_entry(entry)
+        with self.__lock:
+            self.__in_flight.discard(entry.idempotency_key)
+        if self.__on_retry:
+            self.__on_retry(entry)
+        self.flush()
+
+    def _reject(self, entry: OutboxEntry, error: str) -> None:
+        """The server answered and refused; keep the entry on disk for the record."""
+        with self.__lock:
+            entry.status = "rejected"
+            entry.last_error = error
+        self._write_entry(entry)
+        with self.__lock:
+            self.__entries.pop(entry.idempotency_key, None)
+            self.__in_flight.discard(entry.idempotency_key)
+        if self.__on_rejected:
+            self.__on_rejected(entry)
+        self.flush()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.__directory, f"{key}.json")
+
+    def _write_entry(self, entry: OutboxEntry) -> None:
+        os.makedirs(self.__directory, exist_ok=True)
+        path = self._entry_path(entry.idempotency_key)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(entry.model_dump_json(by_alias=True))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    def _remove_entry(self, entry: OutboxEntry) -> None:
+        try:
+            os.remove(self._entry_path(entry.idempotency_key))
+        except FileNotFoundError:
+            pass
+
+    def _load_journal(self) -> List[OutboxEntry]:
+        if not os.path.isdir(self.__directory):
+            return []
+        entries = []
+        for file_name in sorted(os.listdir(self.__directory)):
+            if not file_name.endswith(".json"):
+                continue
+            try:
+                with open(
+                    os.path.join(self.__directory, file_name), encoding="utf-8"
+                ) as f:
+                    entry = OutboxEntry.model_validate_json(f.read())
+            except (OSError, ValueError) as e:
+                logger.error(f"Skipping unreadable outbox entry {file_name}: {e}")
+                continue
+            if entry.status == "pending":
+                entry.next_attempt_at = 0.0
+                entries.append(entry)
+        return entries
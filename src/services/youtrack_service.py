@@ -1,37 +1,122 @@
-from typing import List, Optional, TypeVar
+import threading
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Optional, TypeVar
 
 from services.http.http_client import HttpClient
 from models.general_responses import (
     Issue,
+    IssueSummary,
+    IssueWorkItem,
     Link,
     Project,
     StateBundleElement,
     User,
     WorkItem,
 )
-from constants.youtrack_queries import issue_query, bundle_query, link_query
+from constants.youtrack_queries import (
+    bundle_query,
+    issue_query,
+    link_query,
+    work_item_export_query,
+    work_item_query,
+)
 from models.general_requests import AddSpentTimeRequest
 from models.custom_models import CustomIssue
 from stores.store import Store
 
 T = TypeVar("T")
 
+# partial records harvested from issue and link responses
+PARTIAL_ISSUE_CACHE_SIZE = 1000
+
 
 class YouTrackService:
     def __init__(self, http_client: HttpClient, store: Store):
         self._http_service = http_client
         self._store = store
         self._request = http_client.request
+        self._partial_issues: "OrderedDict[str, CustomIssue]" = OrderedDict()
+        self._partial_issues_lock = threading.Lock()
 
     def add_spent_time(
         self, issue_id: Optional[str], add_spent_time_request: AddSpentTimeRequest
-    ) -> None:
-        self._request(
+    ) -> Optional[IssueWorkItem]:
+        """Returns the work item as booked by the server."""
+        return self._request(
             method="post",
             endpoint=f"issues/{issue_id}/timeTracking/workItems",
             json=add_spent_time_request.model_dump(exclude_none=True),
+            params={"fields": work_item_query},
+            response_model=IssueWorkItem,
+        )
+
+    def get_work_items(
+        self, issue_id: str, skip: int = 0, top: int = 200
+    ) -> List[IssueWorkItem]:
+        """One page of the issue's work items (YouTrack caps unpaged lists)."""
+        return self._request(
+            endpoint=f"issues/{issue_id}/timeTracking/workItems",
+            params={
+                "fields": "id,created,date,text,duration(minutes),author(id,login)",
+                "$skip": skip,
+                "$top": top,
+            },
+            response_model=List[IssueWorkItem],
+            use_cache=False,
+        )
+
+    def get_my_work_items(
+        self, updated_since: int = 0, skip: int = 0, top: int = 200
+    ) -> List[IssueWorkItem]:
+        """Page through the current user's work items updated at or after *updated_since* (ms)."""
+        params = {"author": "me", "fields": work_item_query, "$skip": skip, "$top": top}
+        if updated_since:
+            params["updatedStart"] = updated_since
+        return self._request(
+            endpoint="workItems",
+            params=params,
+            response_model=List[IssueWorkItem],
+            use_cache=False,
         )
 
+    def iter_work_item_pages(
+        self,
+        start_date: str,
+        end_date: str,
+        author: Optional[str] = None,
+        query: Optional[str] = None,
+        page_size: int = 500,
+    ) -> Iterator[List[dict]]:
+        """
+        Lazily page through work items dated ``start_date..end_date``
+        (``YYYY-MM-DD``, inclusive) as raw JSON, one list per page.
+        Pages are neither validated nor cached, so callers can stream them.
+        """
+        params = {
+            "fields": work_item_export_query,
+            "startDate": start_date,
+            "endDate": end_date,
+            "$top": page_size,
+        }
+        if author:
+            params["author"] = author
+        if query:
+            params["query"] = query
+
+        skip = 0
+        while True:
+            page = self._request(
+                endpoint="workItems",
+                params={**params, "$skip": skip},
+                use_cache=False,
+            )
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            skip += len(page)
+
     def get_user_info(self) -> Optional[User]:
         return self._request(
             endpoint="users/me",
@@ -46,7 +131,31 @@ class YouTrackService:
             response_model=Issue,
         )
         links = self._get_issue_links(issue_id)
-        return CustomIssue(**issue.model_dump(), links=links)
+        custom_issue = CustomIssue(**issue.model_dump(), links=links)
+        self._remember_partial_issues(custom_issue.embedded_issues)
+        return custom_issue
+
+    def get_partial_issue(self, issue_id: str) -> Optional[CustomIssue]:
+        """
+        What earlier responses embedded about *issue_id* (summary, project,
+        fields), without a request. ``None`` if it was never seen.
+        """
+        with self._partial_issues_lock:
+            return self._partial_issues.get(issue_id.upper())
+
+    def _remember_partial_issues(
+        self, issues: Iterable[CustomIssue], replace: bool = True
+    ) -> None:
+        """*replace* False only fills gaps, so a richer record is kept."""
+        with self._partial_issues_lock:
+            for issue in issues:
+                key = issue.idReadable.upper()
+                if key in self._partial_issues and not replace:
+                    continue
+                self._partial_issues.pop(key, None)
+                self._partial_issues[key] = issue
+            while len(self._partial_issues) > PARTIAL_ISSUE_CACHE_SIZE:
+                self._partial_issues.popitem(last=False)
 
     def get_all_projects(self) -> List[Project]:
         return self._request(
@@ -77,6 +186,41 @@ class YouTrackService:
             response_model=List[StateBundleElement],
         )
 
+    def search_issues(
+        self, query: str, skip: int = 0, top: int = 50
+    ) -> List[IssueSummary]:
+        """Issues matching a YouTrack search *query*, lightest fields only."""
+        return self._request(
+            endpoint="issues",
+            params={
+                "query": query,
+                "fields": "id,idReadable,summary,resolved,updated,project(id,shortName)",
+                "$skip": skip,
+                "$top": top,
+            },
+            response_model=List[IssueSummary],
+            use_cache=False,
+        )
+
+    def get_link_issues(
+        self, issue_id: str, link_id: str, skip: int = 0, top: int = 50
+    ) -> List[IssueSummary]:
+        """Page through the issues of one link (e.g. all subtasks of an epic)."""
+        issues = self._request(
+            endpoint=f"issues/{issue_id}/links/{link_id}/issues",
+            params={
+                "fields": "id,idReadable,summary,resolved,updated,project(id,shortName)",
+                "$skip": skip,
+                "$top": top,
+            },
+            response_model=List[IssueSummary],
+            use_cache=False,
+        )
+        self._remember_partial_issues(
+            (CustomIssue.partial(issue) for issue in issues or []), replace=False
+        )
+        return issues
+
     def _get_issue_links(self, issue_id: str) -> List[Link]:
         return self._request(
             endpoint=f"issues/{issue_id}/links",
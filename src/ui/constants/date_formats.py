@@ -0,0 +1,10 @@
+# tkcalendar date patterns mapped to strptime formats; kept free of Tk so
+# configs can be loaded headless
+DATE_FORMAT_MAP = {
+    "dd/mm/yyyy": "%d/%m/%Y",
+    "mm/dd/yyyy": "%m/%d/%Y",
+    "yyyy/mm/dd": "%Y/%m/%d",
+    "dd-mm-yyyy": "%d-%m-%Y",
+    "mm-dd-yyyy": "%m-%d-%Y",
+    "yyyy-mm-dd": "%Y-%m-%d",
+}
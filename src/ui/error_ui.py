@@ -2,8 +2,11 @@ import tkinter as tk
 
 
 def display_error_dialog(message: str) -> None:
-    root = tk.Tk()
-    root.withdraw()
+    # reuse the app's Tk root when it exists instead of initializing Tk again
+    app_root = getattr(tk, "_default_root", None)
+    root = app_root or tk.Tk()
+    if app_root is None:
+        root.withdraw()
 
     error_window = tk.Toplevel(root)
     error_window.title("Error")
@@ -29,10 +32,11 @@ def display_error_dialog(message: str) -> None:
         try:
             error_window.destroy()
         finally:
-            try:
-                root.destroy()
-            except Exception:
-                pass
+            if app_root is None:
+                try:
+                    root.destroy()
+                except Exception:
+                    pass
 
     close_button = tk.Button(error_window, text="OK", command=_close_all)
     close_button.pack(pady=10)
@@ -49,6 +53,10 @@ def display_error_dialog(message: str) -> None:
     error_window.bind("<Return>", lambda event: _close_all())
     error_window.bind("<Escape>", lambda event: _close_all())
 
+    if app_root is not None:
+        error_window.wait_window()
+        return
+
     try:
         root.mainloop()
     finally:
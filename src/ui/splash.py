@@ -1,45 +1,52 @@
 import tkinter as tk
-from typing import Optional, Callable
+from typing import Optional
 
 
 class Splash:
-    def __init__(self, message: str = "Starting Fast YouTrack..."):
-        self._root: Optional[tk.Tk] = None
+    """Startup splash drawn as a Toplevel of the app's single Tk root."""
+
+    def __init__(
+        self,
+        master: Optional[tk.Misc] = None,
+        message: str = "Starting Fast YouTrack...",
+    ):
+        self._master = master
+        self._window: Optional[tk.Toplevel] = None
         self._message = message
 
-    def show(self) -> None:
-        if self._root is not None:
+    def show(self, master: Optional[tk.Misc] = None) -> None:
+        """Draw on *master*, or on the one given at construction."""
+        if self._window is not None:
             return
-        root = tk.Tk()
-        root.title("Fast YouTrack")
-        root.geometry("300x100")
-        root.configure(bg="#2E8B57")
-        root.resizable(False, False)
-        root.attributes("-topmost", True)
-        root.update_idletasks()
-        x = (root.winfo_screenwidth() // 2) - (300 // 2)
-        y = (root.winfo_screenheight() // 2) - (100 // 2)
-        root.geometry(f"+{x}+{y}")
+        self._master = master or self._master
+        window = tk.Toplevel(self._master)
+        window.title("Fast YouTrack")
+        window.geometry("300x100")
+        window.configure(bg="#2E8B57")
+        window.resizable(False, False)
+        window.attributes("-topmost", True)
+        window.update_idletasks()
+        x = (window.winfo_screenwidth() // 2) - (300 // 2)
+        y = (window.winfo_screenheight() // 2) - (100 // 2)
+        window.geometry(f"+{x}+{y}")
 
         label = tk.Label(
-            root,
+            window,
             text=self._message,
             bg="#2E8B57",
             fg="#E0FFE0",
             font=("Arial", 13, "bold"),
         )
         label.pack(expand=True)
-        self._root = root
+        self._window = window
 
         # do not block here; caller decides mainloop strategy
-        root.update()
+        window.update()
 
     def close(self) -> None:
-        if self._root is None:
+        if self._window is None:
             return
         try:
-            self._root.destroy()
+            self._window.destroy()
         finally:
-            self._root = None
-
-
+            self._window = None
@@ -0,0 +1,112 @@
+import functools
+import logging
+import threading
+from typing import Callable, Optional
+
+from PIL import Image, ImageDraw
+from pystray import Icon, Menu, MenuItem
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def _tray_image() -> Image.Image:
+    icon_size = (64, 64)
+    image = Image.new("RGB", icon_size, (0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((10, 10, 54, 54), fill=(255, 0, 0))
+    return image
+
+
+class TrayIconService:
+    """
+    A single system tray icon for the lifetime of the process.
+
+    The icon and its thread are created on the first `show()`. After that,
+    minimize and restore only toggle its visibility. Menu callbacks run on
+    the tray thread, so callers must hand them over to Tk themselves.
+    """
+
+    def __init__(
+        self,
+        app_name: str,
+        title: str,
+        on_show: Callable[[], None],
+        on_exit: Callable[[], None],
+    ):
+        self.__app_name = app_name
+        self.__title = title
+        self.__on_show = on_show
+        self.__on_exit = on_exit
+        self.__lock = threading.Lock()
+        self.__icon: Optional[Icon] = None
+        self.__thread: Optional[threading.Thread] = None
+        self.__ready = False
+        self.__visible = False
+
+    @property
+    def visible(self) -> bool:
+        return self.__visible
+
+    def show(self) -> None:
+        self._set_visible(True)
+
+    def hide(self) -> None:
+        self._set_visible(False)
+
+    def stop(self) -> None:
+        with self.__lock:
+            icon, self.__icon = self.__icon, None
+            self.__ready = False
+            self.__visible = False
+        if icon:
+            try:
+                icon.stop()
+            except Exception as e:
+                logger.debug(f"Failed to stop tray icon: {e}")
+
+    def _set_visible(self, visible: bool) -> None:
+        with self.__lock:
+            if self.__visible == visible and (self.__icon or not visible):
+                return
+            self.__visible = visible
+            if self.__icon is None:
+                if visible:
+                    self._start()
+                return
+            if not self.__ready:
+                return  # _on_ready applies the latest state
+            icon = self.__icon
+        self._apply_visibility(icon)
+
+    def _start(self) -> None:
+        logger.debug("Starting tray icon thread")
+        menu = Menu(
+            MenuItem("Show", self._on_show_clicked, default=True, visible=False),
+            MenuItem("Exit", self._on_exit_clicked),
+        )
+        self.__icon = Icon(self.__app_name, _tray_image(), self.__title, menu)
+        self.__thread = threading.Thread(
+            target=self.__icon.run, kwargs={"setup": self._on_ready}, daemon=True
+        )
+        self.__thread.start()
+
+    def _on_ready(self, icon: Icon) -> None:
+        with self.__lock:
+            self.__ready = True
+        self._apply_visibility(icon)
+
+    def _apply_visibility(self, icon: Icon) -> None:
+        try:
+            if icon.visible != self.__visible:
+                icon.visible = self.__visible
+        except Exception as e:
+            logger.debug(f"Failed to toggle tray icon visibility: {e}")
+
+    def _on_show_clicked(self, icon=None, item=None) -> None:
+        self.hide()
+        self.__on_show()
+
+    def _on_exit_clicked(self, icon=None, item=None) -> None:
+        self.stop()
+        self.__on_exit()
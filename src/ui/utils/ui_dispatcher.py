@@ -0,0 +1,79 @@
+import logging
+import threading
+import tkinter as tk
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+FRAME_MS = 16
+LOADING_KEY = "loading"
+
+
+class UiDispatcher:
+    """
+    Thread-safe handoff of UI updates to the Tk thread.
+
+    Updates posted under the same key within a frame are merged (latest wins)
+    and applied in one pump per frame. Loading state is reference-counted so
+    overlapping tasks keep a single overlay up instead of toggling it.
+    """
+
+    def __init__(
+        self,
+        widget: tk.Misc,
+        on_loading_changed: Optional[Callable[[bool], None]] = None,
+        frame_ms: int = FRAME_MS,
+    ):
+        self.__widget = widget
+        self.__on_loading_changed = on_loading_changed
+        self.__frame_ms = frame_ms
+        self.__lock = threading.Lock()
+        self.__pending: "OrderedDict[Hashable, Callable[[], None]]" = OrderedDict()
+        self.__pump_scheduled = False
+        self.__loading_count = 0
+
+    def post(self, key: Optional[Hashable], callback: Callable[[], None]) -> None:
+        """Apply *callback* on the next frame; a ``None`` key is never merged."""
+        key = object() if key is None else key
+        with self.__lock:
+            self.__pending.pop(key, None)
+            self.__pending[key] = callback
+            if self.__pump_scheduled:
+                return
+            self.__pump_scheduled = True
+        try:
+            self.__widget.after(self.__frame_ms, self._pump)
+        except (RuntimeError, tk.TclError):
+            # widget is gone (app exiting); drop the update
+            with self.__lock:
+                self.__pump_scheduled = False
+
+    def begin_loading(self) -> None:
+        with self.__lock:
+            self.__loading_count += 1
+        self.post(LOADING_KEY, self._apply_loading)
+
+    def end_loading(self) -> None:
+        with self.__lock:
+            self.__loading_count = max(0, self.__loading_count - 1)
+        self.post(LOADING_KEY, self._apply_loading)
+
+    def _apply_loading(self) -> None:
+        with self.__lock:
+            is_loading = self.__loading_count > 0
+        if self.__on_loading_changed:
+            self.__on_loading_changed(is_loading)
+
+    def _pump(self) -> None:
+        with self.__lock:
+            pending = self.__pending
+            self.__pending = OrderedDict()
+            self.__pump_scheduled = False
+
+        for callback in pending.values():
+            try:
+                callback()
+            except Exception as e:
+                logger.exception("UI update failed: %s", e)
+                self.__widget.report_callback_exception(type(e), e, e.__traceback__)
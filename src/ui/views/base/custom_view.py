@@ -7,6 +7,7 @@ from typing import Literal, Optional, TypeVar
 
 from ui.views.base.custom_view_config import CustomViewConfig
 from ui.constants.tk_events import TkEvents
+from utils import wakeup_stats
 
 
 logger = logging.getLogger(__name__)
@@ -25,6 +26,7 @@ class CustomView(tk.Toplevel):
         self._hide()  # hide view to avoid flickering
         self.__is_loading = False
         self.__loading_overlay = None
+        self.__flash_job: Optional[str] = None
 
     def update_value(self, value: T) -> None:
         """Update the view with a new value.
@@ -143,6 +145,18 @@ class CustomView(tk.Toplevel):
             target_color = FLASH_COLOR_MAP.get(flash_color, FLASH_COLOR_MAP["yellow"])
             bg_color = self._config.bg_color or self.cget("bg")
 
+            if self.__flash_job:
+                self.after_cancel(self.__flash_job)
+                self.__flash_job = None
+
+            if not self.winfo_viewable():
+                # nobody would see the animation; settle on the final state
+                self.configure(
+                    highlightthickness=BORDER_WIDTH,
+                    highlightbackground=bg_color,
+                )
+                return
+
             if not bg_color.startswith("#"):
                 rgb_tuple = self.winfo_rgb(bg_color)
                 bg_color = f"#{rgb_tuple[0]//256:02x}{rgb_tuple[1]//256:02x}{rgb_tuple[2]//256:02x}"
@@ -168,7 +182,9 @@ class CustomView(tk.Toplevel):
                     return bg_color
 
             def fade_step(step: int = 0):
-                if step > STEPS:
+                self.__flash_job = None
+                wakeup_stats.record("flash_step")
+                if step > STEPS or not self.winfo_viewable():
                     self.configure(
                         highlightthickness=BORDER_WIDTH,
                         highlightbackground=bg_color,
@@ -187,13 +203,7 @@ class CustomView(tk.Toplevel):
                     logging.error(f"Widget update failed: {e}")
                     return
 
-                self.after(DELAY, lambda: fade_step(step + 1))
-
-            try:
-                for after_id in self.tk.eval("after info").split():
-                    self.after_cancel(int(after_id))
-            except Exception:
-                pass
+                self.__flash_job = self.after(DELAY, lambda: fade_step(step + 1))
 
             fade_step(0)
 
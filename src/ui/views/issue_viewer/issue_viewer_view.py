@@ -1,16 +1,28 @@
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple, Union
 import logging
 
 from models.custom_models import CustomIssue
+from models.general_responses import IssueSummary
 from ui.views.base.custom_view import CustomView
 from ui.views.base.custom_view_config import CustomViewConfig
+from ui.widgets.virtual_list import VirtualList, VirtualListConfig
+from utils.rich_text import TextRun, render_issue_description
 
 logger = logging.getLogger(__name__)
 
+LINK_PAGE_SIZE = 50
+TEXT_CHUNK_CHARS = 8 * 1024
+TEXT_RENDER_CAP_CHARS = 64 * 1024
+
 
 class IssueViewerView(CustomView):
+    """
+    Shows issue details in a widget tree that is built once and then
+    updated in place; only sections and field rows that changed are touched.
+    """
+
     def __init__(
         self,
         issue: Optional[CustomIssue] = None,
@@ -18,51 +30,222 @@ class IssueViewerView(CustomView):
     ):
         super().__init__(config=config)
         self.__issue: Optional[CustomIssue] = issue
+        self.__parent: Optional[tk.Frame] = None
+        self.__empty_label: Optional[tk.Label] = None
+        self.__created_by_label: Optional[tk.Label] = None
+        self.__updated_by_label: Optional[tk.Label] = None
+        self.__summary_widgets: Tuple[tk.Widget, ...] = ()
+        self.__summary_text: Optional[tk.Text] = None
+        self.__description_widgets: Tuple[tk.Widget, ...] = ()
+        self.__description_text: Optional[tk.Text] = None
+        self.__fields_widgets: Tuple[tk.Widget, ...] = ()
+        self.__fields_frame: Optional[tk.Frame] = None
+        self.__field_rows: Dict[str, Tuple[tk.Frame, tk.Label]] = {}
+        self.__field_order: List[str] = []
+        self.__subtasks_frame: Optional[tk.Frame] = None
+        self.__subtasks_header: Optional[tk.Label] = None
+        self.__subtasks_list: Optional[VirtualList] = None
+        self.__subtask_ids: List[str] = []
+        self.__subtask_total = 0
+        # [link_id, loaded, total] per subtask link, in display order
+        self.__subtask_pages: List[list] = []
+        self.__page_pending = False
+        self.__on_issue_selected: Optional[Callable[[str], None]] = None
+        self.__on_load_link_page: Optional[Callable[[str, str, int, int], None]] = None
+        self.__text_cache: Dict[str, List[TextRun]] = {}
+        self.__text_jobs: Dict[str, str] = {}
+        self.__full_text_link: Optional[tk.Label] = None
+        self.__full_description_issue_id: Optional[str] = None
+
+    @property
+    def shown_issue_id(self) -> Optional[str]:
+        return self.__issue.idReadable if self.__issue else None
 
     def update_value(self, issue: Optional[CustomIssue] = None) -> None:
         """Update the view with new issue details."""
         self.__issue = issue
-        self._build_ui()
-        self.update_idletasks()
+        if self.__parent is None:
+            return  # not built yet; _populate_widgets renders the latest issue
+        self._render_issue()
         self._flash_update(flash_color="red" if issue is None else "green")
 
     def _populate_widgets(self, parent: tk.Frame) -> None:
         parent.config(bg=self._config.bg_color)
         parent.grid_columnconfigure(0, weight=1)
+        self.__parent = parent
+        self.__field_rows.clear()
+        self.__field_order = []
+        self.__text_cache.clear()
+        self.__subtask_ids = []
+        self.__subtask_total = 0
+
+        self.__empty_label = tk.Label(
+            parent,
+            text="No issue to display",
+            font=("Segoe UI", 12, "bold"),
+            bg=self._config.bg_color,
+            fg=self._config.text_color,
+        )
+        self.__empty_label.grid(row=0, column=0, pady=20, padx=10)
 
-        row = 0
+        self.__created_by_label = self._add_label(parent, "", row=1)
+        self.__updated_by_label = self._add_label(parent, "", row=2)
 
-        if self.__issue is None:
-            label = tk.Label(
-                parent,
-                text="No issue to display",
-                font=("Segoe UI", 12, "bold"),
-                bg=self._config.bg_color,
-                fg=self._config.text_color,
-            )
-            label.grid(row=row, column=0, pady=20, padx=10)
-            return
+        summary_label = self._add_label(parent, "Summary:", row=3)
+        summary_frame, self.__summary_text = self._add_text_box(parent, row=4, height=3)
+        self.__summary_widgets = (summary_label, summary_frame)
+
+        description_label = self._add_label(parent, "Description:", row=5)
+        description_frame, self.__description_text = self._add_text_box(
+            parent, row=6, height=5
+        )
+        self.__description_widgets = (description_label, description_frame)
+
+        self.__full_text_link = tk.Label(
+            description_frame,
+            text="",
+            font=("Segoe UI", 9, "underline"),
+            bg=self._config.bg_color,
+            fg=self._config.text_color,
+            cursor="hand2",
+        )
+        self.__full_text_link.grid(row=1, column=0, sticky="w")
+        self.__full_text_link.grid_remove()
+        self.__full_text_link.bind("<Button-1>", self._on_show_full_description)
 
-        if self.__issue.reporter:
-            created_by_text = f"Created by: {self.__issue.reporter.name}"
-            self._add_label(parent, created_by_text, row)
-            row += 1
+        fields_label = self._add_label(parent, "Fields:", row=7)
+        self.__fields_frame = tk.Frame(parent, bg=self._config.bg_color)
+        self.__fields_frame.grid(row=8, column=0, sticky="ew")
+        self.__fields_frame.grid_columnconfigure(0, weight=1)
+        self.__fields_widgets = (fields_label, self.__fields_frame)
 
-        if self.__issue.updater and self.__issue.updater.name:
-            updated_by_text = f"Updated by: {self.__issue.updater.name}"
-            self._add_label(parent, updated_by_text, row)
-            row += 1
+        self._add_subtasks_section(parent, row=9)
 
-        row = self._add_summary_section(parent, row)
-        row = self._add_description_section(parent, row)
+        self._render_issue()
 
-        if self.__issue.fields:
-            self._add_fields_section(parent, row)
+    def _render_issue(self) -> None:
+        issue = self.__issue
+        self._set_visible((self.__empty_label,), issue is None)
+
+        reporter = issue.reporter.name if issue and issue.reporter else None
+        self._set_label(
+            self.__created_by_label, reporter and f"Created by: {reporter}"
+        )
+        updater = issue.updater.name if issue and issue.updater else None
+        self._set_label(
+            self.__updated_by_label, updater and f"Updated by: {updater}"
+        )
+
+        summary = issue.summary if issue else None
+        self._set_visible(self.__summary_widgets, bool(summary))
+        self._set_text("summary", self.__summary_text, summary or "")
+
+        description = render_issue_description(issue)
+        self._set_visible(self.__description_widgets, bool(description))
+        show_full = bool(issue) and self.__full_description_issue_id == issue.idReadable
+        truncated = self._set_text(
+            "description",
+            self.__description_text,
+            description,
+            cap=None if show_full else TEXT_RENDER_CAP_CHARS,
+        )
+        if truncated:
+            size_kb = sum(len(text) for text, _ in description) // 1024
+            self.__full_text_link.config(text=f"Show full text ({size_kb} KB)")
+        self._set_visible((self.__full_text_link,), truncated)
+
+        self._update_fields_section(issue)
+        self._update_subtasks_section(issue)
+
+    def _set_visible(self, widgets: Tuple[tk.Widget, ...], visible: bool) -> None:
+        for widget in widgets:
+            if visible:
+                widget.grid()
+            else:
+                widget.grid_remove()
+
+    def _set_label(self, label: tk.Label, text: Optional[str]) -> None:
+        if text and label.cget("text") != text:
+            label.config(text=text)
+        self._set_visible((label,), bool(text))
+
+    def _set_text(
+        self,
+        key: str,
+        text_widget: tk.Text,
+        content: Union[str, List[TextRun]],
+        cap: Optional[int] = TEXT_RENDER_CAP_CHARS,
+    ) -> bool:
+        """
+        Replace the contents of a read-only Text widget if they changed.
+        *content* is plain text or tagged runs (see utils.rich_text). It is
+        cut to *cap* characters and inserted in idle-time chunks so large
+        pasted logs never block the main loop. Returns True if cut.
+        """
+        runs = [(content, ())] if isinstance(content, str) else content
+        visible_runs: List[TextRun] = []
+        remaining = cap
+        for text, tags in runs:
+            if remaining is not None:
+                text = text[:remaining]
+                remaining -= len(text)
+            if text:
+                visible_runs.append((text, tags))
+        truncated = cap is not None and sum(len(text) for text, _ in runs) > cap
+
+        if self.__text_cache.get(key) == visible_runs:
+            return truncated
+        self.__text_cache[key] = visible_runs
+
+        pending_job = self.__text_jobs.pop(key, None)
+        if pending_job:
+            self.after_cancel(pending_job)
+
+        text_widget.config(state=tk.NORMAL)
+        text_widget.delete("1.0", tk.END)
+        text_widget.config(state=tk.DISABLED)
+        self._insert_text_chunk(key, text_widget, self._chunk_runs(visible_runs), 0)
+        return truncated
+
+    @staticmethod
+    def _chunk_runs(runs: List[TextRun]) -> List[list]:
+        """Group runs into flat `Text.insert` argument lists of about one chunk each."""
+        chunks: List[list] = [[]]
+        size = 0
+        for text, tags in runs:
+            while text:
+                part = text[: TEXT_CHUNK_CHARS - size]
+                chunks[-1] += [part, tags]
+                size += len(part)
+                text = text[len(part) :]
+                if size >= TEXT_CHUNK_CHARS:
+                    chunks.append([])
+                    size = 0
+        return [chunk for chunk in chunks if chunk]
+
+    def _insert_text_chunk(
+        self, key: str, text_widget: tk.Text, chunks: List[list], index: int
+    ) -> None:
+        if index >= len(chunks):
+            self.__text_jobs.pop(key, None)
+            return
+        text_widget.config(state=tk.NORMAL)
+        text_widget.insert(tk.END, *chunks[index])
+        text_widget.config(state=tk.DISABLED)
+        if index + 1 < len(chunks):
+            self.__text_jobs[key] = self.after_idle(
+                self._insert_text_chunk, key, text_widget, chunks, index + 1
+            )
+        else:
+            self.__text_jobs.pop(key, None)
 
-        if self.__issue.links:
-            row = self._add_subtasks_section(parent, row)
+    def _on_show_full_description(self, _event=None) -> None:
+        if not self.__issue:
+            return
+        self.__full_description_issue_id = self.__issue.idReadable
+        self._render_issue()
 
-    def _add_label(self, parent: tk.Frame, text: str, row: int) -> None:
+    def _add_label(self, parent: tk.Frame, text: str, row: int) -> tk.Label:
         label = tk.Label(
             parent,
             text=text,
@@ -71,34 +254,9 @@ class IssueViewerView(CustomView):
             fg=self._config.text_color,
         )
         label.grid(row=row, column=0, sticky="nw", padx=10, pady=5)
+        return label
 
-    def _add_summary_section(self, parent: tk.Frame, row: int) -> int:
-        if not self.__issue or not self.__issue.summary:
-            return row
-
-        self._add_label(parent, "Summary:", row)
-        row += 1
-
-        return self._add_text_box(parent, self.__issue.summary, row, height=3)
-
-    def _add_description_section(self, parent: tk.Frame, row: int) -> int:
-        if not self.__issue or not self.__issue.description:
-            return row
-
-        self._add_label(parent, "Description:", row)
-        row += 1
-
-        return self._add_text_box(parent, self.__issue.description, row, height=5)
-
-    def _add_text_box(
-        self, parent: tk.Frame, text: str, row: int, height: int = 4
-    ) -> int:
-        """Add a scrollable text box."""
-        frame = tk.Frame(parent, bg=self._config.bg_color)
-        frame.grid(row=row, column=0, sticky="ew", padx=10, pady=5)
-        frame.grid_columnconfigure(0, weight=1)
-
-        scrollbar = ttk.Scrollbar(frame, orient="vertical")
+    def _text_kwargs(self) -> dict:
         text_kwargs = {}
         if self._config.bg_color:
             text_kwargs["bg"] = self._config.bg_color
@@ -106,16 +264,27 @@ class IssueViewerView(CustomView):
             text_kwargs["fg"] = self._config.text_color
             text_kwargs["insertbackground"] = self._config.text_color
             text_kwargs["disabledforeground"] = self._config.text_color
+        return text_kwargs
+
+    def _add_text_box(
+        self, parent: tk.Frame, row: int, height: int = 4
+    ) -> Tuple[tk.Frame, tk.Text]:
+        """Add an empty, read-only scrollable text box."""
+        frame = tk.Frame(parent, bg=self._config.bg_color)
+        frame.grid(row=row, column=0, sticky="ew", padx=10, pady=5)
+        frame.grid_columnconfigure(0, weight=1)
+
+        scrollbar = ttk.Scrollbar(frame, orient="vertical")
 
         text_widget = tk.Text(
             frame,
             height=height,
             wrap=tk.WORD,
             font=("Segoe UI", 9),
-            **text_kwargs,
+            **self._text_kwargs(),
         )
-        text_widget.insert("1.0", text)
         text_widget.config(state=tk.DISABLED)
+        self._configure_text_tags(text_widget)
 
         text_widget.grid(row=0, column=0, sticky="nsew")
         scrollbar.grid(row=0, column=1, sticky="ns")
@@ -123,102 +292,187 @@ class IssueViewerView(CustomView):
         scrollbar.config(command=text_widget.yview)
         text_widget.config(yscrollcommand=scrollbar.set)
 
-        return row + 1
-
-    def _add_fields_section(self, parent: tk.Frame, row: int) -> None:
-        self._add_label(parent, "Fields:", row)
-        row += 1
-
-        for field in self.__issue.fields:
+        return frame, text_widget
+
+    @staticmethod
+    def _configure_text_tags(text_widget: tk.Text) -> None:
+        """Tags produced by utils.rich_text."""
+        text_widget.tag_configure("bold", font=("Segoe UI", 9, "bold"))
+        text_widget.tag_configure("italic", font=("Segoe UI", 9, "italic"))
+        text_widget.tag_configure("heading", font=("Segoe UI", 10, "bold"))
+        text_widget.tag_configure("code", font=("Consolas", 9))
+        text_widget.tag_configure("link", underline=True)
+        text_widget.tag_configure("strike", overstrike=True)
+        text_widget.tag_configure("quote", lmargin1=12, lmargin2=12)
+
+    def _update_fields_section(self, issue: Optional[CustomIssue]) -> None:
+        fields: List[Tuple[str, str]] = []
+        for field in (issue.fields if issue else None) or []:
             if not field.value:
                 continue
-
             field_name = field.projectCustomField.field.name
             field_value = (
                 field.value.name if hasattr(field.value, "name") else str(field.value)
             )
+            fields.append((field_name, field_value))
+
+        self._set_visible(self.__fields_widgets, bool(fields))
+
+        names = [name for name, _ in fields]
+        for name, value in fields:
+            row = self.__field_rows.get(name)
+            if row is None:
+                row = self._create_field_row(name)
+                self.__field_rows[name] = row
+            _, value_label = row
+            if value_label.cget("text") != value:
+                value_label.config(text=value)
+
+        if names != self.__field_order:
+            for name, (field_frame, _) in self.__field_rows.items():
+                if name in names:
+                    field_frame.grid(row=names.index(name))
+                else:
+                    field_frame.grid_remove()
+            self.__field_order = names
+
+    def _create_field_row(self, field_name: str) -> Tuple[tk.Frame, tk.Label]:
+        field_frame = tk.Frame(self.__fields_frame, bg=self._config.bg_color)
+        field_frame.grid(column=0, sticky="ew", padx=20, pady=2)
+        field_frame.grid_columnconfigure(1, weight=1)
+
+        field_label = tk.Label(
+            field_frame,
+            text=f"{field_name}:",
+            font=("Segoe UI", 9, "bold"),
+            bg=self._config.bg_color,
+            fg=self._config.text_color,
+            takefocus=False,
+        )
+        field_label.grid(row=0, column=0, sticky="nw")
 
-            field_frame = tk.Frame(parent, bg=self._config.bg_color)
-            field_frame.grid(row=row, column=0, sticky="ew", padx=20, pady=2)
-            field_frame.grid_columnconfigure(1, weight=1)
-            row += 1
-
-            field_label = tk.Label(
-                field_frame,
-                text=f"{field_name}:",
-                font=("Segoe UI", 9, "bold"),
-                bg=self._config.bg_color,
-                fg=self._config.text_color,
-            )
-            field_label.grid(row=0, column=0, sticky="nw")
-
-            value_label = tk.Label(
-                field_frame,
-                text=field_value,
-                font=("Segoe UI", 9),
-                bg=self._config.bg_color,
-                fg=self._config.text_color,
-            )
-            value_label.grid(row=0, column=1, sticky="nw", padx=5)
+        value_label = tk.Label(
+            field_frame,
+            text="",
+            font=("Segoe UI", 9),
+            bg=self._config.bg_color,
+            fg=self._config.text_color,
+            takefocus=False,
+        )
+        value_label.grid(row=0, column=1, sticky="nw", padx=5)
+        return field_frame, value_label
 
-    def _add_subtasks_section(self, parent: tk.Frame, row: int) -> int:
-        if not hasattr(self.__issue, "links") or not self.__issue.links:
-            return row
+    def bind_link_callbacks(
+        self,
+        on_issue_selected: Callable[[str], None],
+        on_load_link_page: Callable[[str, str, int, int], None],
+    ) -> None:
+        """
+        Args:
+            on_issue_selected: Called with the readable ID of a clicked row.
+            on_load_link_page: Called with (issue_id, link_id, skip, top) when
+                more rows are needed; answer with `append_link_page`.
+        """
+        self.__on_issue_selected = on_issue_selected
+        self.__on_load_link_page = on_load_link_page
+
+    def append_link_page(
+        self, issue_id: str, link_id: str, skip: int, issues: List[IssueSummary]
+    ) -> None:
+        """Insert a fetched page of linked issues; stale pages are ignored."""
+        if not self.__issue or self.__issue.idReadable != issue_id:
+            return
+        offset = 0
+        for page in self.__subtask_pages:
+            if page[0] == link_id:
+                break
+            offset += page[1]
+        else:
+            return
+        self.__page_pending = False
+        if page[1] != skip:
+            return
 
-        subtask_texts = [
-            f"{linked_issue.idReadable} - {linked_issue.summary}\n"
-            for link in self.__issue.links
-            if "subtask of" in link.linkType.targetToSource
-            for linked_issue in link.trimmedIssues
-        ]
+        if not issues:
+            # server has fewer than issuesSize (or the request failed): stop paging
+            page[2] = page[1]
+            self.__subtasks_list.set_total(sum(p[2] for p in self.__subtask_pages))
+            return
 
-        if not subtask_texts:
-            return row
+        page[1] += len(issues)
+        index = offset + skip
+        self.__subtask_ids[index:index] = [linked.idReadable for linked in issues]
+        self.__subtasks_list.insert_rows(
+            index, [f"{linked.idReadable} - {linked.summary}" for linked in issues]
+        )
 
+    def _add_subtasks_section(self, parent: tk.Frame, row: int) -> None:
         frame = tk.Frame(parent, bg=self._config.bg_color)
         frame.grid(row=row, column=0, sticky="nsew", padx=10, pady=5)
         frame.grid_columnconfigure(0, weight=1)
+        self.__subtasks_frame = frame
 
-        header_label = tk.Label(
+        self.__subtasks_header = tk.Label(
             frame,
-            text=f"Subtasks ({len(subtask_texts)}):",
+            text="",
             font=("Segoe UI", 10, "bold"),
             bg=self._config.bg_color,
         )
-        header_label.grid(row=0, column=0, sticky="w")
-
-        text_frame = tk.Frame(frame)
-        text_frame.grid(row=1, column=0, sticky="nsew")
-        text_frame.grid_columnconfigure(0, weight=1)
-        text_frame.grid_rowconfigure(0, weight=1)
+        self.__subtasks_header.grid(row=0, column=0, sticky="w")
 
-        v_scrollbar = ttk.Scrollbar(text_frame, orient="vertical")
-        h_scrollbar = ttk.Scrollbar(text_frame, orient="horizontal")
+        self.__subtasks_list = VirtualList(
+            frame,
+            config=VirtualListConfig(
+                bg_color=self._config.bg_color,
+                text_color=self._config.text_color,
+            ),
+            on_select=self._on_subtask_selected,
+            on_near_end=self._request_next_link_page,
+        )
+        self.__subtasks_list.grid(row=1, column=0, sticky="nsew")
 
-        text_kwargs = {"state": tk.DISABLED, "xscrollcommand": h_scrollbar.set, "yscrollcommand": v_scrollbar.set}
-        if self._config.bg_color:
-            text_kwargs["bg"] = self._config.bg_color
-        if self._config.text_color:
-            text_kwargs["fg"] = self._config.text_color
-            text_kwargs["insertbackground"] = self._config.text_color
-            text_kwargs["disabledforeground"] = self._config.text_color
+    def _update_subtasks_section(self, issue: Optional[CustomIssue]) -> None:
+        links = [
+            link
+            for link in ((issue.links if issue else None) or [])
+            if "subtask of" in link.linkType.targetToSource
+        ]
+        ids = [linked.idReadable for link in links for linked in link.trimmedIssues]
+        total = sum(max(link.issuesSize, len(link.trimmedIssues)) for link in links)
 
-        text_widget = tk.Text(
-            text_frame,
-            height=min(6, len(subtask_texts)),
-            wrap=tk.NONE,
-            font=("Segoe UI", 10),
-            **text_kwargs,
-        )
-        text_widget.grid(row=0, column=0, sticky="nsew")
-        v_scrollbar.grid(row=0, column=1, sticky="ns")
-        h_scrollbar.grid(row=1, column=0, sticky="ew")
+        self._set_visible((self.__subtasks_frame,), total > 0)
+        if ids == self.__subtask_ids and total == self.__subtask_total:
+            return
 
-        v_scrollbar.config(command=text_widget.yview)
-        h_scrollbar.config(command=text_widget.xview)
+        self.__subtask_ids = ids
+        self.__subtask_total = total
+        self.__page_pending = False
+        self.__subtask_pages = [
+            [link.id, len(link.trimmedIssues), max(link.issuesSize, len(link.trimmedIssues))]
+            for link in links
+        ]
 
-        text_widget.config(state=tk.NORMAL)
-        text_widget.insert("1.0", "".join(subtask_texts))
-        text_widget.config(state=tk.DISABLED)
+        self.__subtasks_header.config(text=f"Subtasks ({total}):")
+        self.__subtasks_list.set_rows(
+            [
+                f"{linked.idReadable} - {linked.summary}"
+                for link in links
+                for linked in link.trimmedIssues
+            ],
+            total,
+        )
 
-        return row + 1
+    def _request_next_link_page(self) -> None:
+        if self.__page_pending or not self.__on_load_link_page or not self.__issue:
+            return
+        for link_id, loaded, total in self.__subtask_pages:
+            if link_id and loaded < total:
+                self.__page_pending = True
+                self.__on_load_link_page(
+                    self.__issue.idReadable, link_id, loaded, LINK_PAGE_SIZE
+                )
+                return
+
+    def _on_subtask_selected(self, index: int) -> None:
+        if self.__on_issue_selected and index < len(self.__subtask_ids):
+            self.__on_issue_selected(self.__subtask_ids[index])
@@ -4,8 +4,10 @@ import tkinter as tk
 
 from typing import Optional
 
+from ui.constants.tk_events import TkEvents
 from ui.views.base.custom_view import CustomView
 from ui.views.base.custom_view_config import CustomViewConfig
+from utils import wakeup_stats
 
 
 logger = logging.getLogger(__name__)
@@ -14,12 +16,19 @@ logger = logging.getLogger(__name__)
 class TimerView(CustomView):
     """
     A view that displays an elapsed time counter.
+
+    Ticks are aligned to wall-clock seconds and stop while the view is not
+    mapped; elapsed time is derived from the start time, so it is simply
+    recomputed when the view is shown again.
     """
 
     def __init__(self, config: Optional[CustomViewConfig] = None):
         super().__init__(config=config)
         self.__start_time: Optional[int] = None
         self.__timer_label: Optional[tk.Label] = None
+        self.__tick_job: Optional[str] = None
+        self.bind(TkEvents.WINDOW_MAPPED, self._on_mapped, add="+")
+        self.bind(TkEvents.WINDOW_UNMAPPED, self._on_unmapped, add="+")
 
     def _populate_widgets(self, parent: tk.Frame) -> None:
         """Populate widgets into the parent frame with timer details."""
@@ -57,22 +66,38 @@ class TimerView(CustomView):
         self.__start_time = int(time.time())
         self._update_elapsed_time()
 
+    def _on_mapped(self, event: tk.Event) -> None:
+        # toplevel bindings also fire for every child widget
+        if event.widget is self:
+            self._update_elapsed_time()
+
+    def _on_unmapped(self, event: tk.Event) -> None:
+        if event.widget is self:
+            self._cancel_tick()
+
+    def _cancel_tick(self) -> None:
+        if self.__tick_job:
+            self.after_cancel(self.__tick_job)
+            self.__tick_job = None
+
     def _update_elapsed_time(self) -> None:
-        """Update the elapsed time label every second."""
+        """Update the elapsed time label once per second while visible."""
+        self._cancel_tick()
         if not self.__start_time or not self.__timer_label:
             return
+        wakeup_stats.record("timer_tick")
 
         elapsed = int(time.time()) - self.__start_time
         hours, remainder = divmod(elapsed, 3600)
         minutes, seconds = divmod(remainder, 60)
         time_string = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
-        self.__timer_label.config(
-            text=f"{time_string}",
-            bg=self._config.bg_color,
-            fg=self._config.text_color,
-        )
-        self.after(1000, self._update_elapsed_time)
+        if self.__timer_label.cget("text") != time_string:
+            self.__timer_label.config(text=time_string)
+
+        if self.winfo_viewable():
+            delay_ms = 1000 - int(time.time() * 1000) % 1000
+            self.__tick_job = self.after(delay_ms, self._update_elapsed_time)
 
     def _reset(self):
         """Reset the timer to zero."""
@@ -6,6 +6,7 @@ import tkinter as tk
 from tkcalendar import DateEntry
 
 from ui.widgets.custom_entry import CustomEntryConfig
+from ui.constants.date_formats import DATE_FORMAT_MAP
 from ui.constants.tk_events import TkEvents
 
 logger = logging.getLogger(__name__)
@@ -16,14 +17,7 @@ class CustomDateEntryConfig(CustomEntryConfig):
 
 
 class CustomDateEntry(DateEntry):
-    DATE_FORMAT_MAP = {
-        "dd/mm/yyyy": "%d/%m/%Y",
-        "mm/dd/yyyy": "%m/%d/%Y",
-        "yyyy/mm/dd": "%Y/%m/%d",
-        "dd-mm-yyyy": "%d-%m-%Y",
-        "mm-dd-yyyy": "%m-%d-%Y",
-        "yyyy-mm-dd": "%Y-%m-%d",
-    }
+    DATE_FORMAT_MAP = DATE_FORMAT_MAP
 
     def __init__(
         self, master, config: Optional[CustomDateEntryConfig] = None, **kwargs
@@ -0,0 +1,91 @@
+import tkinter as tk
+from typing import Callable, List, Optional, Tuple
+
+from ui.widgets.base_widget_config import BaseWidgetConfig
+
+
+class SuggestionListConfig(BaseWidgetConfig):
+    max_rows: int = 6
+    font: tuple = ("Segoe UI", 9)
+
+
+class SuggestionList(tk.Listbox):
+    """
+    Dropdown of ``(value, label)`` pairs overlaid under an anchor widget.
+
+    Focus stays in the anchor; it forwards Up/Down/Return/Escape through
+    `move`, `pick` and `hide`. A click picks directly, without taking focus.
+    Showing and hiding map and unmap the list only; window-level Map/Unmap
+    handlers must check ``event.widget`` (see CustomWindowAttachMixin).
+    """
+
+    def __init__(
+        self,
+        master,
+        anchor: tk.Widget,
+        on_pick: Callable[[str], None],
+        config: Optional[SuggestionListConfig] = None,
+    ):
+        self.__config = config or SuggestionListConfig()
+        super().__init__(
+            master,
+            font=self.__config.font,
+            activestyle="none",
+            exportselection=False,
+            takefocus=False,
+            height=self.__config.max_rows,
+        )
+        self.__anchor = anchor
+        self.__on_pick = on_pick
+        self.__values: List[str] = []
+        self.bind("<Button-1>", self._on_click)
+
+    @property
+    def visible(self) -> bool:
+        return bool(self.winfo_ismapped())
+
+    def show(self, items: List[Tuple[str, str]]) -> None:
+        if not items:
+            self.hide()
+            return
+        self.__values = [value for value, _ in items]
+        self.delete(0, tk.END)
+        for _, label in items:
+            self.insert(tk.END, label)
+        self.configure(height=min(len(items), self.__config.max_rows))
+        self.selection_clear(0, tk.END)
+        self.selection_set(0)
+        self.place(in_=self.__anchor, relx=0, rely=1.0, relwidth=1.0, y=1)
+        self.lift()
+
+    def hide(self) -> None:
+        self.__values = []
+        self.place_forget()
+
+    def move(self, step: int) -> None:
+        if not self.__values:
+            return
+        selection = self.curselection()
+        index = (selection[0] if selection else -1) + step
+        index = max(0, min(index, len(self.__values) - 1))
+        self.selection_clear(0, tk.END)
+        self.selection_set(index)
+        self.see(index)
+
+    def pick(self) -> bool:
+        """Pick the selected row; False when there is nothing to pick."""
+        selection = self.curselection()
+        if not selection or not self.__values:
+            return False
+        value = self.__values[selection[0]]
+        self.hide()
+        self.__on_pick(value)
+        return True
+
+    def _on_click(self, event) -> str:
+        index = self.nearest(event.y)
+        if 0 <= index < len(self.__values):
+            self.selection_clear(0, tk.END)
+            self.selection_set(index)
+            self.pick()
+        return "break"
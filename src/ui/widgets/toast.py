@@ -0,0 +1,44 @@
+import tkinter as tk
+from typing import Literal, Optional
+
+from ui.widgets.base_widget_config import BaseWidgetConfig
+
+ToastKind = Literal["info", "success", "error"]
+
+
+class ToastConfig(BaseWidgetConfig):
+    duration_ms: int = 3000
+    font: tuple = ("Segoe UI", 9, "bold")
+
+
+class Toast(tk.Label):
+    """Short status message overlaid on the bottom edge of its master."""
+
+    KIND_COLORS = {
+        "info": "#37474F",
+        "success": "#2E7D32",
+        "error": "#C62828",
+    }
+
+    def __init__(self, master, config: Optional[ToastConfig] = None):
+        self.__config = config or ToastConfig()
+        super().__init__(
+            master, font=self.__config.font, fg="white", padx=8, pady=3
+        )
+        self.__hide_job: Optional[str] = None
+
+    def show(
+        self, text: str, kind: ToastKind = "info", duration_ms: Optional[int] = None
+    ) -> None:
+        if self.__hide_job:
+            self.after_cancel(self.__hide_job)
+        self.config(text=text, bg=self.KIND_COLORS[kind])
+        self.place(relx=0.5, rely=1.0, anchor="s", y=-4)
+        self.lift()
+        self.__hide_job = self.after(
+            duration_ms or self.__config.duration_ms, self.hide
+        )
+
+    def hide(self) -> None:
+        self.__hide_job = None
+        self.place_forget()
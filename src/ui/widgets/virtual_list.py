@@ -0,0 +1,152 @@
+import logging
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
+from typing import Callable, List, Optional
+
+from ui.widgets.base_widget_config import BaseWidgetConfig
+
+logger = logging.getLogger(__name__)
+
+
+class VirtualListConfig(BaseWidgetConfig):
+    visible_rows: int = 6
+    prefetch_rows: int = 10
+    placeholder: str = "Loading..."
+    font: tuple = ("Segoe UI", 10)
+
+
+class VirtualList(tk.Frame):
+    """
+    Fixed-row-height list that only draws the visible rows.
+
+    ``total`` may exceed the loaded rows; missing rows show a placeholder and
+    ``on_near_end`` is called when the user scrolls close to them.
+    """
+
+    def __init__(
+        self,
+        master,
+        config: Optional[VirtualListConfig] = None,
+        on_select: Optional[Callable[[int], None]] = None,
+        on_near_end: Optional[Callable[[], None]] = None,
+    ):
+        self.__config = config or VirtualListConfig()
+        super().__init__(master, bg=self.__config.bg_color)
+        self.__on_select = on_select
+        self.__on_near_end = on_near_end
+        self.__rows: List[str] = []
+        self.__total = 0
+        self.__first = 0
+
+        font = tkfont.Font(font=self.__config.font)
+        self.__row_height = font.metrics("linespace") + 4
+
+        canvas_kwargs = {"highlightthickness": 0}
+        if self.__config.bg_color:
+            canvas_kwargs["bg"] = self.__config.bg_color
+        self.__canvas = tk.Canvas(
+            self,
+            height=self.__row_height * self.__config.visible_rows,
+            takefocus=False,
+            **canvas_kwargs,
+        )
+        self.__scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.__canvas.grid(row=0, column=0, sticky="nsew")
+        self.__scrollbar.grid(row=0, column=1, sticky="ns")
+        self.grid_columnconfigure(0, weight=1)
+
+        self.__items = [
+            self.__canvas.create_text(
+                4,
+                i * self.__row_height + 2,
+                anchor="nw",
+                font=font,
+                fill=self.__config.text_color or "black",
+            )
+            for i in range(self.__config.visible_rows)
+        ]
+
+        self.__canvas.bind("<Button-1>", self._on_click)
+        self.__canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.__canvas.bind("<Button-4>", lambda e: self._scroll_by(-1))
+        self.__canvas.bind("<Button-5>", lambda e: self._scroll_by(1))
+        self.__canvas.bind("<Enter>", lambda e: self.__canvas.config(cursor="hand2"))
+
+    @property
+    def loaded_count(self) -> int:
+        return len(self.__rows)
+
+    def set_rows(self, rows: List[str], total: Optional[int] = None) -> None:
+        self.__rows = list(rows)
+        self.__total = max(total or 0, len(self.__rows))
+        self.__first = 0
+        self._render()
+
+    def insert_rows(self, index: int, rows: List[str]) -> None:
+        self.__rows[index:index] = rows
+        self.__total = max(self.__total, len(self.__rows))
+        self._render()
+
+    def set_total(self, total: int) -> None:
+        self.__total = max(total, len(self.__rows))
+        self._render()
+
+    def yview(self, *args) -> None:
+        """Scrollbar protocol: ``moveto fraction`` or ``scroll n units|pages``."""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * self.__total))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self.__config.visible_rows
+            self._scroll_by(step)
+
+    def _on_mousewheel(self, event) -> None:
+        self._scroll_by(-1 if event.delta > 0 else 1)
+
+    def _scroll_by(self, rows: int) -> None:
+        self._scroll_to(self.__first + rows)
+
+    def _scroll_to(self, first: int) -> None:
+        max_first = max(0, self.__total - self.__config.visible_rows)
+        first = min(max(0, first), max_first)
+        if first == self.__first:
+            return
+        self.__first = first
+        self._render()
+
+    def _render(self) -> None:
+        for offset, item in enumerate(self.__items):
+            index = self.__first + offset
+            if index < len(self.__rows):
+                text = self.__rows[index]
+            elif index < self.__total:
+                text = self.__config.placeholder
+            else:
+                text = ""
+            if self.__canvas.itemcget(item, "text") != text:
+                self.__canvas.itemconfigure(item, text=text)
+
+        if self.__total:
+            self.__scrollbar.set(
+                self.__first / self.__total,
+                min(1.0, (self.__first + self.__config.visible_rows) / self.__total),
+            )
+        else:
+            self.__scrollbar.set(0, 1)
+
+        last_visible = self.__first + self.__config.visible_rows
+        if (
+            self.__on_near_end
+            and len(self.__rows) < self.__total
+            and last_visible + self.__config.prefetch_rows >= len(self.__rows)
+        ):
+            self.__on_near_end()
+
+    def _on_click(self, event) -> None:
+        index = self.__first + event.y // self.__row_height
+        if self.__on_select and index < len(self.__rows):
+            self.__on_select(index)
@@ -1,85 +1,431 @@
 import logging
-import threading
-from typing import Optional
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 
+from models.custom_models import CustomIssue
 from models.general_requests import AddSpentTimeRequest, Duration
 from models.general_responses import WorkItem
+from models.outbox_entry import OutboxEntry
+from services.issue_index import IssueIndex
 from services.youtrack_service import YouTrackService
+from services.task_executor import CancellationToken, TaskExecutor, TaskPriority
+from services.work_item_ledger import WorkItemLedger
+from services.work_item_outbox import WorkItemOutbox
+from ui.utils.ui_dispatcher import UiDispatcher
+from ui.views.issue_viewer.issue_viewer_view import IssueViewerView
 from ui.windows.add_spent_time.add_spent_time_window import AddSpentTimeWindow
-from utils.youtrack import convert_time_to_minutes, id_valid
+from ui.windows.time_report.time_report_window import TimeReportWindow
+from utils.adaptive_debounce import AdaptiveDebouncer
+from utils.rich_text import render_issue_description
+from utils.youtrack import (
+    convert_time_to_minutes,
+    format_minutes,
+    id_valid,
+    parse_split_spec,
+    split_minutes,
+)
 from errors.user_error import UserError
+from errors.task_cancelled_error import TaskCancelledError
+from utils import startup_timeline
 
 logger = logging.getLogger(__name__)
 
+ISSUE_SEARCH_REMOTE_DELAY_MS = 300
+
 
 class AddSpentTimeController:
-    def __init__(self, window: AddSpentTimeWindow, youtrack_service: YouTrackService):
+    def __init__(
+        self,
+        window: AddSpentTimeWindow,
+        youtrack_service: YouTrackService,
+        task_executor: TaskExecutor,
+        work_item_outbox: WorkItemOutbox,
+        work_item_ledger: WorkItemLedger,
+        issue_index: IssueIndex,
+        time_report_window_factory: Callable[..., TimeReportWindow],
+    ):
         """
         Initialize the AddSpentTimeController.
 
         Args:
             view: The view responsible for displaying the spent time form.
             youtrack_service: Service for interacting with YouTracks API.
+            task_executor: Shared worker pool for background requests.
+            work_item_outbox: Durable queue that delivers submitted work items.
+            work_item_ledger: Local copy of the user's work items.
+            issue_index: Local search index behind the issue field's typeahead.
+            time_report_window_factory: Creates the report window on demand.
         """
         self.__window = window
         self.__youtrack_service = youtrack_service
+        self.__task_executor = task_executor
+        self.__outbox = work_item_outbox
+        self.__ledger = work_item_ledger
+        self.__issue_index = issue_index
+        self.__issue_search_id: Optional[str] = None
+        self.__confirmed_duplicate: Optional[tuple] = None
+        self.__time_report_window_factory = time_report_window_factory
+        self.__report_window: Optional[TimeReportWindow] = None
+        # label, form snapshot or split batch per outbox key, this session only
+        self.__submissions: Dict[str, dict] = {}
         self.__debounce_id: Optional[int] = None
-        self.__fetch_cancelled = False
+        self.__debouncer = AdaptiveDebouncer()
+        self.__ui = UiDispatcher(
+            self.__window, on_loading_changed=self.__window.set_is_loading
+        )
+        self.__lookup_token: Optional[CancellationToken] = None
         self.__window.bind_issue_id_change(self._on_issue_id_changed)
+        self.__window.bind_issue_search(self._on_issue_search)
+        self.__window.bind_issue_pick(self._on_issue_picked)
         self.__window.bind_submit(self._on_submit)
+        self.__window.bind_open_report(self._on_open_report)
+        self.__outbox.bind_listener(
+            on_delivered=self._on_delivered,
+            on_rejected=lambda entry: self.__ui.post(
+                None, lambda: self._on_submit_failed(entry)
+            ),
+            on_retry=lambda entry: self.__ui.post(
+                None, lambda: self._on_submit_retrying(entry)
+            ),
+        )
+
+        for view in self.__window.get_attached_views():
+            if isinstance(view, IssueViewerView):
+                view.bind_link_callbacks(
+                    on_issue_selected=self._on_issue_picked,
+                    on_load_link_page=self._load_link_page,
+                )
 
     def add_spent_time(self) -> None:
-        self.__window.show()
         self.__window.after(0, self._prefetch_global_work_item_types)
+        self.__window.after(0, self.__outbox.start)
+        self.__window.after(0, self._sync_ledger)
+        self.__window.after(0, self._sync_issue_index)
+        try:
+            self.__window.show()
+        finally:
+            self.__outbox.shutdown()
+            self.__task_executor.shutdown()
+            self.__ledger.close()
+            self.__issue_index.close()
 
-    def _run_async_task(self, task_func, *args, **kwargs):
-        """Run a task in a background thread with common error handling and loading states."""
+    def _run_async_task(
+        self,
+        task_func,
+        *args,
+        priority: TaskPriority = TaskPriority.BACKGROUND,
+        show_loading: bool = True,
+        **kwargs,
+    ) -> CancellationToken:
+        """Run a task on the shared executor with common error handling and loading states."""
 
-        def thread_wrapper():
+        def task_wrapper():
             try:
-                self.__window.after(0, lambda: self.__window.set_is_loading(True))
+                if show_loading:
+                    self.__ui.begin_loading()
                 task_func(*args, **kwargs)
+            except TaskCancelledError:
+                raise
             except UserError as e:
-                self.__window.after(0, e.display)
+                self.__ui.post(None, e.display)
             except Exception as e:
                 logger.exception("Unexpected error in async task: %s", e)
             finally:
-                self.__window.after(0, lambda: self.__window.set_is_loading(False))
+                if show_loading:
+                    self.__ui.end_loading()
+
+        return self.__task_executor.submit(task_wrapper, priority=priority)
 
-        thread = threading.Thread(target=thread_wrapper)
-        thread.daemon = True
-        thread.start()
+    def _cancel_issue_lookup(self) -> None:
+        if self.__lookup_token:
+            self.__lookup_token.cancel()
+            self.__lookup_token = None
 
     def _prefetch_global_work_item_types(self) -> None:
         def fetch_task():
             work_item_types = self.__youtrack_service.get_work_item_types()
-            self.__window.after(
-                0, lambda: self.__window._set_issue_types(work_item_types)
+            startup_timeline.mark(startup_timeline.FINAL_MARK)
+            self.__ui.post(
+                "issue_types", lambda: self.__window._set_issue_types(work_item_types)
             )
 
         self._run_async_task(fetch_task)
 
     def _on_submit(self) -> None:
+        """
+        Journal the work item in the outbox, which posts it in the background.
+        The form is reset right away; if the server rejects the entry it is
+        put back (or named in the error toast).
+
+        With a split spec the time is divided (evenly or by ``:weight``)
+        between the issue and the listed ones, one work item each.
+        """
         issue_id = self.__window._get_issue_id()
+        if not id_valid(issue_id):
+            raise UserError(f"Pick an issue first: {issue_id or 'no issue ID'}")
         time_short_format = self.__window._get_time()
+        snapshot = self.__window.get_form_snapshot()
+        total_minutes = int(convert_time_to_minutes(time_short_format) or 0)
+        if total_minutes <= 0:
+            raise UserError(f"Invalid time: {time_short_format or 'none'} (e.g. 1h30m)")
 
-        add_spent_time_request = AddSpentTimeRequest(
-            description=self.__window._get_description(),
-            duration=Duration(minutes=convert_time_to_minutes(time_short_format)),
-            type=(
-                WorkItem(id=self.__window._get_selected_issue_type_id())
-                if self.__window._get_selected_issue_type_id()
-                else None
-            ),
-            date_millis=self.__window._get_date_millis(),
+        try:
+            split = parse_split_spec(
+                self.__window._get_split_spec(),
+                self.__window._get_project(),
+                main_issue_id=issue_id,
+            )
+        except ValueError as e:
+            raise UserError(str(e))
+
+        type_id = self.__window._get_selected_issue_type_id()
+        description = self.__window._get_description()
+        date_millis = self.__window._get_date_millis()
+
+        def build_request(minutes: int) -> AddSpentTimeRequest:
+            return AddSpentTimeRequest(
+                description=description,
+                duration=Duration(minutes=minutes),
+                type=WorkItem(id=type_id) if type_id else None,
+                date_millis=date_millis,
+            )
+
+        weights = {issue_id: 1.0}
+        weights.update(split)
+        shares = split_minutes(total_minutes, list(weights.values()))
+        self._confirm_not_duplicate(
+            [(target_id, minutes) for target_id, minutes in zip(weights, shares)],
+            date_millis,
+            description,
+        )
+
+        if not split:
+            label = f"{time_short_format} on {issue_id}"
+            entry = self._enqueue(issue_id, build_request(total_minutes))
+            self.__submissions[entry.idempotency_key] = {
+                "snapshot": snapshot,
+                "label": label,
+            }
+            self.__window.show_toast(f"Saving {label}...")
+            return
+
+        batch = {
+            "label": f"{time_short_format} across {len(weights)} issues",
+            "remaining": set(),
+            "logged": [],
+            "failed": [],
+        }
+        for target_id, minutes in zip(weights, shares):
+            if minutes <= 0:
+                continue
+            entry = self._enqueue(target_id, build_request(minutes))
+            batch["remaining"].add(entry.idempotency_key)
+            self.__submissions[entry.idempotency_key] = {
+                "label": f"{minutes}m on {target_id}",
+                "batch": batch,
+            }
+        self.__window.show_toast(f"Saving {batch['label']}...")
+
+    def _confirm_not_duplicate(
+        self, targets: List[Tuple[str, int]], date_millis: Optional[int], text: str
+    ) -> None:
+        """
+        Refuse, once, an entry the ledger already holds (same issue, day,
+        duration and text). Submitting the same entry again books it anyway.
+        """
+        if date_millis is None:
+            return
+        duplicates = []
+        for target_id, minutes in targets:
+            try:
+                found = self.__ledger.find_duplicates(
+                    target_id, date_millis, minutes, text
+                )
+            except Exception as e:
+                logger.error(f"Could not check the ledger for duplicates: {e}")
+                return
+            if found:
+                duplicates.append(f"{format_minutes(minutes)} on {target_id}")
+        fingerprint = (tuple(targets), date_millis, text or None)
+        if not duplicates or fingerprint == self.__confirmed_duplicate:
+            self.__confirmed_duplicate = None
+            return
+        self.__confirmed_duplicate = fingerprint
+        raise UserError(
+            "Already logged that day with the same description:\n"
+            + "\n".join(duplicates)
+            + "\n\nSubmit again to log it anyway."
+        )
+
+    def _enqueue(self, issue_id: str, request: AddSpentTimeRequest) -> OutboxEntry:
+        try:
+            return self.__outbox.enqueue(issue_id, request)
+        except OSError as e:
+            raise UserError(f"Could not save the entry locally: {e}")
+
+    def _submission_label(self, entry: OutboxEntry) -> str:
+        submission = self.__submissions.get(entry.idempotency_key, {})
+        return submission.get("label") or (
+            f"{entry.request.duration.minutes}m on {entry.issue_id}"
+        )
+
+    def _sync_ledger(self) -> None:
+        self._run_async_task(self.__ledger.sync, show_loading=False)
+
+    def _sync_issue_index(self) -> None:
+        project = self.__window._get_project()
+        if project:
+            self._run_async_task(
+                self.__issue_index.sync_project, project, show_loading=False
+            )
+
+    def _index_issues(self, issues) -> None:
+        """Feed the typeahead index; never fails the caller's task."""
+        try:
+            self.__issue_index.add(issue for issue in issues or [] if issue)
+        except Exception as e:
+            logger.error(f"Could not index issues: {e}")
+
+    def _on_issue_search(self, text: str) -> None:
+        """
+        Suggest issues for the issue field from the local index (answers in
+        milliseconds, so it runs on the Tk thread). Text that is not just a
+        number is also sent to the server after a short pause; its matches
+        are indexed and the suggestions refreshed.
+        """
+        if self.__issue_search_id is not None:
+            self.__window.after_cancel(self.__issue_search_id)
+            self.__issue_search_id = None
+
+        project = self.__window._get_project()
+        limit = self.__window.issue_search_limit
+        self.__window.show_issue_suggestions(
+            self.__issue_index.search(text, project, limit=limit)
+        )
+        if not self.__window.issue_search_server_fallback or len(text) < 2:
+            return
+        if text.isdigit():
+            return
+
+        def search_remote_task():
+            self.__issue_index.search_remote(text, project, limit=limit)
+            self.__ui.post("issue_search", refresh)
+
+        def refresh():
+            if self.__window.get_issue_search_text() == text:
+                self.__window.show_issue_suggestions(
+                    self.__issue_index.search(text, project, limit=limit)
+                )
+
+        def debounce():
+            self.__issue_search_id = None
+            self._run_async_task(
+                search_remote_task, priority=TaskPriority.USER, show_loading=False
+            )
+
+        self.__issue_search_id = self.__window.after(
+            ISSUE_SEARCH_REMOTE_DELAY_MS, debounce
+        )
+
+    def _on_open_report(self) -> None:
+        window = self.__report_window
+        if window is not None and window.winfo_exists():
+            window.lift()
+            window.focus_force()
+            return
+
+        self.__report_window = self.__time_report_window_factory(
+            master=self.__window, on_range_changed=self._load_report
+        )
+        self.__report_window.refresh()
+
+    def _load_report(self, start: int, end: int) -> None:
+        window = self.__report_window
+        if window is None:
+            return
+        target_minutes = window.daily_target_minutes
+        workdays_only = window.workdays_only
+
+        def report_task():
+            # NumPy is loaded with the first report, not at startup
+            from services.time_report import TimeReport
+
+            self.__ledger.sync()
+            rows = self.__ledger.report_rows(start, end)
+            report = TimeReport.from_rows(rows, start, end)
+            tables = report.tables(target_minutes, workdays_only)
+            summary = f"{format_minutes(report.total_minutes)} in {len(rows)} entries"
+            self.__ui.post(
+                "time_report", lambda: window.show_tables(tables, summary)
+            )
+
+        self._run_async_task(report_task, priority=TaskPriority.USER)
+
+    def _on_delivered(self, entry: OutboxEntry) -> None:
+        """Runs on the outbox worker; the ledger write stays off the UI thread."""
+        if entry.work_item:
+            try:
+                self.__ledger.record(entry.issue_id, entry.work_item)
+            except Exception as e:
+                logger.error(f"Could not record work item in the ledger: {e}")
+        self.__ui.post(None, lambda: self._on_submit_succeeded(entry))
+
+    def _on_submit_succeeded(self, entry: OutboxEntry) -> None:
+        label = self._submission_label(entry)
+        submission = self.__submissions.pop(entry.idempotency_key, {})
+        if "batch" in submission:
+            submission["batch"]["logged"].append(label)
+            self._settle_batch(submission["batch"], entry)
+            return
+
+        message = f"Logged {label}"
+        pending = self.__outbox.pending_count()
+        if pending:
+            message += f" ({pending} still saving)"
+        self.__window.show_toast(message, "success")
+
+    def _on_submit_retrying(self, entry: OutboxEntry) -> None:
+        self.__window.show_toast(
+            f"Offline: {self._submission_label(entry)} queued, will retry", "info"
         )
 
-        self.__youtrack_service.add_spent_time(issue_id, add_spent_time_request)
+    def _on_submit_failed(self, entry: OutboxEntry) -> None:
+        label = self._submission_label(entry)
+        submission = self.__submissions.pop(entry.idempotency_key, {})
+        if "batch" in submission:
+            submission["batch"]["failed"].append(f"{label}: {entry.last_error}")
+            self._settle_batch(submission["batch"], entry)
+            return
+
+        self.__window._restore_window()
+        snapshot = submission.get("snapshot")
+        if snapshot and self.__window.restore_form(snapshot):
+            self.__window.show_toast(f"Failed to log {label}; entry restored", "error")
+        else:
+            self.__window.show_toast(f"Failed to log {label}", "error")
+        if entry.last_error:
+            UserError(entry.last_error).display()
+
+    def _settle_batch(self, batch: dict, entry: OutboxEntry) -> None:
+        """Report a split entry once every part was delivered or rejected."""
+        batch["remaining"].discard(entry.idempotency_key)
+        if batch["remaining"]:
+            return
+
+        logged, failed = batch["logged"], batch["failed"]
+        summary = f"{batch['label']}: {len(logged)} logged, {len(failed)} failed"
+        self.__window.show_toast(summary, "error" if failed else "success")
+        if failed:
+            self.__window._restore_window()
+            UserError(
+                "\n".join([summary, "", "Logged:", *logged, "", "Failed:", *failed])
+            ).display()
 
     def _on_issue_id_changed(self, issue_id: str):
         """
         Handle changes to the issue ID input field with debouncing.
-        Fetches the issue details after a short delay to prevent excessive API calls.
+        Fetches the issue details after an adaptive delay (see AdaptiveDebouncer)
+        to prevent excessive API calls.
 
         Args:
             issue_id: The YouTrack issue ID entered by the user.
@@ -88,6 +434,9 @@ class AddSpentTimeController:
         if self.__debounce_id is not None:
             self.__window.after_cancel(self.__debounce_id)
 
+        # whatever is in flight is for an ID the user already typed past
+        self._cancel_issue_lookup()
+
         if not id_valid(issue_id):
             return
 
@@ -96,7 +445,29 @@ class AddSpentTimeController:
         def debounce():
             self._fetch_and_propagate_issue(debounced_issue_id)
 
-        self.__debounce_id = self.__window.after(500, debounce)
+        delay_ms = self.__debouncer.next_delay(issue_id)
+        self.__debounce_id = self.__window.after(delay_ms, debounce)
+
+    def _on_issue_picked(self, issue_id: str) -> None:
+        """A subtask or suggestion was chosen: paint what is known, then fetch."""
+        self._paint_partial_issue(issue_id)
+        self.__window.set_issue_id(issue_id)
+
+    def _paint_partial_issue(self, issue_id: str) -> None:
+        """
+        Show what earlier responses embedded about *issue_id* right away; the
+        fetch fills in the rest. Only for picks, never for typed prefixes,
+        which would flicker through unrelated issues.
+        """
+        partial = self.__youtrack_service.get_partial_issue(issue_id)
+        if partial is None:
+            summary = self.__issue_index.get(issue_id)
+            partial = CustomIssue.partial(summary) if summary else None
+        if partial is None:
+            return
+        for view in self.__window.get_attached_views():
+            if isinstance(view, IssueViewerView) and view.shown_issue_id != partial.idReadable:
+                view.update_value(partial)
 
     def _fetch_and_propagate_issue(self, issue_id: str):
         def _is_input_stale():
@@ -106,10 +477,25 @@ class AddSpentTimeController:
             if _is_input_stale():
                 return
 
+            started = time.monotonic()
             issue = self.__youtrack_service.get_issue(issue_id)
+            latency_ms = (time.monotonic() - started) * 1000
+            found = issue is not None
+            # the debouncer is read on the Tk thread; feed it there
+            self.__ui.post(
+                None,
+                lambda: self.__debouncer.record_result(
+                    issue_id, latency_ms=latency_ms, found=found
+                ),
+            )
+            startup_timeline.mark(startup_timeline.FINAL_MARK)
+            self._index_issues([issue, *(issue.embedded_issues if issue else [])])
             if _is_input_stale():
                 return
 
+            # warm the render cache off the Tk thread
+            render_issue_description(issue)
+
             work_item_types = []
             if issue and issue.project:
                 work_item_types = self.__youtrack_service.get_project_work_item_types(
@@ -117,11 +503,37 @@ class AddSpentTimeController:
                 )
 
             if not _is_input_stale():
-                self.__window.after(
-                    0, lambda: self._update_ui_with_issue(issue, work_item_types)
+                self.__ui.post(
+                    "issue", lambda: self._update_ui_with_issue(issue, work_item_types)
                 )
 
-        self._run_async_task(fetch_task)
+        self._cancel_issue_lookup()
+        self.__lookup_token = self._run_async_task(
+            fetch_task, priority=TaskPriority.USER
+        )
+
+    def _load_link_page(self, issue_id: str, link_id: str, skip: int, top: int):
+        """Fetch the next page of a link's issues for the issue viewer."""
+
+        def fetch_task():
+            try:
+                issues = self.__youtrack_service.get_link_issues(
+                    issue_id, link_id, skip=skip, top=top
+                )
+            except (OSError, UserError) as e:
+                # an empty page clears the view's pending flag and stops paging
+                logger.error(f"Could not load link page of {issue_id}: {e}")
+                issues = []
+            self._index_issues(issues)
+
+            def apply():
+                for view in self.__window.get_attached_views():
+                    if isinstance(view, IssueViewerView):
+                        view.append_link_page(issue_id, link_id, skip, issues)
+
+            self.__ui.post(f"link_page:{link_id}:{skip}", apply)
+
+        self._run_async_task(fetch_task, priority=TaskPriority.USER)
 
     def _update_ui_with_issue(self, issue, work_item_types):
         """Update the UI with the fetched issue data."""
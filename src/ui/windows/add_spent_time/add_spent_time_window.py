@@ -1,12 +1,16 @@
 import logging
 import time
-from typing import Callable, List, Optional
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
 
 import tkinter as tk
 
-from models.general_responses import WorkItem
-from ui.widgets.custom_combobox import CustomComboboxConfig
-from ui.widgets.custom_entry import CustomEntryConfig
+from models.general_responses import IssueSummary, WorkItem
+from ui.widgets.custom_combobox import CustomCombobox, CustomComboboxConfig
+from ui.widgets.custom_date_entry import CustomDateEntry
+from ui.widgets.custom_entry import CustomEntry, CustomEntryConfig
+from ui.widgets.suggestion_list import SuggestionList
+from ui.widgets.toast import Toast, ToastKind
 from ui.windows.add_spent_time.add_spent_time_window_config import (
     AddSpentTimeWindowConfig,
 )
@@ -31,6 +35,8 @@ class AddSpentTimeWindow(CustomWindow):
     ):
         super().__init__(config=config, **kwargs)
         self.__issue_id_change_callback: Optional[Callable] = None
+        self.__issue_search_callback: Optional[Callable[[str], None]] = None
+        self.__issue_pick_callback: Optional[Callable[[str], None]] = None
 
         self.__work_item_name_to_id = {}
 
@@ -59,6 +65,17 @@ class AddSpentTimeWindow(CustomWindow):
         except Exception:
             pass
 
+        # typing text instead of a number searches the local issue index
+        self.__suggestions = SuggestionList(
+            self, anchor=self.__id_entry, on_pick=self._on_suggestion_picked
+        )
+        self.__id_entry.bind("<KeyRelease>", self._on_issue_search_key, add="+")
+        self.__id_entry.bind("<Down>", lambda e: self._on_suggestion_key(1))
+        self.__id_entry.bind("<Up>", lambda e: self._on_suggestion_key(-1))
+        self.__id_entry.bind("<Return>", lambda e: self._on_suggestion_key(0))
+        self.__id_entry.bind("<Escape>", self._on_suggestion_escape)
+        self.__id_entry.bind("<FocusOut>", lambda e: self.__suggestions.hide())
+
         self.__time_entry = create_labeled_entry(
             parent=self,
             label="Enter Time (e.g., 1h30m):",
@@ -75,45 +92,196 @@ class AddSpentTimeWindow(CustomWindow):
             config=CustomEntryConfig(initial_value=config.initial_description or ""),
         )
 
-        self.__type_combobox = create_labeled_combobox(
+        self.__split_entry = create_labeled_entry(
             parent=self,
+            label="Split with (optional, e.g. 12, A-7:2):",
+            config=CustomEntryConfig(),
+        )
+
+        # type combobox and date picker (tkcalendar) are built once the window
+        # is up, see _build_deferred_widgets; this frame keeps their position
+        self.__deferred_frame = tk.Frame(self)
+        self.__deferred_frame.pack(fill="x")
+        self.__type_combobox: Optional[CustomCombobox] = None
+        self.__date_entry: Optional[CustomDateEntry] = None
+
+        self.__rapid_entry_var = tk.BooleanVar(value=config.rapid_entry)
+        tk.Checkbutton(
+            self,
+            text="Keep open for more entries",
+            variable=self.__rapid_entry_var,
+            takefocus=False,
+        ).pack(anchor="w", padx=10)
+
+        ok_button = tk.Button(self, text="OK", command=self._submit, width=10)
+        ok_button.pack(pady=5)
+
+        self.__toast = Toast(self)
+
+        self.bind("<FocusIn>", self._on_window_focus)
+        self.bind("<Button-1>", lambda e: self._update_activity_time())
+        self.bind("<Key>", lambda e: self._update_activity_time())
+
+    def show(self):
+        self.after_idle(self._build_deferred_widgets)
+        super().show()
+
+    def _build_deferred_widgets(self) -> None:
+        """Build the widgets that are not needed to start typing. Idempotent."""
+        if self.__date_entry is not None:
+            return
+
+        self.__type_combobox = create_labeled_combobox(
+            parent=self.__deferred_frame,
             label="Type:",
             config=CustomComboboxConfig(
-                values=config.work_item_types,
-                initial_value=config.initial_type or "",
+                values=self._config.work_item_types,
+                initial_value=self._config.initial_type or "",
             ),
         )
 
         self.__date_entry = create_labeled_date_entry(
-            parent=self,
+            parent=self.__deferred_frame,
             label="Date:",
             config=CustomDateEntryConfig(
-                initial_value=config.initial_date,
-                date_format=config.date_format,
+                initial_value=self._config.initial_date,
+                date_format=self._config.date_format,
             ),
         )
 
         self.__date_entry.bind("<KeyPress>", self._on_date_manual_edit)
         self.__date_entry.bind("<Button-1>", self._on_date_manual_edit)
 
-        ok_button = tk.Button(self, text="OK", command=self._submit, width=10)
-        ok_button.pack(pady=5)
-
-        self.bind("<FocusIn>", self._on_window_focus)
-        self.bind("<Button-1>", lambda e: self._update_activity_time())
-        self.bind("<Key>", lambda e: self._update_activity_time())
+    def bind_open_report(self, handler: Callable[[], None]) -> None:
+        if self._config.report_key:
+            self.bind(f"<{self._config.report_key}>", lambda e: handler())
 
     def bind_issue_id_change(self, callback):
         self.__issue_id_change_callback = callback
         if self.__project_entry.get() or self.__id_entry.get():
             self._on_issue_id_changed()
 
+    def bind_issue_search(self, callback: Callable[[str], None]) -> None:
+        self.__issue_search_callback = callback
+
+    def bind_issue_pick(self, callback: Callable[[str], None]) -> None:
+        """Called with the full ID of a chosen suggestion instead of `set_issue_id`."""
+        self.__issue_pick_callback = callback
+
+    @property
+    def issue_search_limit(self) -> int:
+        return self._config.issue_search_limit
+
+    @property
+    def issue_search_server_fallback(self) -> bool:
+        return self._config.issue_search_server_fallback
+
+    def get_issue_search_text(self) -> str:
+        return (self.__id_var.get() or "").strip()
+
+    def show_issue_suggestions(self, issues: List[IssueSummary]) -> None:
+        if self.focus_get() != self.__id_entry:
+            self.__suggestions.hide()
+            return
+        self.__suggestions.show(
+            [
+                (
+                    issue.idReadable,
+                    f"{issue.idReadable}  {issue.summary or ''}".rstrip(),
+                )
+                for issue in issues
+                if issue.idReadable
+            ]
+        )
+
+    def _on_issue_search_key(self, event) -> None:
+        if event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+            return
+        if self.__issue_search_callback:
+            self.__issue_search_callback(self.get_issue_search_text())
+
+    def _on_suggestion_key(self, step: int) -> Optional[str]:
+        if not self.__suggestions.visible:
+            return None
+        if step:
+            self.__suggestions.move(step)
+        else:
+            self.__suggestions.pick()
+        return "break"
+
+    def _on_suggestion_escape(self, event=None) -> Optional[str]:
+        if not self.__suggestions.visible:
+            return None
+        self.__suggestions.hide()
+        return "break"
+
+    def _on_suggestion_picked(self, issue_id: str) -> None:
+        if self.__issue_pick_callback:
+            self.__issue_pick_callback(issue_id)
+        else:
+            self.set_issue_id(issue_id)
+        self._focus_time_field()
+
     def _submit(self, event=None):
         if not time_valid(self.__time_entry.get()):
             return
 
         super()._submit(event)
-        self._reset()
+        if self._close_after_submit():
+            self._reset()
+        else:
+            self._reset_for_next_entry()
+
+    def _close_after_submit(self) -> bool:
+        return not self.__rapid_entry_var.get()
+
+    def show_toast(self, text: str, kind: ToastKind = "info") -> None:
+        self.__toast.show(text, kind)
+
+    def get_form_snapshot(self) -> Dict[str, Any]:
+        """Everything needed to put a submitted entry back into the form."""
+        self._build_deferred_widgets()
+        return {
+            "issue_id": self._get_issue_id(),
+            "time": self._get_time(),
+            "description": self._get_description(),
+            "split": self._get_split_spec(),
+            "type": self.__type_combobox.get(),
+            "date_millis": self._get_date_millis(),
+        }
+
+    def restore_form(self, snapshot: Dict[str, Any]) -> bool:
+        """
+        Put a failed entry back into the form. Skipped (returns False) when
+        the user has already started typing the next entry.
+        """
+        if self._get_time() or self._get_description():
+            return False
+        self._build_deferred_widgets()
+        self.set_issue_id(snapshot["issue_id"])
+        self._set_entry_text(self.__time_entry, snapshot["time"])
+        self._set_entry_text(self.__description_entry, snapshot["description"])
+        self._set_entry_text(self.__split_entry, snapshot.get("split", ""))
+        self.__type_combobox.set(snapshot["type"])
+        if snapshot["date_millis"]:
+            self.__date_entry.set_date(
+                datetime.fromtimestamp(snapshot["date_millis"] / 1000)
+            )
+            self.__date_manually_edited = True
+        return True
+
+    @staticmethod
+    def _set_entry_text(entry: CustomEntry, text: str) -> None:
+        entry.delete(0, tk.END)
+        entry.insert(0, text or "")
+        entry.validate()
+
+    def _reset_for_next_entry(self) -> None:
+        """Rapid entry: keep issue, type and date; clear what changes per entry."""
+        self.__time_entry.reset()
+        self.__description_entry.reset()
+        self._update_activity_time()
+        self.__time_entry.focus_set()
 
     def _on_issue_id_changed(self, *_):
         project = (self.__project_entry.get() or "").strip().upper()
@@ -150,6 +318,15 @@ class AddSpentTimeWindow(CustomWindow):
         self._on_issue_id_changed()
         return True
 
+    def set_issue_id(self, issue_id: str) -> None:
+        """Switch the form to a full readable ID such as ``A-123``."""
+        project, _, number = (issue_id or "").strip().upper().partition("-")
+        if not project or not number.isdigit():
+            return
+        self.__project_var.set(project)
+        self.__id_var.set(number)
+        self._on_issue_id_changed()
+
     def handle_hotkey_activation(self, selected_text: str) -> None:
         if selected_text and self._prefill_issue_id(selected_text):
             self._focus_time_field()
@@ -173,10 +350,13 @@ class AddSpentTimeWindow(CustomWindow):
         self.__time_entry.focus_force()
 
     def _sanitize_id_var(self, *_args: object) -> None:
+        """Digits are an issue number; words and ``A-12`` are a search."""
         raw_issue_id_text: str = self.__id_var.get()
-        digits_only_text: str = "".join(ch for ch in raw_issue_id_text if ch.isdigit())
-        if digits_only_text != raw_issue_id_text:
-            self.__id_var.set(digits_only_text)
+        sanitized_text: str = "".join(
+            ch for ch in raw_issue_id_text if ch.isalnum() or ch in " -_"
+        )
+        if sanitized_text != raw_issue_id_text:
+            self.__id_var.set(sanitized_text)
 
     def _get_time(self) -> str:
         return self.__time_entry.get()
@@ -184,18 +364,28 @@ class AddSpentTimeWindow(CustomWindow):
     def _get_description(self) -> str:
         return self.__description_entry.get()
 
+    def _get_split_spec(self) -> str:
+        return self.__split_entry.get()
+
+    def _get_project(self) -> str:
+        return (self.__project_entry.get() or "").strip().upper()
+
     def _get_selected_issue_type(self) -> str:
+        self._build_deferred_widgets()
         return self.__type_combobox.get()
 
     def _get_selected_issue_type_id(self) -> Optional[str]:
         """Get the ID of the selected work item type."""
+        self._build_deferred_widgets()
         selected_name = self.__type_combobox.get()
         return self.__work_item_name_to_id.get(selected_name)
 
     def _get_date_millis(self) -> Optional[int]:
+        self._build_deferred_widgets()
         return self.__date_entry.get_date_millis()
 
     def _set_issue_types(self, work_item_types: List[WorkItem]):
+        self._build_deferred_widgets()
         updated_work_item_types = [
             work_item_type.name for work_item_type in work_item_types
         ]
@@ -215,12 +405,15 @@ class AddSpentTimeWindow(CustomWindow):
         super()._on_window_close(event)
 
     def _reset(self):
+        self._build_deferred_widgets()
         self.__project_var.set(f"{self._config.project}")
         self.__id_var.set("")
+        self.__suggestions.hide()
         self.__id_entry.focus_set()
         self.__date_entry.reset()
         self.__time_entry.reset()
         self.__description_entry.reset()
+        self.__split_entry.reset()
         self.__type_combobox.set("")
 
         self.__date_manually_edited = False
@@ -242,7 +435,7 @@ class AddSpentTimeWindow(CustomWindow):
 
     def _maybe_update_date_after_afk(self):
         """Auto-update date if AFK and not pinned/focused."""
-        if self.__date_manually_edited:
+        if self.__date_manually_edited or self.__date_entry is None:
             return
 
         if self.focus_get() == self.__date_entry:
@@ -1,15 +1,16 @@
 from datetime import date
 
 from ui.views.base.custom_window_config import CustomWindowConfig
-from ui.widgets.custom_date_entry import CustomDateEntry
+from ui.constants.date_formats import DATE_FORMAT_MAP
 
 
 class AddSpentTimeWindowConfig(CustomWindowConfig):
     width: int = 300
-    height: int = 325
+    height: int = 375
     title: str = "Add Spent Time"
     cancel_key: str = "Escape"
     submit_key: str = "Return"
+    report_key: str = "Control-r"
     project: str = ""
     issue_separator: str = "-"
     initial_issue_id: str = ""
@@ -18,8 +19,12 @@ class AddSpentTimeWindowConfig(CustomWindowConfig):
     initial_type: str = ""
     work_item_types: dict[str, str] = {}
     date_format: str = "yyyy-mm-dd"
+    rapid_entry: bool = False
+    issue_search_limit: int = 8
+    # ask the server (debounced) when typing text into the issue field
+    issue_search_server_fallback: bool = True
     
     @property
     def initial_date(self) -> str:
-        python_format = CustomDateEntry.DATE_FORMAT_MAP.get(self.date_format.lower(), "%Y-%m-%d")
+        python_format = DATE_FORMAT_MAP.get(self.date_format.lower(), "%Y-%m-%d")
         return date.today().strftime(python_format)
@@ -1,17 +1,15 @@
 import logging
 import platform
-import threading
 from typing import Optional, Callable
 
-from PIL import Image, ImageDraw
-from pystray import Icon, MenuItem, Menu
-
 from errors.user_cancelled_error import UserCancelledError
 from ui.constants.tk_events import TkEvents
+from ui.utils.tray_icon_service import TrayIconService
 from ui.views.base.custom_window_config import CustomWindowConfig
 from ui.windows.base.custom_window_attach_mixin import CustomWindowAttachMixin
 from errors.user_error import UserError
 from utils.pid_utils import cleanup_pids_folder
+from utils import startup_timeline
 
 logger = logging.getLogger(__name__)
 
@@ -25,13 +23,15 @@ class CustomWindow(CustomWindowAttachMixin):
         **kwargs,
     ):
         attached_views = kwargs.pop("attached_views", None)
-        super().__init__(attached_views=attached_views)
+        on_root_created = kwargs.pop("on_root_created", None)
+        super().__init__(
+            attached_views=attached_views, on_root_created=on_root_created
+        )
         self.withdraw()  # hide window initially to avoid flickering
         self._config = config
         self.__cancelled = True
         self.__submit_callback = None
-        self.tray_icon = None
-        self.tray_thread = None
+        self.tray_icon: Optional[TrayIconService] = None
 
         self.title(self._config.title)
 
@@ -74,10 +74,12 @@ class CustomWindow(CustomWindowAttachMixin):
             pass
 
     def show(self):
-        self.show_all_attached_views()
         self.update_idletasks()
         self.deiconify()
         self.lift()
+        # attached views are built once the main window is up
+        self.after_idle(self.show_all_attached_views)
+        self.after_idle(lambda: startup_timeline.mark("window_shown"))
         if not hasattr(self, "_mainloop_running"):
             self._mainloop_running = True
             self.mainloop()
@@ -150,7 +152,12 @@ class CustomWindow(CustomWindowAttachMixin):
         if self.__submit_callback:
             self.__submit_callback()
         self.__cancelled = False
-        self._on_window_close()
+        if self._close_after_submit():
+            self._on_window_close()
+
+    def _close_after_submit(self) -> bool:
+        """Override to keep the window open after a submit."""
+        return True
 
     def _emit_value(self, value):
         return value
@@ -170,11 +177,10 @@ class CustomWindow(CustomWindowAttachMixin):
         for view in self.get_attached_views():
             view._reset()
 
-    def _restore_window(self, icon, item=None):
+    def _restore_window(self):
         """Restore window from system tray."""
         if self.tray_icon:
-            self.tray_icon.stop()
-            self.tray_icon = None
+            self.tray_icon.hide()
         self.deiconify()
         self.lift()
 
@@ -190,7 +196,7 @@ class CustomWindow(CustomWindowAttachMixin):
         except Exception:
             pass
 
-    def _exit_app(self, icon, item):
+    def _exit_app(self):
         """Exit the application cleanly."""
         if self.tray_icon:
             self.tray_icon.stop()
@@ -200,25 +206,13 @@ class CustomWindow(CustomWindowAttachMixin):
         self.destroy()
 
     def _show_tray_icon(self):
-        """Start the system tray icon in a separate thread."""
+        """Show the system tray icon, creating it on first use."""
         if not self.tray_icon:
-            self.tray_icon = self._create_tray_icon()
-
-        if not self.tray_thread or not self.tray_thread.is_alive():
-            logger.debug("Starting tray icon thread")
-            self.tray_thread = threading.Thread(target=self.tray_icon.run, daemon=True)
-            self.tray_thread.start()
-
-    def _create_tray_icon(self):
-        """Create system tray icon with menu options."""
-        icon_size = (64, 64)
-        image = Image.new("RGB", icon_size, (0, 0, 0))
-        draw = ImageDraw.Draw(image)
-        draw.ellipse((10, 10, 54, 54), fill=(255, 0, 0))
-
-        menu = Menu(
-            MenuItem("Show", self._restore_window, default=True, visible=False),
-            MenuItem("Exit", self._exit_app),
-        )
-
-        return Icon(self._config.app_name, image, self._config.title, menu)
+            # menu callbacks arrive on the tray thread; hop over to Tk
+            self.tray_icon = TrayIconService(
+                self._config.app_name,
+                self._config.title,
+                on_show=lambda: self.after(0, self._restore_window),
+                on_exit=lambda: self.after(0, self._exit_app),
+            )
+        self.tray_icon.show()
@@ -1,22 +1,49 @@
+import os
 import platform
 import subprocess
 import tkinter as tk
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ui.views.base.custom_view import CustomView
 from ui.constants.tk_events import TkEvents
+from utils import display_probe_cache
+
+LAYOUT_FRAME_MS = 16
 
 
 class CustomWindowAttachMixin(tk.Tk):
+    """
+    Keeps attached views glued to the window edges.
+
+    Configure events only schedule a layout pass; at most one pass runs per
+    frame. View sizes and the title-bar height are cached, offsets are only
+    recomputed when a view's size changes, and views are moved only when
+    their target position changed.
+    """
 
     def __init__(
         self,
         attached_views: Optional[List[Callable[[], CustomView]]] = None,
+        on_root_created: Optional[Callable[[tk.Tk], None]] = None,
     ):
+        """
+        *on_root_created* runs as soon as Tcl/Tk is up, before any view or
+        widget is built (e.g. to draw the splash on this root).
+        """
         super().__init__()
+        if on_root_created:
+            self.withdraw()
+            on_root_created(self)
         self.__attached_views: List[CustomView] = (
             [factory() for factory in attached_views] if attached_views else []
         )
+        self.__attached_views_shown = False
+        self.__layout_job: Optional[str] = None
+        self.__layout_bound = False
+        self.__title_bar_height: Optional[int] = None
+        self.__view_sizes: Dict[int, Tuple[int, int]] = {}
+        self.__offsets: Optional[Dict[int, int]] = None
+        self.__view_positions: Dict[int, Tuple[int, int]] = {}
 
     def _nswindow_for(self, win: tk.Misc):
         """Get the NSWindow for a Tk window on macOS."""
@@ -68,24 +95,15 @@ class CustomWindowAttachMixin(tk.Tk):
             return None
 
     def _guess_desktop_title_bar_height(self) -> Optional[int]:
-        try:
-            desktop = subprocess.run(
-                ["echo", "$XDG_CURRENT_DESKTOP"],
-                capture_output=True,
-                text=True,
-                shell=True,
-            )
-            desktops = {
-                "cinnamon": 32,
-                "gnome": 38,
-                "kde": 30,
-            }
-            desktop_str = desktop.stdout.lower()
-            for name, height in desktops.items():
-                if name in desktop_str:
-                    return height
-        except Exception:
-            pass
+        desktops = {
+            "cinnamon": 32,
+            "gnome": 38,
+            "kde": 30,
+        }
+        desktop_str = os.environ.get("XDG_CURRENT_DESKTOP", "").lower()
+        for name, height in desktops.items():
+            if name in desktop_str:
+                return height
         return None
 
     def _macos_title_bar_height(self, window: tk.Tk) -> Optional[int]:
@@ -101,11 +119,13 @@ class CustomWindowAttachMixin(tk.Tk):
 
     def attach_views(self, custom_views: List[CustomView]) -> None:
         self.__attached_views = custom_views
+        self._invalidate_layout()
 
     def get_attached_views(self) -> List[CustomView]:
         return self.__attached_views
 
     def show_all_attached_views(self) -> None:
+        self.__attached_views_shown = True
         for attached_view in self.__attached_views:
             attached_view._show(self)  # pyright: ignore[reportPrivateUsage]
             attached_view.update_idletasks()
@@ -119,10 +139,7 @@ class CustomWindowAttachMixin(tk.Tk):
                     self._bind_update_position(attached_view)
             else:
                 self._bind_update_position(attached_view)
-                try:
-                    self.after(0, lambda v=attached_view: self._update_position(v))
-                except Exception:
-                    pass
+        self._schedule_layout()
 
     def hide_all_attached_views(self) -> None:
         for attached_view in self.__attached_views:
@@ -142,42 +159,75 @@ class CustomWindowAttachMixin(tk.Tk):
                     pass
             attached_view.destroy()
         self.__attached_views.clear()
+        self._invalidate_layout()
 
-    def _get_cumulative_offset(self, attached_view: CustomView) -> int:
-        position = attached_view._get_position()  # pyright: ignore[reportPrivateUsage]
-        same_position_views = [
-            view
-            for view in self.__attached_views
-            if view._get_position() == position  # pyright: ignore[reportPrivateUsage]
-        ]
-        view_index = same_position_views.index(attached_view)
-        is_horizontal = position in {"top", "bottom"}
+    def _view_size(self, attached_view: CustomView) -> Tuple[int, int]:
+        """Cached (width, height); refreshed by the view's Configure events."""
+        size = self.__view_sizes.get(id(attached_view))
+        if size:
+            return size
 
-        def get_dimension(view: CustomView) -> int:
-            view.update_idletasks()
-            return view.winfo_width() if is_horizontal else view.winfo_height()
+        win_w = attached_view.winfo_width()
+        win_h = attached_view.winfo_height()
+        if win_w <= 1:
+            win_w = attached_view.winfo_reqwidth()
+        if win_h <= 1:
+            win_h = attached_view.winfo_reqheight()
+        if win_w <= 1:
+            try:
+                win_w = int(getattr(attached_view, "_config").width)
+            except Exception:
+                pass
+        if win_h <= 1:
+            try:
+                win_h = int(getattr(attached_view, "_config").height)
+            except Exception:
+                pass
+        if attached_view.winfo_ismapped():
+            self.__view_sizes[id(attached_view)] = (win_w, win_h)
+        return win_w, win_h
 
-        return sum(get_dimension(view) for view in same_position_views[:view_index])
+    def _get_cumulative_offset(self, attached_view: CustomView) -> int:
+        if self.__offsets is None:
+            offsets: Dict[int, int] = {}
+            totals: Dict[str, int] = {}
+            for view in self.__attached_views:
+                position = view._get_position()  # pyright: ignore[reportPrivateUsage]
+                offsets[id(view)] = totals.get(position, 0)
+                win_w, win_h = self._view_size(view)
+                dimension = win_w if position in {"top", "bottom"} else win_h
+                totals[position] = offsets[id(view)] + dimension
+            self.__offsets = offsets
+        return self.__offsets.get(id(attached_view), 0)
 
     def _calculate_title_bar_height(self) -> int:
         if platform.system() == "Darwin":
             return 0
+        if self.__title_bar_height is not None:
+            return self.__title_bar_height
+
+        height = self._measure_title_bar_height()
+        if self.winfo_ismapped():
+            # decorations don't change during a session; probe only once
+            self.__title_bar_height = height
+        return height
 
+    def _measure_title_bar_height(self) -> int:
         try:
-            self.update_idletasks()
             window_y = self.winfo_rooty()
             client_y = self.winfo_y()
             delta = window_y - client_y
             if delta > 0:
                 return delta
 
-            extents = self._get_extents_title_bar_height(self.winfo_id())
-            if extents:
-                return extents
-
-            desktop_guess = self._guess_desktop_title_bar_height()
-            if desktop_guess:
-                return desktop_guess
+            window_id = self.winfo_id()
+            # only measured extents are persisted; a guess is retried next launch
+            probed = display_probe_cache.cached_probe(
+                "title_bar_height",
+                lambda: self._get_extents_title_bar_height(window_id),
+            ) or self._guess_desktop_title_bar_height()
+            if probed:
+                return probed
 
         except Exception:
             pass
@@ -212,22 +262,7 @@ class CustomWindowAttachMixin(tk.Tk):
         title_bar_height: int,
     ) -> Tuple[int, int]:
         parent_x, parent_y, parent_w, parent_h = parent_geom
-        try:
-            attached_view.update_idletasks()
-        except Exception:
-            pass
-        win_w = attached_view.winfo_width()
-        win_h = attached_view.winfo_height()
-        if win_w <= 1:
-            try:
-                win_w = int(getattr(attached_view, "_config").width)
-            except Exception:
-                pass
-        if win_h <= 1:
-            try:
-                win_h = int(getattr(attached_view, "_config").height)
-            except Exception:
-                pass
+        win_w, win_h = self._view_size(attached_view)
         pos = attached_view._get_position()  # pyright: ignore[reportPrivateUsage]
 
         if pos == "right":
@@ -251,31 +286,85 @@ class CustomWindowAttachMixin(tk.Tk):
 
         raise ValueError(f"Unknown position: {pos}")
 
-    def _update_position(self, attached_view: CustomView) -> None:
-        parent_geom = self._parent_geometry()
+    def _update_position(
+        self,
+        attached_view: CustomView,
+        parent_geom: Optional[Tuple[int, int, int, int]] = None,
+    ) -> None:
+        parent_geom = parent_geom or self._parent_geometry()
         title_bar_height = self._title_bar_correction()
         content_area_y = self._content_area_y(parent_geom[1])
         offset = self._position_offset(attached_view)
         x, y = self._calculate_coordinates(
             attached_view, parent_geom, content_area_y, offset, title_bar_height
         )
+        if self.__view_positions.get(id(attached_view)) == (x, y):
+            return
+        self.__view_positions[id(attached_view)] = (x, y)
         attached_view.geometry(f"+{x}+{y}")
 
     def _bind_update_position(self, attached_view: CustomView) -> None:
-        self.bind(
+        attached_view.bind(
             TkEvents.GEOMETRY_CHANGED,
-            lambda event, attached_view_arg=attached_view: self._update_position(
-                attached_view_arg
-            ),
+            lambda event, view=attached_view: self._on_view_configure(event, view),
             add="+",
         )
+        if not self.__layout_bound:
+            self.__layout_bound = True
+            self.bind(TkEvents.GEOMETRY_CHANGED, self._on_window_configure, add="+")
+
+    def _on_window_configure(self, event: tk.Event) -> None:
+        # bindings on the root also fire for every child widget
+        if event.widget is self:
+            self._schedule_layout()
+
+    def _on_view_configure(self, event: tk.Event, attached_view: CustomView) -> None:
+        if event.widget is not attached_view:
+            return
+        size = (event.width, event.height)
+        if size[0] <= 1 or self.__view_sizes.get(id(attached_view)) == size:
+            return  # moved, not resized
+        self.__view_sizes[id(attached_view)] = size
+        self.__offsets = None
+        self._schedule_layout()
+
+    def _invalidate_layout(self) -> None:
+        self.__view_sizes.clear()
+        self.__view_positions.clear()
+        self.__offsets = None
+        self._schedule_layout()
+
+    def _schedule_layout(self) -> None:
+        if self.__layout_job is None:
+            self.__layout_job = self.after(LAYOUT_FRAME_MS, self._run_layout)
+
+    def _run_layout(self) -> None:
+        self.__layout_job = None
+        if not self.__attached_views_shown:
+            return
+        parent_geom = self._parent_geometry()
+        for attached_view in self.__attached_views:
+            try:
+                self._update_position(attached_view, parent_geom)
+            except tk.TclError:
+                pass  # view destroyed mid-pass
 
     def _on_minimize(self, event: Optional[Any] = None) -> None:
+        # root bindings also see Map/Unmap of placed children (toasts, lists)
+        if event is not None and event.widget is not self:
+            return
+        if not self.__attached_views_shown:
+            return
         if platform.system() != "Darwin":
             for attached_view in self.__attached_views:
                 attached_view.withdraw()
 
     def _on_restore(self, event: Optional[Any] = None) -> None:
+        # root bindings also see Map/Unmap of placed children (toasts, lists)
+        if event is not None and event.widget is not self:
+            return
+        if not self.__attached_views_shown:
+            return
         if platform.system() != "Darwin":
             for attached_view in self.__attached_views:
                 attached_view.deiconify()
@@ -288,5 +377,6 @@ class CustomWindowAttachMixin(tk.Tk):
                     self._attach_child_window(attached_view, self)
                 except Exception:
                     pass
-        for attached_view in self.__attached_views:
-            self._update_position(attached_view)
+        # restored windows may have been moved by the window manager
+        self.__view_positions.clear()
+        self._schedule_layout()
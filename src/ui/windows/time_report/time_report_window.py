@@ -0,0 +1,168 @@
+import calendar
+import logging
+import tkinter as tk
+from datetime import date, timedelta
+from tkinter import filedialog, ttk
+from typing import Callable, Dict, List, Optional, Tuple
+
+from models.report_table import ReportTable
+from ui.windows.time_report.time_report_window_config import TimeReportWindowConfig
+from utils.report_export import export_tables
+
+logger = logging.getLogger(__name__)
+
+RangeCallback = Callable[[int, int], None]
+
+
+def _utc_millis(day: date) -> int:
+    # work item dates are UTC midnights
+    return calendar.timegm(day.timetuple()) * 1000
+
+
+def period_range(period: str, today: Optional[date] = None) -> Tuple[int, int]:
+    """``[start, end)`` in epoch millis for one of `TimeReportWindow.PERIODS`."""
+    today = today or date.today()
+    if period == "This week":
+        start = today - timedelta(days=today.weekday())
+    elif period == "Last 7 days":
+        start = today - timedelta(days=6)
+    elif period == "This month":
+        start = today.replace(day=1)
+    elif period == "Last 30 days":
+        start = today - timedelta(days=29)
+    elif period == "This year":
+        start = today.replace(month=1, day=1)
+    else:
+        start = today - timedelta(days=364)
+    return _utc_millis(start), _utc_millis(today + timedelta(days=1))
+
+
+class TimeReportWindow(tk.Toplevel):
+    """
+    Tabbed daily/weekly/issue/type/gap tables for a chosen period.
+
+    The window only displays; *on_range_changed* is called with the period's
+    ``[start, end)`` millis, and the owner answers with `show_tables`.
+    """
+
+    PERIODS = (
+        "This week",
+        "Last 7 days",
+        "This month",
+        "Last 30 days",
+        "This year",
+        "Last 365 days",
+    )
+
+    def __init__(
+        self,
+        master,
+        config: Optional[TimeReportWindowConfig] = None,
+        on_range_changed: Optional[RangeCallback] = None,
+    ):
+        super().__init__(master)
+        self.__config = config or TimeReportWindowConfig()
+        self.__on_range_changed = on_range_changed
+        self.__tables: List[ReportTable] = []
+        self.__trees: Dict[str, ttk.Treeview] = {}
+
+        self.title(self.__config.title)
+        self.geometry(f"{self.__config.width}x{self.__config.height}")
+        self.resizable(self.__config.resizable, self.__config.resizable)
+        self.attributes("-topmost", self.__config.topmost)
+
+        toolbar = tk.Frame(self)
+        toolbar.pack(fill="x", padx=8, pady=(8, 4))
+
+        self.__period_var = tk.StringVar(
+            value=self.__config.period
+            if self.__config.period in self.PERIODS
+            else self.PERIODS[2]
+        )
+        period_box = ttk.Combobox(
+            toolbar,
+            textvariable=self.__period_var,
+            values=self.PERIODS,
+            state="readonly",
+            width=14,
+        )
+        period_box.pack(side="left")
+        period_box.bind("<<ComboboxSelected>>", lambda e: self.refresh())
+
+        tk.Button(toolbar, text="Export...", command=self._on_export).pack(side="right")
+        tk.Button(toolbar, text="Refresh", command=self.refresh).pack(
+            side="right", padx=4
+        )
+
+        self.__summary_label = tk.Label(toolbar, text="Loading...", anchor="w")
+        self.__summary_label.pack(side="left", fill="x", expand=True, padx=8)
+
+        self.__notebook = ttk.Notebook(self)
+        self.__notebook.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+
+        self.bind("<Escape>", lambda e: self.destroy())
+
+    @property
+    def daily_target_minutes(self) -> int:
+        return self.__config.daily_target_minutes
+
+    @property
+    def workdays_only(self) -> bool:
+        return self.__config.workdays_only
+
+    def refresh(self) -> None:
+        self.__summary_label.config(text="Loading...")
+        if self.__on_range_changed:
+            self.__on_range_changed(*period_range(self.__period_var.get()))
+
+    def show_tables(self, tables: List[ReportTable], summary: str) -> None:
+        if not self.winfo_exists():
+            return
+        self.__tables = tables
+        self.__summary_label.config(text=summary)
+        for table in tables:
+            self._fill_tree(self._tree_for(table), table)
+
+    def _tree_for(self, table: ReportTable) -> ttk.Treeview:
+        tree = self.__trees.get(table.title)
+        if tree is not None:
+            return tree
+
+        frame = tk.Frame(self.__notebook)
+        tree = ttk.Treeview(frame, columns=table.columns, show="headings")
+        for column in table.columns:
+            tree.heading(column, text=column)
+            tree.column(column, width=90, anchor="w", stretch=True)
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        self.__notebook.add(frame, text=table.title)
+        self.__trees[table.title] = tree
+        return tree
+
+    @staticmethod
+    def _fill_tree(tree: ttk.Treeview, table: ReportTable) -> None:
+        tree.delete(*tree.get_children())
+        for row in table.rows:
+            tree.insert("", "end", values=row)
+
+    def _on_export(self) -> None:
+        if not self.__tables:
+            return
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            title="Export report",
+            defaultextension=".csv",
+            initialfile=f"time-report-{date.today().isoformat()}.csv",
+            filetypes=[("CSV", "*.csv"), ("JSON", "*.json")],
+        )
+        if not path:
+            return
+        try:
+            export_tables(self.__tables, path)
+        except OSError as e:
+            logger.error(f"Could not export report: {e}")
+            self.__summary_label.config(text=f"Export failed: {e}")
+            return
+        self.__summary_label.config(text=f"Exported to {path}")
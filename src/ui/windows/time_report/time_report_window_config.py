@@ -0,0 +1,12 @@
+from ui.views.base.custom_window_config import CustomWindowConfig
+
+
+class TimeReportWindowConfig(CustomWindowConfig):
+    width: int = 560
+    height: int = 420
+    resizable: bool = True
+    topmost: bool = False
+    title: str = "Time Report"
+    period: str = "This month"
+    daily_target_minutes: int = 450  # 7.5h, the length of a day in YouTrack
+    workdays_only: bool = True
@@ -0,0 +1,105 @@
+import logging
+import re
+import time
+from collections import Counter, deque
+from typing import Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHED_DELAY_MS = 0
+COMPLETE_ID_DELAY_MS = 40
+MIN_DELAY_MS = 150
+MAX_DELAY_MS = 900
+DEFAULT_DELAY_MS = 500
+
+_TYPING_PAUSE_S = 2.0
+_EMA_ALPHA = 0.3
+
+
+def _ema(current: Optional[float], sample: float) -> float:
+    return sample if current is None else current + _EMA_ALPHA * (sample - current)
+
+
+class AdaptiveDebouncer:
+    """
+    Picks the debounce delay for issue-ID lookups.
+
+    Fires almost immediately for IDs already resolved in this session or
+    that have the usual number of digits for their project; otherwise waits
+    about one and a half typing intervals, stretched by recent request latency.
+
+    Not thread-safe: call it from the Tk thread only.
+    """
+
+    def __init__(self, history_size: int = 200):
+        self.__last_keystroke: Optional[float] = None
+        self.__typing_interval_ms: Optional[float] = None
+        self.__latency_ms: Optional[float] = None
+        self.__resolved_ids: set[str] = set()
+        self.__id_lengths: Dict[str, Counter] = {}
+        self.__decisions: Deque[dict] = deque(maxlen=history_size)
+
+    @property
+    def decisions(self) -> list[dict]:
+        return list(self.__decisions)
+
+    def next_delay(self, issue_id: str) -> int:
+        """Register a keystroke for *issue_id* and return the delay in ms."""
+        self._record_keystroke()
+        issue_id = issue_id.upper()
+
+        if issue_id in self.__resolved_ids:
+            return self._decide(issue_id, CACHED_DELAY_MS, "cached")
+
+        if self._has_usual_length(issue_id):
+            return self._decide(issue_id, COMPLETE_ID_DELAY_MS, "complete")
+
+        if self.__typing_interval_ms is None:
+            return self._decide(issue_id, DEFAULT_DELAY_MS, "default")
+
+        delay = 1.5 * self.__typing_interval_ms + 0.25 * (self.__latency_ms or 0)
+        delay = int(min(MAX_DELAY_MS, max(MIN_DELAY_MS, delay)))
+        return self._decide(issue_id, delay, "adaptive")
+
+    def record_result(self, issue_id: str, latency_ms: float, found: bool) -> None:
+        """Feed back how long a lookup took and whether the ID exists."""
+        self.__latency_ms = _ema(self.__latency_ms, latency_ms)
+        if not found:
+            return
+        issue_id = issue_id.upper()
+        self.__resolved_ids.add(issue_id)
+        project, _, number = issue_id.partition("-")
+        self.__id_lengths.setdefault(project, Counter())[len(number)] += 1
+
+    def _record_keystroke(self) -> None:
+        now = time.monotonic()
+        if self.__last_keystroke is not None:
+            interval = now - self.__last_keystroke
+            if interval < _TYPING_PAUSE_S:
+                self.__typing_interval_ms = _ema(
+                    self.__typing_interval_ms, interval * 1000
+                )
+        self.__last_keystroke = now
+
+    def _has_usual_length(self, issue_id: str) -> bool:
+        match = re.match(r"^([A-Z]+)-(\d+)$", issue_id)
+        if not match:
+            return False
+        lengths = self.__id_lengths.get(match.group(1))
+        if not lengths:
+            return False
+        usual_length, _ = lengths.most_common(1)[0]
+        return len(match.group(2)) == usual_length
+
+    def _decide(self, issue_id: str, delay_ms: int, reason: str) -> int:
+        decision = {
+            "issue_id": issue_id,
+            "delay_ms": delay_ms,
+            "reason": reason,
+            "typing_interval_ms": self.__typing_interval_ms
+            and round(self.__typing_interval_ms),
+            "latency_ms": self.__latency_ms and round(self.__latency_ms),
+        }
+        self.__decisions.append(decision)
+        logger.debug(f"Debounce decision: {decision}")
+        return delay_ms
@@ -0,0 +1,120 @@
+"""
+Results of slow display probes (xrandr, xprop) persisted across launches.
+
+Entries are keyed by a fingerprint of the display configuration built from
+cheap sources only: session environment, DRM connector status files and the
+Tk screen size. Plugging in or removing a monitor changes the fingerprint,
+so stale results are simply never looked up again.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import platform
+import threading
+import tkinter as tk
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_NAME = "display_probes.json"
+MAX_CONFIGURATIONS = 4
+
+_FINGERPRINT_ENV_VARS = (
+    "DISPLAY",
+    "WAYLAND_DISPLAY",
+    "XDG_SESSION_TYPE",
+    "XDG_CURRENT_DESKTOP",
+)
+
+_cache_path: Optional[str] = None
+_entries: Optional[Dict[str, Dict[str, Any]]] = None
+_lock = threading.Lock()
+
+
+def configure(cache_dir: str) -> None:
+    """Persist probe results under *cache_dir*; without it they last one process."""
+    global _cache_path, _entries
+    with _lock:
+        _cache_path = os.path.join(cache_dir, CACHE_FILE_NAME)
+        _entries = None
+
+
+def display_fingerprint() -> str:
+    parts = [platform.system()]
+    parts += [f"{name}={os.environ.get(name, '')}" for name in _FINGERPRINT_ENV_VARS]
+
+    for status_file in sorted(glob.glob("/sys/class/drm/card*-*/status")):
+        try:
+            with open(status_file, "r") as f:
+                parts.append(f"{status_file}={f.read().strip()}")
+        except OSError:
+            continue
+
+    root = getattr(tk, "_default_root", None)
+    if root is not None:
+        try:
+            parts.append(f"screen={root.winfo_screenwidth()}x{root.winfo_screenheight()}")
+        except tk.TclError:
+            pass
+
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+
+
+def _load() -> Dict[str, Dict[str, Any]]:
+    global _entries
+    if _entries is None:
+        _entries = {}
+        if _cache_path and os.path.exists(_cache_path):
+            try:
+                with open(_cache_path, "r") as f:
+                    loaded = json.load(f)
+                if isinstance(loaded, dict):
+                    _entries = loaded
+            except (OSError, ValueError) as e:
+                logger.debug(f"Ignoring unreadable display probe cache: {e}")
+    return _entries
+
+
+def _save() -> None:
+    if not _cache_path:
+        return
+    try:
+        os.makedirs(os.path.dirname(_cache_path), exist_ok=True)
+        temp_path = f"{_cache_path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(_entries, f)
+        os.replace(temp_path, _cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write display probe cache: {e}")
+
+
+def cached_probe(name: str, probe: Callable[[], Any]) -> Any:
+    """
+    Return the stored result of *probe* for the current display configuration,
+    running it (and persisting a non-None result) only on a miss.
+    """
+    fingerprint = display_fingerprint()
+    with _lock:
+        entries = _load()
+        configuration = entries.get(fingerprint, {})
+        if name in configuration:
+            return configuration[name]
+
+    value = probe()
+    if value is None:
+        return None
+
+    with _lock:
+        entries = _load()
+        entries.pop(fingerprint, None)
+        configuration[name] = value
+        # most recently used configuration last; drop the oldest
+        entries[fingerprint] = configuration
+        while len(entries) > MAX_CONFIGURATIONS:
+            entries.pop(next(iter(entries)))
+        _save()
+    logger.debug(f"Cached display probe {name}={value!r} for {fingerprint}")
+    return value
@@ -0,0 +1,22 @@
+import csv
+import json
+from typing import Sequence
+
+from models.report_table import ReportTable
+
+
+def export_tables(tables: Sequence[ReportTable], path: str) -> None:
+    """``.json`` gets a list of tables; anything else one CSV section per table."""
+    if path.lower().endswith(".json"):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([table.model_dump() for table in tables], f, indent=2)
+        return
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        for index, table in enumerate(tables):
+            if index:
+                writer.writerow([])
+            writer.writerow([table.title])
+            writer.writerow(table.columns)
+            writer.writerows(table.rows)
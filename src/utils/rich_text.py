@@ -0,0 +1,213 @@
+import logging
+import re
+import threading
+from collections import OrderedDict
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+
+from models.general_responses import Issue
+
+logger = logging.getLogger(__name__)
+
+# (text, tk tag names) pairs, ready for a single Text.insert(index, *flattened)
+TextRun = Tuple[str, Tuple[str, ...]]
+
+CACHE_SIZE = 64
+
+_BLOCK_TAGS = {"p", "div", "pre", "blockquote", "ul", "ol", "table", "tr"}
+_HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+_INLINE_TAGS = {
+    "b": "bold",
+    "strong": "bold",
+    "i": "italic",
+    "em": "italic",
+    "code": "code",
+    "tt": "code",
+    "pre": "code",
+    "a": "link",
+    "blockquote": "quote",
+    "del": "strike",
+    "s": "strike",
+}
+_SKIPPED_TAGS = {"script", "style"}
+
+_MD_INLINE = re.compile(
+    r"(?P<code>`[^`]+`)"
+    r"|(?P<bold>\*\*[^*]+\*\*|__[^_]+__)"
+    r"|(?P<italic>\*[^*\s][^*]*\*|_[^_\s][^_]*_)"
+    r"|(?P<strike>~~[^~]+~~)"
+    r"|\[(?P<link>[^\]]+)\]\([^)]*\)"
+)
+_MD_HEADING = re.compile(r"^#{1,6}\s+(.*)$")
+_MD_LIST_ITEM = re.compile(r"^(\s*)(?:[-*+]|\d+[.)])\s+(.*)$")
+
+_cache: "OrderedDict[Tuple[str, int], List[TextRun]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _append(runs: List[TextRun], text: str, tags: Tuple[str, ...]) -> None:
+    if not text:
+        return
+    if runs and runs[-1][1] == tags:
+        runs[-1] = (runs[-1][0] + text, tags)
+    else:
+        runs.append((text, tags))
+
+
+class _HtmlRunParser(HTMLParser):
+    """Flattens YouTrack's wikified HTML into tagged text runs."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.runs: List[TextRun] = []
+        self.__tags: List[str] = []
+        self.__skip_depth = 0
+        self.__pre_depth = 0
+
+    def _newline(self, count: int = 1) -> None:
+        text = "".join(run[0] for run in self.runs[-2:])
+        missing = count - (len(text) - len(text.rstrip("\n")))
+        if self.runs and missing > 0:
+            _append(self.runs, "\n" * missing, ())
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIPPED_TAGS:
+            self.__skip_depth += 1
+        elif tag == "br":
+            _append(self.runs, "\n", ())
+        elif tag == "li":
+            self._newline()
+            _append(self.runs, "• ", ())
+        elif tag in _HEADING_TAGS:
+            self._newline(2)
+            self.__tags.append("heading")
+        elif tag in _BLOCK_TAGS:
+            self._newline(2 if tag == "p" else 1)
+
+        if tag == "pre":
+            self.__pre_depth += 1
+        if tag in _INLINE_TAGS:
+            self.__tags.append(_INLINE_TAGS[tag])
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED_TAGS:
+            self.__skip_depth = max(0, self.__skip_depth - 1)
+            return
+        if tag == "pre":
+            self.__pre_depth = max(0, self.__pre_depth - 1)
+        name = "heading" if tag in _HEADING_TAGS else _INLINE_TAGS.get(tag)
+        if name and name in self.__tags:
+            # drop the innermost occurrence; tolerates badly nested markup
+            del self.__tags[len(self.__tags) - 1 - self.__tags[::-1].index(name)]
+        if tag in _HEADING_TAGS or tag in _BLOCK_TAGS:
+            self._newline()
+
+    def handle_data(self, data):
+        if self.__skip_depth:
+            return
+        if not self.__pre_depth:
+            data = re.sub(r"\s+", " ", data)
+            if not self.runs or self.runs[-1][0].endswith("\n"):
+                data = data.lstrip()
+        _append(self.runs, data, tuple(dict.fromkeys(self.__tags)))
+
+
+def html_to_runs(html: str) -> List[TextRun]:
+    parser = _HtmlRunParser()
+    parser.feed(html)
+    parser.close()
+    return _strip_trailing_newlines(parser.runs)
+
+
+def _markdown_inline(runs: List[TextRun], line: str, tags: Tuple[str, ...]) -> None:
+    position = 0
+    for match in _MD_INLINE.finditer(line):
+        _append(runs, line[position : match.start()], tags)
+        kind = match.lastgroup
+        if kind == "link":
+            text = match.group("link")
+        elif kind in ("bold", "strike"):
+            text = match.group(kind)[2:-2]
+        else:
+            text = match.group(kind)[1:-1]
+        _append(runs, text, tags + (kind,))
+        position = match.end()
+    _append(runs, line[position:], tags)
+
+
+def markdown_to_runs(text: str) -> List[TextRun]:
+    """Small CommonMark subset: headings, lists, quotes, fences and inline marks."""
+    runs: List[TextRun] = []
+    in_fence = False
+    for line in text.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            _append(runs, line + "\n", ("code",))
+            continue
+
+        heading = _MD_HEADING.match(line)
+        list_item = _MD_LIST_ITEM.match(line)
+        if heading:
+            _markdown_inline(runs, heading.group(1), ("heading",))
+        elif list_item:
+            _append(runs, list_item.group(1) + "• ", ())
+            _markdown_inline(runs, list_item.group(2), ())
+        elif line.startswith(">"):
+            _markdown_inline(runs, line.lstrip("> "), ("quote",))
+        else:
+            _markdown_inline(runs, line, ())
+        _append(runs, "\n", ())
+    return _strip_trailing_newlines(runs)
+
+
+def _strip_trailing_newlines(runs: List[TextRun]) -> List[TextRun]:
+    while runs and not runs[-1][0].strip("\n"):
+        runs.pop()
+    if runs:
+        runs[-1] = (runs[-1][0].rstrip("\n"), runs[-1][1])
+    return runs
+
+
+def _convert(issue: Issue) -> List[TextRun]:
+    if issue.wikifiedDescription:
+        try:
+            return html_to_runs(issue.wikifiedDescription)
+        except Exception as e:
+            logger.warning(f"Failed to parse wikified description: {e}")
+    if not issue.description:
+        return []
+    if issue.usesMarkdown:
+        return markdown_to_runs(issue.description)
+    return [(issue.description, ())]
+
+
+def render_issue_description(issue: Optional[Issue]) -> List[TextRun]:
+    """
+    Description of *issue* as tagged runs, memoized by (idReadable, updated).
+
+    Safe to call from worker threads, so the conversion can run before the
+    issue reaches the Tk thread.
+    """
+    if issue is None:
+        return []
+    if not issue.description and not issue.wikifiedDescription:
+        # partial records carry no description; never memoize them as empty
+        return []
+    if not issue.idReadable or issue.updated is None:
+        return _convert(issue)
+
+    key = (issue.idReadable, issue.updated)
+    with _cache_lock:
+        runs = _cache.get(key)
+        if runs is not None:
+            _cache.move_to_end(key)
+            return runs
+
+    runs = _convert(issue)
+    with _cache_lock:
+        _cache[key] = runs
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return runs
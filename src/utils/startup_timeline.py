@@ -0,0 +1,69 @@
+"""
+Per-launch startup timeline.
+Milestones are monotonic offsets (ms) from interpreter ready, appended as one
+JSON line per launch to ``logs/startup.jsonl``. Import this module before any
+heavy dependency so its import time stands in for interpreter ready.
+"""
+
+import json
+import logging
+import os
+import platform
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+TIMELINE_FILE_NAME = "startup.jsonl"
+FINAL_MARK = "first_fetch_completed"
+
+_origin = time.monotonic()
+_started_at = time.time()
+_lock = threading.Lock()
+_marks: Dict[str, float] = {"interpreter_ready": 0.0}
+_log_dir: Optional[str] = None
+_written = False
+
+
+def mark(name: str) -> None:
+    """Record *name* once; the final milestone also writes the timeline."""
+    with _lock:
+        if _written or name in _marks:
+            return
+        _marks[name] = round((time.monotonic() - _origin) * 1000, 1)
+    if name == FINAL_MARK:
+        flush()
+
+
+def marks() -> Dict[str, float]:
+    """Milestones recorded so far, in order."""
+    with _lock:
+        return dict(_marks)
+
+
+def configure(log_dir: str) -> None:
+    """Set the directory the timeline is appended to."""
+    global _log_dir
+    _log_dir = log_dir
+
+
+def flush() -> None:
+    """Append the recorded milestones once per launch. Never raises."""
+    global _written
+    with _lock:
+        if _written or not _log_dir or not _marks:
+            return
+        _written = True
+        entry = {
+            "started_at": round(_started_at, 3),
+            "platform": platform.system(),
+            "marks_ms": dict(_marks),
+        }
+    try:
+        with open(
+            os.path.join(_log_dir, TIMELINE_FILE_NAME), "a", encoding="utf-8"
+        ) as f:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+    except OSError as e:
+        logger.warning(f"Could not write startup timeline: {e}")
@@ -0,0 +1,24 @@
+"""Per-subdomain locations, without pydantic so headless commands start fast."""
+
+import sys
+from pathlib import Path
+
+
+def youtrack_base_url(subdomain: str) -> str:
+    return f"https://{subdomain}.youtrack.cloud/api"
+
+
+def user_base_dir(subdomain: str) -> str:
+    if getattr(sys, "frozen", False):
+        exe_path = Path(sys.executable).resolve()
+        if sys.platform == "darwin":
+            try:
+                project_root = exe_path.parents[3]
+            except IndexError:
+                project_root = exe_path.parent
+        else:
+            project_root = exe_path.parent
+    else:
+        project_root = Path(__file__).parent.parent.parent.absolute()
+
+    return str(project_root / "user" / subdomain)
@@ -0,0 +1,33 @@
+"""
+Counts of timer-driven Tk wakeups per source, so the cost of leaving the app
+running in the tray can be measured. A summary is logged at exit.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+_origin = time.monotonic()
+_lock = threading.Lock()
+_counts: Counter = Counter()
+
+
+def record(source: str) -> None:
+    with _lock:
+        _counts[source] += 1
+
+
+def counts() -> Dict[str, int]:
+    with _lock:
+        return dict(_counts)
+
+
+def log_summary() -> None:
+    elapsed_h = max((time.monotonic() - _origin) / 3600, 1e-9)
+    snapshot = counts()
+    rates = {source: round(count / elapsed_h) for source, count in snapshot.items()}
+    logger.info(f"Wakeups: {snapshot} ({rates} per hour)")
@@ -1,6 +1,6 @@
 """
 Window‑utility helpers for cross‑platform Tk layouts.
-Pure functions—no hidden windows, no side effects.
+Pure functions—no hidden windows; slow probes go through display_probe_cache.
 """
 
 from __future__ import annotations
@@ -10,6 +10,8 @@ import tkinter as tk
 from typing import Optional, Tuple
 import platform
 
+from utils import display_probe_cache
+
 _XRANDR_TIMEOUT_S = 2
 _FALLBACK_GEOM: Tuple[int, int, int, int] = (0, 0, 1920, 1080)
 
@@ -39,8 +41,16 @@ def get_primary_monitor_geometry(
 ) -> Tuple[int, int, int, int]:
     """
     Geometry of the primary monitor as ``(x, y, width, height)``.
-    Uses ``xrandr``. Falls back to *fallback* if unavailable.
+    Uses ``xrandr`` once per display configuration. Falls back to *fallback*
+    if unavailable.
     """
+    geometry = display_probe_cache.cached_probe(
+        "primary_monitor", _probe_primary_monitor_geometry
+    )
+    return tuple(geometry) if geometry else fallback
+
+
+def _probe_primary_monitor_geometry() -> Optional[Tuple[int, int, int, int]]:
     try:
         res = subprocess.run(
             ["xrandr", "--query"],
@@ -50,7 +60,7 @@ def get_primary_monitor_geometry(
             check=False,
         )
     except Exception:
-        return fallback
+        return None
 
     for line in res.stdout.splitlines():
         if " primary " not in line or " connected " not in line:
@@ -59,7 +69,7 @@ def get_primary_monitor_geometry(
         if parsed:
             return parsed
 
-    return fallback
+    return None
 
 
 def center_window_on_primary_monitor(window: tk.Tk, width: int, height: int) -> None:
@@ -1,3 +1,4 @@
+import math
 import re
 
 
@@ -21,3 +22,60 @@ def id_valid(issue_id: str) -> bool:
 
 def time_valid(time_str: str) -> bool:
     return bool(re.match(r"^(\d+[wdhm])+$", time_str))
+
+
+def parse_split_spec(
+    spec: str, project: str = "", main_issue_id: str = ""
+) -> list[tuple[str, float]]:
+    """
+    Parse ``"A-1, A-2:2, 17"`` into ``[("A-1", 1.0), ("A-2", 2.0), ("<project>-17", 1.0)]``.
+    Bare numbers use *project*; ``:n`` sets a relative weight. An issue listed
+    twice, or naming *main_issue_id*, is an error. Raises ValueError.
+    """
+    parts = []
+    seen = set()
+    for token in re.split(r"[,;\s]+", (spec or "").strip()):
+        if not token:
+            continue
+        issue_id, _, weight = token.partition(":")
+        issue_id = issue_id.upper()
+        if issue_id.isdigit() and project:
+            issue_id = f"{project.upper()}-{issue_id}"
+        if not id_valid(issue_id):
+            raise ValueError(f"Invalid issue ID: {token}")
+        try:
+            weight_value = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f"Invalid weight: {token}")
+        if not math.isfinite(weight_value) or weight_value <= 0:
+            raise ValueError(f"Invalid weight: {token}")
+        if issue_id == main_issue_id.upper():
+            raise ValueError(f"{issue_id} is the issue being logged; list only the others")
+        if issue_id in seen:
+            raise ValueError(f"{issue_id} is listed twice; use a weight instead")
+        seen.add(issue_id)
+        parts.append((issue_id, weight_value))
+    return parts
+
+
+def split_minutes(total_minutes: int, weights: list[float]) -> list[int]:
+    """Split whole minutes by *weights* (largest remainder), keeping the total exact."""
+    if not weights:
+        return []
+    weight_sum = sum(weights)
+    exact = [total_minutes * weight / weight_sum for weight in weights]
+    minutes = [int(share) for share in exact]
+    by_remainder = sorted(
+        range(len(weights)), key=lambda i: exact[i] - minutes[i], reverse=True
+    )
+    for i in by_remainder[: total_minutes - sum(minutes)]:
+        minutes[i] += 1
+    return minutes
+
+
+def format_minutes(minutes: int) -> str:
+    """``90`` -> ``"1h30m"``; whole hours drop the minutes."""
+    hours, rest = divmod(int(minutes), 60)
+    if not hours:
+        return f"{rest}m"
+    return f"{hours}h{rest:02d}m" if rest else f"{hours}h"